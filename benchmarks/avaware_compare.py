@@ -0,0 +1,102 @@
+"""Benchmark AvawareUpdater._compare_hardware_schedules on the sample schedules.
+
+The older comparator sample stands in for the current Fieldwire project and the
+newer one for the uploaded XML. Openings are copied under suffixed numbers to
+reach realistic project sizes.
+
+Usage (from the repository root):
+    python -m benchmarks.avaware_compare --scale 1 10 50 180
+"""
+
+import argparse
+import os
+import time
+
+from processors.xml_processor import parse_xml_file, parse_hardware_items
+from services.avaware_updater import AvawareUpdater
+
+COMPARATOR_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'comparator')
+OLD_XML = os.path.join(COMPARATOR_DIR, 'Z 007) Sept 20.24 Southlake Regional Health Ctr Exp (23373).xml')
+NEW_XML = os.path.join(COMPARATOR_DIR, 'Z 012) Nov 28.24 Southlake Regional Health Ctr Exp (23373).xml')
+
+ATTRIBUTE_NAMES = ["Quantity", "Label", "NominalWidth", "NominalHeight", "Hand", "Material", "HardwareGroup"]
+
+def scale_openings(openings, scale):
+    """Copy openings under suffixed numbers so the schedule has scale times as many."""
+    scaled = []
+    for copy in range(scale):
+        for opening in openings:
+            number = opening['Number'] if copy == 0 else f"{opening['Number']}-{copy}"
+            scaled.append({'Number': number, 'Attributes': opening['Attributes']})
+    return scaled
+
+def build_fieldwire_state(updater, old_openings, old_hardware_by_group):
+    """Build the task, attribute and checklist maps Fieldwire would return for a schedule."""
+    task_type_attribute_map = {f"attr-{name}": name for name in ATTRIBUTE_NAMES}
+    tasks = []
+    attributes_by_task = {}
+    checklist_items_by_task = {}
+
+    for opening in old_openings:
+        number = opening['Number']
+        for prefix in ("UCI", "UCA", "FC", "DEF"):
+            task_id = f"{prefix}-{number}"
+            tasks.append({'id': task_id, 'name': f"{prefix} {number}"})
+            attributes_by_task[task_id] = {
+                name: {'value': opening['Attributes'][name], 'id': f"{task_id}-{name}", 'type_id': f"attr-{name}"}
+                for name in ATTRIBUTE_NAMES if opening['Attributes'].get(name)
+            }
+
+        group = opening['Attributes'].get('HardwareGroup')
+        checklist_items_by_task[f"UCI-{number}"] = [
+            {'id': f"UCI-{number}-item-{i}", 'name': name, 'task_id': f"UCI-{number}"}
+            for i, name in enumerate(old_hardware_by_group.get(group, []))
+        ]
+
+    uci_tasks, uca_tasks, fc_tasks, def_tasks = updater._create_task_maps(tasks)
+    return {
+        'uci_tasks': uci_tasks,
+        'uca_tasks': uca_tasks,
+        'fc_tasks': fc_tasks,
+        'def_tasks': def_tasks,
+        'attributes_by_task': attributes_by_task,
+        'checklist_items_by_task': checklist_items_by_task,
+        'task_type_attribute_map': task_type_attribute_map
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 50, 180],
+                        help="Number of copies of the sample openings to compare")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per scale; the best is reported")
+    args = parser.parse_args()
+
+    # Comparison never calls the API, so skip authentication
+    updater = AvawareUpdater.__new__(AvawareUpdater)
+
+    old_openings = parse_xml_file(OLD_XML)
+    old_hardware_by_group = updater._create_hardware_by_group(parse_hardware_items(OLD_XML))
+    new_openings = parse_xml_file(NEW_XML)
+    new_hardware_by_group = updater._create_hardware_by_group(parse_hardware_items(NEW_XML))
+
+    print(f"\n{'Openings':>10} {'Best (s)':>10} {'Changes':>10}")
+    for scale in args.scale:
+        state = build_fieldwire_state(updater, scale_openings(old_openings, scale), old_hardware_by_group)
+        scaled_new = scale_openings(new_openings, scale)
+
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            changes = updater._compare_hardware_schedules(
+                new_openings=scaled_new,
+                new_hardware_by_group=new_hardware_by_group,
+                **state
+            )
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        change_count = sum(len(v) for v in changes.values())
+        print(f"{len(scaled_new):>10} {best:>10.3f} {change_count:>10}")
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@ from services.tags import TagService
 from services.report_service import ReportService
 from services.avaware_updater import AvawareUpdater
 from utils.input_helpers import get_user_input, get_project_id_input
+from utils.project_snapshot import OfflineProjectData, load_project_snapshot
 import json
 import os
 
@@ -295,6 +296,99 @@ def run_bc_menu(api, project_service, hardware_service, task_service, attribute_
         else:
             print("\nInvalid choice. Please try again.")
 
+def run_offline_reports(snapshot_dir, report=None, output=None):
+    """Generate reports from a saved project snapshot without any API calls.
+    
+    A raw data export (Filter Report > Export All Raw Data to Parquet) is also
+    accepted; it holds the filter report's tables only.
+    
+    Args:
+        snapshot_dir (str): Directory written by 'Save Project Snapshot'
+        report (str, optional): 'fc', 'uca' or 'filter' to run one report and exit.
+            If None, a menu is shown.
+        output (str, optional): Output file for the fc and uca reports
+        
+    Returns:
+        bool: False if the snapshot could not be loaded or the requested report failed
+    """
+    try:
+        snapshot, metadata = load_project_snapshot(snapshot_dir)
+    except (OSError, ValueError) as e:
+        print(f"Error loading project snapshot: {str(e)}")
+        return False
+        
+    # One offline data source stands in for every read-only service
+    data = OfflineProjectData(snapshot, metadata.get('project_name'))
+    project_id = data.project_id
+    has_records = bool(snapshot.collections())
+    report_service = ReportService(
+        project_service=data,
+        task_service=data,
+        attribute_service=data,
+        status_service=data,
+        team_service=data,
+        tag_service=None
+    )
+    print(f"Loaded snapshot of {metadata.get('project_name') or 'project'} (ID: {project_id})")
+    
+    def run_report(choice, output_filename=None):
+        if choice in ("fc", "uca") and not has_records:
+            print(f"{snapshot_dir} is a raw data export, which only supports the filter report.")
+            return False
+        if choice == "fc":
+            try:
+                if not output_filename:
+                    output_filename = get_user_input("Enter output filename (e.g., fc_report.xlsx): ")
+                if not output_filename.endswith('.xlsx'):
+                    output_filename += '.xlsx'
+                report_service.generate_fc_task_report(project_id, output_filename)
+                return True
+            except Exception as e:
+                print(f"\nError generating FC Task Report: {str(e)}")
+                return False
+        elif choice == "uca":
+            return HardwareService.generate_UCA_sheet(project_id, data, data, output_path=output_filename) is not None
+        elif choice == "filter":
+            try:
+                if not report_service.dataframes:
+                    report_service.load_raw_tables(snapshot_dir)
+                report_service.start_filtering()
+                return True
+            except Exception as e:
+                print(f"\nError running filter report: {str(e)}")
+                return False
+                
+    if report:
+        return run_report(report, output)
+        
+    while True:
+        print("\n" + "="*50)
+        print("          OFFLINE REPORTS")
+        print("="*50)
+        print(f"Snapshot: {snapshot_dir}")
+        
+        print("\n[Reporting]")
+        print("  1. Generate FC Task Report")
+        print("  2. Generate UCA Sheet")
+        print("  3. Filter Report")
+        print("  4. Exit")
+        
+        print("\n" + "-"*50)
+        choice = input("Enter your choice (1-4): ").strip()
+        print("-"*50)
+        
+        if choice == "1":
+            run_report("fc")
+        elif choice == "2":
+            run_report("uca")
+        elif choice == "3":
+            run_report("filter")
+        elif choice == "4":
+            print("\nExiting...")
+            return True
+        else:
+            print("\nInvalid choice. Please try again.")
+
 def run_cli(api, project_service):
     """Run the CLI interface.
     
@@ -363,6 +457,7 @@ def run_cli(api, project_service):
         print("\n[Reporting]")
         print("  12. Generate FC Task Report")
         print("  13. Generate UCA Sheet")
+        print("  17. Save Project Snapshot for Offline Reports")
         
         print("\n[System]")
         print("  14. Exit")
@@ -372,7 +467,7 @@ def run_cli(api, project_service):
         print("  16. TEST Delete task check item")
         
         print("\n" + "-"*50)
-        choice = input("Enter your choice (1-16 or command): ").strip()
+        choice = input("Enter your choice (1-17 or command): ").strip()
         print("-"*50)
         
         # Handle special commands (case insensitive)
@@ -500,6 +595,22 @@ def run_cli(api, project_service):
                 print("Check item deleted successfully!")
             else:
                 print("Failed to delete check item.")
+        elif choice == "17":
+            # Save the report data for main.py --from-snapshot
+            try:
+                report_service = ReportService(
+                    project_service=project_service,
+                    task_service=task_service,
+                    attribute_service=attribute_service,
+                    status_service=status_service,
+                    team_service=attribute_service,
+                    tag_service=tag_service
+                )
+                directory = get_user_input("Enter snapshot directory (e.g., snapshots/project): ")
+                report_service.save_project_snapshot(project_name, directory)
+                print(f"Run 'python main.py --from-snapshot {directory}' to generate reports offline.")
+            except Exception as e:
+                print(f"\nError saving project snapshot: {str(e)}")
         elif choice == "0200":
             # Secret BC menu
             run_bc_menu(api, project_service, hardware_service, task_service, attribute_service, user_id, project_id)
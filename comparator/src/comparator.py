@@ -1,8 +1,9 @@
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List
 from src.models import (
     Opening, DoorInfo, HardwareItem,
     DoorInfoChange, HardwareChange, OpeningChange, ComparisonSummary
 )
+from src.diff_engine import ScheduleDiff, diff_schedules, diff_schedule_files, diff_schedule_series
 
 class Comparator:
     """Compares two versions of door hardware schedules."""
@@ -10,54 +11,108 @@ class Comparator:
     @staticmethod
     def compare(
         old_openings: Dict[str, Opening],
-        new_openings: Dict[str, Opening]
+        new_openings: Dict[str, Opening],
+        workers: int = 1
     ) -> ComparisonSummary:
         """
         Compare two sets of openings and generate a comparison summary.
+        Openings are diffed in parallel chunks when workers > 1.
         """
+        diff = diff_schedules(
+            Comparator._to_schedule(old_openings),
+            Comparator._to_schedule(new_openings),
+            workers=workers
+        )
+        return Comparator.summary_from_diff(diff)
+    
+    @staticmethod
+    def diff_files(old_file: str, new_file: str, workers: int = 1) -> ScheduleDiff:
+        """
+        Diff two XML files without building any pydantic models, reusing a
+        cached diff if the same pair of files was compared before. Files are
+        parsed with the engine's ElementTree loader, not xmltodict.
+        """
+        return diff_schedule_files(
+            old_file,
+            new_file,
+            workers=workers
+        )
+    
+    @staticmethod
+    def diff_series(files: List[str], workers: int = 1) -> List[ScheduleDiff]:
+        """
+        Diff each revision against the one before it. Each revision is parsed at
+        most once, and revisions seen before are loaded from the parse cache.
+        """
+        return diff_schedule_series(
+            files,
+            workers=workers
+        )
+    
+    @staticmethod
+    def _to_schedule(openings: Dict[str, Opening]) -> Dict[str, dict]:
+        """Convert parsed openings to the diff engine's schedule dicts.
+        
+        Fields are read directly rather than through model_dump(), and openings
+        with the same hardware items share one converted list so the engine
+        diffs each hardware group once.
+        """
+        schedule = {}
+        converted_items = {}
+        for number, opening in openings.items():
+            info = opening.door_info
+            items_key = tuple(id(item) for item in opening.hardware_items)
+            if items_key not in converted_items:
+                converted_items[items_key] = [
+                    {
+                        'short_code': item.short_code,
+                        'product_code': item.product_code,
+                        'sub_category': item.sub_category,
+                        'quantity_active': item.quantity_active,
+                        'handing': item.handing,
+                        'finish_ansi': item.finish_ansi
+                    }
+                    for item in opening.hardware_items
+                ]
+            schedule[number] = {
+                'door_info': {field: getattr(info, field) for field in DoorInfo.model_fields},
+                'hardware_items': converted_items[items_key]
+            }
+        return schedule
+    
+    @staticmethod
+    def summary_from_diff(diff: ScheduleDiff) -> ComparisonSummary:
+        """Build the comparison summary models from a diff engine result."""
         changes: List[OpeningChange] = []
         door_info_changes_count = 0
         hardware_changes_count = 0
         
-        # Get all opening numbers from both versions
-        all_numbers = set(old_openings.keys()) | set(new_openings.keys())
-        
-        for number in sorted(all_numbers):
-            old_opening = old_openings.get(number)
-            new_opening = new_openings.get(number)
+        # Openings in the same hardware group share their hardware diffs
+        hardware_models = {}
+        def to_model(change):
+            if id(change) not in hardware_models:
+                hardware_models[id(change)] = HardwareChange(
+                    type=change.type,
+                    item=HardwareItem(**change.item),
+                    modifications=change.modifications or None
+                )
+            return hardware_models[id(change)]
+        
+        for opening in diff.openings:
+            changes.append(OpeningChange(
+                number=opening.number,
+                door_info_changes=[
+                    DoorInfoChange(field=field, old_value=values['old'], new_value=values['new'])
+                    for field, values in opening.door_info_changes.items()
+                ],
+                hardware_changes=[to_model(change) for change in opening.hardware_changes]
+            ))
             
-            # Handle added/deleted/modified openings
-            if not old_opening:
-                # Opening was added
-                changes.append(Comparator._create_added_opening_change(new_opening))
+            # Added and deleted openings count towards both totals
+            if opening.status != 'modified' or opening.door_info_changes:
                 door_info_changes_count += 1
+            if opening.status != 'modified' or opening.hardware_changes:
                 hardware_changes_count += 1
-            elif not new_opening:
-                # Opening was deleted
-                changes.append(Comparator._create_deleted_opening_change(old_opening))
-                door_info_changes_count += 1
-                hardware_changes_count += 1
-            else:
-                # Opening exists in both versions - check for changes
-                door_info_changes = Comparator._compare_door_info(
-                    old_opening.door_info,
-                    new_opening.door_info
-                )
-                hardware_changes = Comparator._compare_hardware(
-                    old_opening.hardware_items,
-                    new_opening.hardware_items
-                )
-                
-                if door_info_changes or hardware_changes:
-                    changes.append(OpeningChange(
-                        number=number,
-                        door_info_changes=door_info_changes,
-                        hardware_changes=hardware_changes
-                    ))
-                    if door_info_changes:
-                        door_info_changes_count += 1
-                    if hardware_changes:
-                        hardware_changes_count += 1
         
         return ComparisonSummary(
             total_changed_openings=len(changes),
@@ -65,134 +120,3 @@ class Comparator:
             openings_with_hardware_changes=hardware_changes_count,
             changes=changes
         )
-    
-    @staticmethod
-    def _compare_door_info(old_info: DoorInfo, new_info: DoorInfo) -> List[DoorInfoChange]:
-        """Compare door information and return list of changes."""
-        changes = []
-        
-        # Compare each field
-        old_dict = old_info.dict()
-        new_dict = new_info.dict()
-        
-        for field in old_dict:
-            if old_dict[field] != new_dict[field]:
-                changes.append(DoorInfoChange(
-                    field=field,
-                    old_value=str(old_dict[field]),
-                    new_value=str(new_dict[field])
-                ))
-        
-        return changes
-    
-    @staticmethod
-    def _compare_hardware(
-        old_items: List[HardwareItem],
-        new_items: List[HardwareItem]
-    ) -> List[HardwareChange]:
-        """Compare hardware items and return list of changes."""
-        changes = []
-        
-        # Create composite key sets for comparison
-        old_keys = {Comparator._get_hardware_key(item) for item in old_items}
-        new_keys = {Comparator._get_hardware_key(item) for item in new_items}
-        
-        # Find added and deleted items
-        added_keys = new_keys - old_keys
-        deleted_keys = old_keys - new_keys
-        common_keys = old_keys & new_keys
-        
-        # Process added items
-        for key in added_keys:
-            item = next(item for item in new_items
-                       if Comparator._get_hardware_key(item) == key)
-            changes.append(HardwareChange(type='added', item=item))
-        
-        # Process deleted items
-        for key in deleted_keys:
-            item = next(item for item in old_items
-                       if Comparator._get_hardware_key(item) == key)
-            changes.append(HardwareChange(type='deleted', item=item))
-        
-        # Process modified items
-        for key in common_keys:
-            old_item = next(item for item in old_items
-                          if Comparator._get_hardware_key(item) == key)
-            new_item = next(item for item in new_items
-                          if Comparator._get_hardware_key(item) == key)
-            
-            modifications = Comparator._compare_hardware_item(old_item, new_item)
-            if modifications:
-                changes.append(HardwareChange(
-                    type='modified',
-                    item=new_item,
-                    modifications=modifications
-                ))
-        
-        return changes
-    
-    @staticmethod
-    def _get_hardware_key(item: HardwareItem) -> Tuple[str, str, str]:
-        """Get composite key for hardware item."""
-        return (item.short_code, item.product_code, item.sub_category)
-    
-    @staticmethod
-    def _compare_hardware_item(
-        old_item: HardwareItem,
-        new_item: HardwareItem
-    ) -> Dict[str, dict[str, str]]:
-        """Compare individual hardware items and return modifications."""
-        modifications = {}
-        
-        # Compare modifiable fields
-        if old_item.quantity_active != new_item.quantity_active:
-            modifications['quantity_active'] = {
-                'old': str(old_item.quantity_active),
-                'new': str(new_item.quantity_active)
-            }
-        
-        if old_item.handing != new_item.handing:
-            modifications['handing'] = {
-                'old': str(old_item.handing),
-                'new': str(new_item.handing)
-            }
-        
-        if old_item.finish_ansi != new_item.finish_ansi:
-            modifications['finish_ansi'] = {
-                'old': str(old_item.finish_ansi),
-                'new': str(new_item.finish_ansi)
-            }
-        
-        return modifications
-    
-    @staticmethod
-    def _create_added_opening_change(opening: Opening) -> OpeningChange:
-        """Create change record for added opening."""
-        return OpeningChange(
-            number=opening.number,
-            door_info_changes=[DoorInfoChange(
-                field='status',
-                old_value='non-existent',
-                new_value='added'
-            )],
-            hardware_changes=[
-                HardwareChange(type='added', item=item)
-                for item in opening.hardware_items
-            ]
-        )
-    
-    @staticmethod
-    def _create_deleted_opening_change(opening: Opening) -> OpeningChange:
-        """Create change record for deleted opening."""
-        return OpeningChange(
-            number=opening.number,
-            door_info_changes=[DoorInfoChange(
-                field='status',
-                old_value='existed',
-                new_value='deleted'
-            )],
-            hardware_changes=[
-                HardwareChange(type='deleted', item=item)
-                for item in opening.hardware_items
-            ]
-        ) 
\ No newline at end of file
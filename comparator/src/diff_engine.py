@@ -0,0 +1,454 @@
+"""Schedule diff engine shared by the comparator and the Avaware updater.
+
+Schedules are plain dicts so either tool can feed them in:
+
+    {opening_number: {'door_info': {field: value}, 'hardware_items': [item, ...]}}
+
+where each hardware item is a dict with at least the HARDWARE_KEY_FIELDS.
+Openings are matched by number and hardware items by their
+(short_code, product_code, sub_category) key.
+
+This module only depends on the standard library so it can be imported both
+as `src.diff_engine` (comparator) and `comparator.src.diff_engine` (Fieldwire
+client).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+HARDWARE_KEY_FIELDS = ('short_code', 'product_code', 'sub_category')
+HARDWARE_COMPARE_FIELDS = ('quantity_active', 'handing', 'finish_ansi')
+
+DOOR_INFO_FIELDS = {
+    'quantity': 'Quantity',
+    'type': 'Type',
+    'nominal_width': 'NominalWidth',
+    'nominal_height': 'NominalHeight',
+    'hand': 'Hand',
+    'location1': 'Location1',
+    'to_from': 'ToFrom',
+    'location2': 'Location2',
+    'hardware_group': 'HardwareGroup'
+}
+HARDWARE_ITEM_FIELDS = {
+    'short_code': 'ShortCode',
+    'product_code': 'ProductCode',
+    'sub_category': 'SubCategory',
+    'quantity_active': 'QuantityActive',
+    'handing': 'Handing',
+    'finish_ansi': 'Finish_ANSI'
+}
+
+# Below this many openings a process pool costs more than it saves
+PARALLEL_MIN_OPENINGS = 2000
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'schedule_diff_cache')
+
+# Diffs computed in this process, keyed by (namespace, old_hash, new_hash)
+_diff_cache = {}
+_diff_cache_lock = threading.Lock()
+
+@dataclass(slots=True)
+class HardwareDiff:
+    """A hardware item added, deleted or modified within an opening."""
+    type: str                   # 'added', 'deleted' or 'modified'
+    item: Dict[str, Any]        # New item for added/modified, old item for deleted
+    modifications: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+@dataclass(slots=True)
+class OpeningDiff:
+    """All changes to one opening between two schedules."""
+    number: str
+    status: str                 # 'added', 'deleted' or 'modified'
+    door_info_changes: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    hardware_changes: List[HardwareDiff] = field(default_factory=list)
+
+@dataclass(slots=True)
+class ScheduleDiff:
+    """Changes between two schedules, in opening number order."""
+    old_hash: str
+    new_hash: str
+    openings: List[OpeningDiff] = field(default_factory=list)
+
+    def by_number(self) -> Dict[str, OpeningDiff]:
+        return {opening.number: opening for opening in self.openings}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScheduleDiff':
+        openings = []
+        for opening in data['openings']:
+            openings.append(OpeningDiff(
+                number=opening['number'],
+                status=opening['status'],
+                door_info_changes=opening['door_info_changes'],
+                hardware_changes=[HardwareDiff(**change) for change in opening['hardware_changes']]
+            ))
+        return cls(old_hash=data['old_hash'], new_hash=data['new_hash'], openings=openings)
+
+def hardware_key(item: Dict[str, Any]) -> Tuple[str, ...]:
+    """Return the composite key that identifies a hardware item within an opening."""
+    return tuple(item.get(name, '') for name in HARDWARE_KEY_FIELDS)
+
+def hash_file(file_path: str) -> str:
+    """Return the SHA-1 of a file's contents."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def hash_schedule(schedule: Dict[str, Dict[str, Any]]) -> str:
+    """Return a content hash of an in-memory schedule.
+
+    Hardware item lists shared between openings are only serialized once.
+    """
+    digest = hashlib.sha1()
+    item_hashes = {}
+    for number in sorted(schedule):
+        opening = schedule[number]
+        items = opening['hardware_items']
+        if id(items) not in item_hashes:
+            canonical_items = json.dumps(items, sort_keys=True, default=str)
+            item_hashes[id(items)] = hashlib.sha1(canonical_items.encode('utf-8')).hexdigest()
+        canonical = json.dumps([number, opening['door_info'], item_hashes[id(items)]], sort_keys=True, default=str)
+        digest.update(canonical.encode('utf-8'))
+    return digest.hexdigest()
+
+def load_schedule(file_path: str) -> Dict[str, Dict[str, Any]]:
+    """Parse the Division8 openings and hardware of an AVAproject XML export.
+
+    Missing or empty elements become empty strings.
+    """
+    root = ET.parse(file_path).getroot()
+    division8 = root.find('Division8')
+    if division8 is None:
+        raise ValueError("Invalid XML structure. Missing required section: 'Division8'")
+
+    hardware_groups = {}
+    for group in division8.iterfind('HardwareGroups/Group'):
+        hardware_groups[group.get('Name', '')] = [
+            {name: item.findtext(tag) or '' for name, tag in HARDWARE_ITEM_FIELDS.items()}
+            for item in group.iterfind('Item')
+        ]
+
+    schedule = {}
+    for opening in division8.iterfind('OpeningsSchedules/Schedule/Opening'):
+        door_info = {name: opening.findtext(tag) or '' for name, tag in DOOR_INFO_FIELDS.items()}
+        schedule[opening.get('Number', '')] = {
+            'door_info': door_info,
+            'hardware_items': hardware_groups.get(door_info['hardware_group'], [])
+        }
+    return schedule
+
+def diff_hardware(old_items: List[Dict[str, Any]], new_items: List[Dict[str, Any]]) -> List[HardwareDiff]:
+    """Diff two hardware item lists by composite key.
+
+    Added items come first in new-list order, then deleted items in old-list
+    order, then modified items in new-list order.
+    """
+    # The first item wins when a group lists the same key twice
+    old_by_key = {}
+    for item in old_items:
+        old_by_key.setdefault(hardware_key(item), item)
+    new_by_key = {}
+    for item in new_items:
+        new_by_key.setdefault(hardware_key(item), item)
+
+    changes = [HardwareDiff('added', item) for key, item in new_by_key.items() if key not in old_by_key]
+    changes.extend(HardwareDiff('deleted', item) for key, item in old_by_key.items() if key not in new_by_key)
+
+    for key, new_item in new_by_key.items():
+        old_item = old_by_key.get(key)
+        if old_item is None:
+            continue
+        modifications = {}
+        for name in HARDWARE_COMPARE_FIELDS:
+            old_value = old_item.get(name)
+            new_value = new_item.get(name)
+            if old_value != new_value:
+                modifications[name] = {'old': str(old_value), 'new': str(new_value)}
+        if modifications:
+            changes.append(HardwareDiff('modified', new_item, modifications))
+    return changes
+
+def diff_schedules(old_schedule: Dict[str, Dict[str, Any]], new_schedule: Dict[str, Dict[str, Any]],
+                   old_hash: str = None, new_hash: str = None, workers: int = 1) -> ScheduleDiff:
+    """Diff two schedules, reusing an earlier result for the same pair of hashes.
+
+    Args:
+        old_schedule: Schedule before the change
+        new_schedule: Schedule after the change
+        old_hash (str): Content hash of old_schedule, computed if not given
+        new_hash (str): Content hash of new_schedule, computed if not given
+        workers (int): Worker processes for large schedules; 1 diffs in this process
+
+    Returns:
+        ScheduleDiff: Only openings that were added, deleted or modified
+    """
+    old_hash = old_hash or hash_schedule(old_schedule)
+    new_hash = new_hash or hash_schedule(new_schedule)
+    cache_key = ('schedule', old_hash, new_hash)
+    with _diff_cache_lock:
+        if cache_key in _diff_cache:
+            return _diff_cache[cache_key]
+
+    result = _compute_diff(old_schedule, new_schedule, old_hash, new_hash, workers)
+    with _diff_cache_lock:
+        _diff_cache[cache_key] = result
+    return result
+
+def _diff_openings(numbers: List[str], old_schedule, new_schedule) -> List[OpeningDiff]:
+    """Diff the given openings of two schedules.
+
+    Openings that share a hardware group share one item list, so each pair of
+    lists is only diffed once.
+    """
+    hardware_diffs = {}
+    changes = []
+    for number in numbers:
+        old_opening = old_schedule.get(number)
+        new_opening = new_schedule.get(number)
+
+        if old_opening is None:
+            changes.append(OpeningDiff(
+                number=number,
+                status='added',
+                door_info_changes={'status': {'old': 'non-existent', 'new': 'added'}},
+                hardware_changes=[HardwareDiff('added', item) for item in new_opening['hardware_items']]
+            ))
+        elif new_opening is None:
+            changes.append(OpeningDiff(
+                number=number,
+                status='deleted',
+                door_info_changes={'status': {'old': 'existed', 'new': 'deleted'}},
+                hardware_changes=[HardwareDiff('deleted', item) for item in old_opening['hardware_items']]
+            ))
+        else:
+            old_info = old_opening['door_info']
+            new_info = new_opening['door_info']
+            door_info_changes = {}
+            for name, old_value in old_info.items():
+                new_value = new_info.get(name)
+                if old_value != new_value:
+                    door_info_changes[name] = {'old': str(old_value), 'new': str(new_value)}
+
+            old_items = old_opening['hardware_items']
+            new_items = new_opening['hardware_items']
+            pair = (id(old_items), id(new_items))
+            if pair not in hardware_diffs:
+                hardware_diffs[pair] = diff_hardware(old_items, new_items)
+            hardware_changes = hardware_diffs[pair]
+
+            if door_info_changes or hardware_changes:
+                changes.append(OpeningDiff(number, 'modified', door_info_changes, list(hardware_changes)))
+    return changes
+
+def _compute_diff(old_schedule, new_schedule, old_hash, new_hash, workers=1) -> ScheduleDiff:
+    numbers = sorted(old_schedule.keys() | new_schedule.keys())
+    result = ScheduleDiff(old_hash=old_hash, new_hash=new_hash)
+
+    if workers <= 1 or len(numbers) < PARALLEL_MIN_OPENINGS:
+        result.openings = _diff_openings(numbers, old_schedule, new_schedule)
+        return result
+
+    # Contiguous chunks keep the output in opening number order; several
+    # chunks per worker even out uneven opening sizes
+    chunk_size = max(1, -(-len(numbers) // (workers * 4)))
+    chunks = [numbers[i:i + chunk_size] for i in range(0, len(numbers), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _diff_openings,
+                chunk,
+                {number: old_schedule[number] for number in chunk if number in old_schedule},
+                {number: new_schedule[number] for number in chunk if number in new_schedule}
+            )
+            for chunk in chunks
+        ]
+        for future in futures:
+            result.openings.extend(future.result())
+    return result
+
+def _read_json_cache(cache_path: Optional[str]) -> Optional[Any]:
+    """Return the contents of a JSON cache file, or None if missing or unreadable."""
+    if not cache_path or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None  # Unreadable cache entry; recompute it
+
+def _write_json_cache(cache_path: Optional[str], data: Any):
+    """Atomically write a JSON cache file, warning instead of failing."""
+    if not cache_path:
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write cache file {cache_path}: {str(e)}")
+
+def _cached_diff(namespace: str, old_hash: str, new_hash: str, cache_dir: Optional[str]) -> Optional[ScheduleDiff]:
+    """Return a diff from the memory or disk cache, or None."""
+    cache_key = (namespace, old_hash, new_hash)
+    with _diff_cache_lock:
+        if cache_key in _diff_cache:
+            return _diff_cache[cache_key]
+
+    cache_path = os.path.join(cache_dir, f"{namespace}_{old_hash}_{new_hash}.json") if cache_dir else None
+    data = _read_json_cache(cache_path)
+    if data is None:
+        return None
+    try:
+        result = ScheduleDiff.from_dict(data)
+    except (KeyError, TypeError):
+        return None
+    with _diff_cache_lock:
+        _diff_cache[cache_key] = result
+    return result
+
+def _store_diff(namespace: str, result: ScheduleDiff, cache_dir: Optional[str]):
+    """Add a diff to the memory cache and, if cache_dir is set, the disk cache."""
+    with _diff_cache_lock:
+        _diff_cache[(namespace, result.old_hash, result.new_hash)] = result
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, f"{namespace}_{result.old_hash}_{result.new_hash}.json")
+        _write_json_cache(cache_path, result.to_dict())
+
+def diff_schedule_files(old_file: str, new_file: str,
+                        loader: Callable[[str], Dict[str, Dict[str, Any]]] = load_schedule,
+                        namespace: str = 'ava', cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                        workers: int = 1) -> ScheduleDiff:
+    """Diff two schedule files, caching the result by the files' content hashes.
+
+    The diff is cached in memory and, if cache_dir is set, as JSON on disk so a
+    later run comparing the same two revisions skips parsing and diffing.
+
+    Args:
+        old_file (str): Path to the older schedule
+        new_file (str): Path to the newer schedule
+        loader: Parses a file into a schedule dict
+        namespace (str): Separates cached diffs made with different loaders
+        cache_dir (str): Directory for cached diffs, or None to only cache in memory
+        workers (int): Worker processes for large schedules; 1 diffs in this process
+
+    Returns:
+        ScheduleDiff: The diff of the two files
+    """
+    old_hash = hash_file(old_file)
+    new_hash = hash_file(new_file)
+    result = _cached_diff(namespace, old_hash, new_hash, cache_dir)
+    if result is None:
+        result = _compute_diff(loader(old_file), loader(new_file), old_hash, new_hash, workers)
+        _store_diff(namespace, result, cache_dir)
+    return result
+
+def _pack_schedule(schedule: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert a schedule to JSON, storing each shared hardware list once."""
+    item_lists = []
+    list_index = {}
+    openings = {}
+    for number, opening in schedule.items():
+        items = opening['hardware_items']
+        if id(items) not in list_index:
+            list_index[id(items)] = len(item_lists)
+            item_lists.append(items)
+        openings[number] = {'door_info': opening['door_info'], 'items': list_index[id(items)]}
+    return {'item_lists': item_lists, 'openings': openings}
+
+def _unpack_schedule(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Rebuild a schedule packed by _pack_schedule, restoring shared lists."""
+    item_lists = data['item_lists']
+    return {
+        number: {'door_info': opening['door_info'], 'hardware_items': item_lists[opening['items']]}
+        for number, opening in data['openings'].items()
+    }
+
+def load_schedule_cached(file_path: str, loader: Callable[[str], Dict[str, Dict[str, Any]]] = load_schedule,
+                         namespace: str = 'ava', cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                         file_hash: str = None) -> Dict[str, Dict[str, Any]]:
+    """Parse a schedule file, reusing the parsed result cached for its content hash."""
+    file_hash = file_hash or hash_file(file_path)
+    cache_path = os.path.join(cache_dir, f"{namespace}_parsed_{file_hash}.json") if cache_dir else None
+    data = _read_json_cache(cache_path)
+    if data is not None:
+        try:
+            return _unpack_schedule(data)
+        except (KeyError, IndexError, TypeError):
+            pass  # Stale cache format; parse again
+    schedule = loader(file_path)
+    _write_json_cache(cache_path, _pack_schedule(schedule))
+    return schedule
+
+def diff_schedule_series(files: List[str], loader: Callable[[str], Dict[str, Dict[str, Any]]] = load_schedule,
+                         namespace: str = 'ava', cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                         workers: int = 1) -> List[ScheduleDiff]:
+    """Diff each revision in a series against the one before it.
+
+    Consecutive diffs already cached are reused, and only the revisions needed
+    for the remaining diffs are loaded. Revisions parsed before come from the
+    parsed-schedule cache, so adding one revision to a series parses one file.
+    Revisions that need parsing are parsed in parallel.
+
+    Args:
+        files (list): Schedule files, oldest first
+        loader: Parses a file into a schedule dict. Must be picklable when workers > 1.
+        namespace (str): Separates cached results made with different loaders
+        cache_dir (str): Directory for cached results, or None to only cache diffs in memory
+        workers (int): Processes used to parse revisions
+
+    Returns:
+        list: ScheduleDiff for each consecutive pair, len(files) - 1 entries
+    """
+    hashes = [hash_file(path) for path in files]
+    pairs = list(zip(range(len(files) - 1), range(1, len(files))))
+    diffs = {pair: _cached_diff(namespace, hashes[pair[0]], hashes[pair[1]], cache_dir) for pair in pairs}
+
+    needed = sorted({index for pair, diff in diffs.items() if diff is None for index in pair})
+    schedules = {}
+    if workers > 1 and len(needed) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(needed))) as executor:
+            futures = {
+                index: executor.submit(load_schedule_cached, files[index], loader, namespace, cache_dir, hashes[index])
+                for index in needed
+            }
+            schedules = {index: future.result() for index, future in futures.items()}
+    else:
+        for index in needed:
+            schedules[index] = load_schedule_cached(files[index], loader, namespace, cache_dir, hashes[index])
+
+    results = []
+    for old_index, new_index in pairs:
+        diff = diffs[(old_index, new_index)]
+        if diff is None:
+            diff = _compute_diff(schedules[old_index], schedules[new_index], hashes[old_index], hashes[new_index])
+            _store_diff(namespace, diff, cache_dir)
+        results.append(diff)
+    return results
+
+def opening_history(diffs: List[ScheduleDiff]) -> Dict[str, List[Tuple[int, OpeningDiff]]]:
+    """Collect each opening's changes across a series of consecutive diffs.
+
+    Returns:
+        dict: Opening number -> [(diff index, OpeningDiff), ...] for every diff
+            that changed the opening, in opening number order
+    """
+    history = {}
+    for index, diff in enumerate(diffs):
+        for opening in diff.openings:
+            history.setdefault(opening.number, []).append((index, opening))
+    return {number: history[number] for number in sorted(history)}
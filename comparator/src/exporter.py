@@ -1,9 +1,10 @@
 import json
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
-from src.models import ComparisonSummary, OpeningChange, HardwareChange
+from src.models import ComparisonSummary, OpeningChange
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.utils import get_column_letter
 
@@ -17,215 +18,237 @@ class Exporter:
         new_file: str,
         output_file: str
     ):
-        """Export comparison results to JSON file."""
+        """Export comparison results to JSON file.
         
-        # Create export data structure
-        export_data = {
-            "metadata": {
-                "oldVersion": old_file,
-                "newVersion": new_file,
-                "comparisonDate": datetime.now().isoformat(),
-                "summary": {
-                    "totalChangedOpenings": summary.total_changed_openings,
-                    "openingsWithDoorInfoChanges": summary.openings_with_door_info_changes,
-                    "openingsWithHardwareChanges": summary.openings_with_hardware_changes
-                }
-            },
-            "changes": {
-                "openings": [
-                    Exporter._format_opening_change(change)
-                    for change in summary.changes
-                ]
-            }
-        }
+        The file is written one opening at a time, so the full export structure
+        is never held in memory. The output is the same as json.dump(indent=2)
+        of the complete structure.
+        """
+        metadata = Exporter._format_metadata(summary, old_file, new_file)
         
-        # Write to JSON file
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2)
+            f.write('{\n  "metadata": ')
+            f.write(Exporter._indent_json(json.dumps(metadata, indent=2), 2))
+            f.write(',\n  "changes": {\n    "openings": [')
+            for index, change in enumerate(summary.changes):
+                f.write(',\n      ' if index else '\n      ')
+                opening_json = json.dumps(Exporter._format_opening_change(change), indent=2)
+                f.write(Exporter._indent_json(opening_json, 6))
+            f.write('\n    ]\n  }\n}' if summary.changes else ']\n  }\n}')
             
         # Create Excel file
         excel_path = Path(output_file).with_suffix('.xlsx')
         Exporter.export_to_excel(summary, old_file, new_file, str(excel_path))
     
     @staticmethod
-    def export_to_excel(
+    def export_to_jsonl(
         summary: ComparisonSummary,
         old_file: str,
         new_file: str,
         output_file: str
     ):
-        """Export comparison results to Excel file with multiple sheets."""
-        wb = Workbook()
+        """Export comparison results to a JSON Lines file.
         
-        # Create styles
-        header_style = Font(bold=True)
-        added_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Light green
-        deleted_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Light red
-        modified_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # Light yellow
+        The first line holds the metadata and every following line one changed
+        opening, in the same format as the JSON export.
+        """
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"metadata": Exporter._format_metadata(summary, old_file, new_file)}))
+            f.write('\n')
+            for change in summary.changes:
+                f.write(json.dumps(Exporter._format_opening_change(change)))
+                f.write('\n')
         
-        # Summary Sheet
-        ws_summary = wb.active
-        ws_summary.title = "Summary"
-        Exporter._create_summary_sheet(ws_summary, summary, old_file, new_file)
+        # Create Excel file
+        excel_path = Path(output_file).with_suffix('.xlsx')
+        Exporter.export_to_excel(summary, old_file, new_file, str(excel_path))
+    
+    @staticmethod
+    def export_history_to_jsonl(
+        files: List[str],
+        history: Dict[str, List[Tuple[int, Any]]],
+        output_file: str
+    ):
+        """Export per-opening change history across a series of revisions.
         
-        # Door Info Changes Sheet
-        ws_door = wb.create_sheet("Door Info Changes")
-        Exporter._create_door_info_sheet(ws_door, summary.changes, header_style, modified_fill)
+        The first line holds the metadata and every following line one opening
+        with each revision step that changed it.
+        """
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"metadata": {
+                "revisions": files,
+                "comparisonDate": datetime.now().isoformat(),
+                "changedOpenings": len(history)
+            }}))
+            f.write('\n')
+            for number, steps in history.items():
+                f.write(json.dumps({
+                    "number": number,
+                    "history": [
+                        {
+                            "oldVersion": files[index],
+                            "newVersion": files[index + 1],
+                            "status": opening.status,
+                            "doorInfoChanges": opening.door_info_changes,
+                            "hardwareChanges": [
+                                {"type": change.type, "item": change.item, "modifications": change.modifications}
+                                for change in opening.hardware_changes
+                            ]
+                        }
+                        for index, opening in steps
+                    ]
+                }))
+                f.write('\n')
+    
+    @staticmethod
+    def _format_metadata(summary: ComparisonSummary, old_file: str, new_file: str) -> Dict[str, Any]:
+        """Format the export metadata block."""
+        return {
+            "oldVersion": old_file,
+            "newVersion": new_file,
+            "comparisonDate": datetime.now().isoformat(),
+            "summary": {
+                "totalChangedOpenings": summary.total_changed_openings,
+                "openingsWithDoorInfoChanges": summary.openings_with_door_info_changes,
+                "openingsWithHardwareChanges": summary.openings_with_hardware_changes
+            }
+        }
+    
+    @staticmethod
+    def _indent_json(text: str, indent: int) -> str:
+        """Indent every line but the first of a json.dumps result."""
+        return text.replace('\n', '\n' + ' ' * indent)
+    
+    @staticmethod
+    def export_to_excel(
+        summary: ComparisonSummary,
+        old_file: str,
+        new_file: str,
+        output_file: str
+    ):
+        """Export comparison results to Excel file with multiple sheets.
+        
+        Uses a write-only workbook so rows are streamed to disk as they are
+        added. Write-only sheets need their column widths before the first row,
+        so each sheet's rows are generated twice: once to measure, once to write.
+        """
+        wb = Workbook(write_only=True)
+        
+        # Create styles
+        styles = {
+            'header': {'font': Font(bold=True)},
+            'added': {'fill': PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")},  # Light green
+            'deleted': {'fill': PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")},  # Light red
+            'modified': {'fill': PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")}  # Light yellow
+        }
         
-        # Hardware Changes Sheet
-        ws_hardware = wb.create_sheet("Hardware Changes")
-        Exporter._create_hardware_sheet(
-            ws_hardware, 
-            summary.changes,
-            header_style,
-            added_fill,
-            deleted_fill,
-            modified_fill
-        )
+        sheets = [
+            ("Summary", lambda: Exporter._summary_rows(summary, old_file, new_file)),
+            ("Door Info Changes", lambda: Exporter._door_info_rows(summary.changes)),
+            ("Hardware Changes", lambda: Exporter._hardware_rows(summary.changes))
+        ]
         
-        # Auto-adjust column widths
-        for ws in [ws_summary, ws_door, ws_hardware]:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = get_column_letter(column[0].column)
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column_letter].width = adjusted_width
+        for title, rows in sheets:
+            ws = wb.create_sheet(title)
+            
+            # Auto-adjust column widths
+            widths = {}
+            for values, _ in rows():
+                for column, value in enumerate(values, 1):
+                    if value is not None:
+                        widths[column] = max(widths.get(column, 0), len(str(value)))
+            for column, width in widths.items():
+                ws.column_dimensions[get_column_letter(column)].width = width + 2
+            
+            for values, style in rows():
+                if style is None:
+                    ws.append(values)
+                    continue
+                row = []
+                for value in values:
+                    cell = WriteOnlyCell(ws, value=value)
+                    for attribute, style_value in styles[style].items():
+                        setattr(cell, attribute, style_value)
+                    row.append(cell)
+                ws.append(row)
         
         # Save workbook
         wb.save(output_file)
     
     @staticmethod
-    def _create_summary_sheet(ws, summary: ComparisonSummary, old_file: str, new_file: str):
-        """Create the summary sheet."""
-        ws.append(["Door Hardware Schedule Comparison Summary"])
-        ws.append([])
-        ws.append(["Old Version", Path(old_file).name])
-        ws.append(["New Version", Path(new_file).name])
-        ws.append(["Comparison Date", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
-        ws.append([])
-        ws.append(["Statistics"])
-        ws.append(["Total Changed Openings", summary.total_changed_openings])
-        ws.append(["Openings with Door Info Changes", summary.openings_with_door_info_changes])
-        ws.append(["Openings with Hardware Changes", summary.openings_with_hardware_changes])
+    def _summary_rows(summary: ComparisonSummary, old_file: str, new_file: str) -> Iterator[Tuple[list, Optional[str]]]:
+        """Yield (values, style) rows for the summary sheet."""
+        yield ["Door Hardware Schedule Comparison Summary"], None
+        yield [], None
+        yield ["Old Version", Path(old_file).name], None
+        yield ["New Version", Path(new_file).name], None
+        yield ["Comparison Date", datetime.now().strftime("%Y-%m-%d %H:%M:%S")], None
+        yield [], None
+        yield ["Statistics"], None
+        yield ["Total Changed Openings", summary.total_changed_openings], None
+        yield ["Openings with Door Info Changes", summary.openings_with_door_info_changes], None
+        yield ["Openings with Hardware Changes", summary.openings_with_hardware_changes], None
     
     @staticmethod
-    def _create_door_info_sheet(ws, changes: List[OpeningChange], header_style, modified_fill):
-        """Create the door information changes sheet."""
-        # Headers
-        headers = ["Opening Number", "Field", "Old Value", "New Value"]
-        ws.append(headers)
-        for cell in ws[1]:
-            cell.font = header_style
+    def _door_info_rows(changes: List[OpeningChange]) -> Iterator[Tuple[list, Optional[str]]]:
+        """Yield (values, style) rows for the door information changes sheet."""
+        yield ["Opening Number", "Field", "Old Value", "New Value"], 'header'
         
-        # Data
         for change in changes:
-            if change.door_info_changes:
-                for info_change in change.door_info_changes:
-                    row = [
-                        change.number,
-                        info_change.field,
-                        info_change.old_value,
-                        info_change.new_value
-                    ]
-                    ws.append(row)
-                    for cell in ws[ws.max_row]:
-                        cell.fill = modified_fill
+            for info_change in change.door_info_changes:
+                yield [
+                    change.number,
+                    info_change.field,
+                    info_change.old_value,
+                    info_change.new_value
+                ], 'modified'
     
     @staticmethod
-    def _create_hardware_sheet(ws, changes: List[OpeningChange], header_style, added_fill, deleted_fill, modified_fill):
-        """Create the hardware changes sheet."""
-        current_row = 1
-        
+    def _hardware_rows(changes: List[OpeningChange]) -> Iterator[Tuple[list, Optional[str]]]:
+        """Yield (values, style) rows for the hardware changes sheet."""
         for change in changes:
             if not change.hardware_changes:
                 continue
                 
             # Opening header
-            ws.append([f"Opening {change.number}"])
-            ws.cell(current_row, 1).font = header_style
-            current_row += 1
-            
-            # Added Hardware
-            added = [c for c in change.hardware_changes if c.type == 'added']
-            if added:
-                current_row = Exporter._add_hardware_section(
-                    ws, "Added Hardware", added, current_row, header_style, added_fill
-                )
+            yield [f"Opening {change.number}"], 'header'
             
-            # Deleted Hardware
-            deleted = [c for c in change.hardware_changes if c.type == 'deleted']
-            if deleted:
-                current_row = Exporter._add_hardware_section(
-                    ws, "Deleted Hardware", deleted, current_row, header_style, deleted_fill
-                )
+            # Added and Deleted Hardware
+            for change_type, title in (('added', "Added Hardware"), ('deleted', "Deleted Hardware")):
+                items = [c for c in change.hardware_changes if c.type == change_type]
+                if not items:
+                    continue
+                yield [title], 'header'
+                yield ["Short Code", "Product Code", "Sub Category", "Quantity", "Handing", "Finish"], 'header'
+                for item_change in items:
+                    yield [
+                        item_change.item.short_code,
+                        item_change.item.product_code,
+                        item_change.item.sub_category,
+                        item_change.item.quantity_active,
+                        item_change.item.handing,
+                        item_change.item.finish_ansi
+                    ], change_type
+                yield [], None
             
             # Modified Hardware
             modified = [c for c in change.hardware_changes if c.type == 'modified']
             if modified:
-                ws.append(["Modified Hardware"])
-                ws.cell(current_row, 1).font = header_style
-                current_row += 1
-                
-                headers = ["Short Code", "Product Code", "Sub Category", "Field", "Old Value", "New Value"]
-                ws.append(headers)
-                for cell in ws[current_row]:
-                    cell.font = header_style
-                current_row += 1
-                
-                for change in modified:
-                    for field, values in change.modifications.items():
-                        row = [
-                            change.item.short_code,
-                            change.item.product_code,
-                            change.item.sub_category,
+                yield ["Modified Hardware"], 'header'
+                yield ["Short Code", "Product Code", "Sub Category", "Field", "Old Value", "New Value"], 'header'
+                for item_change in modified:
+                    for field, values in item_change.modifications.items():
+                        yield [
+                            item_change.item.short_code,
+                            item_change.item.product_code,
+                            item_change.item.sub_category,
                             field,
                             values['old'],
                             values['new']
-                        ]
-                        ws.append(row)
-                        for cell in ws[current_row]:
-                            cell.fill = modified_fill
-                        current_row += 1
+                        ], 'modified'
             
             # Add spacing between openings
-            ws.append([])
-            current_row += 1
-    
-    @staticmethod
-    def _add_hardware_section(ws, title: str, items: List[HardwareChange], start_row: int, header_style, fill_style) -> int:
-        """Add a section of hardware items to the sheet."""
-        ws.append([title])
-        ws.cell(start_row, 1).font = header_style
-        current_row = start_row + 1
-        
-        headers = ["Short Code", "Product Code", "Sub Category", "Quantity", "Handing", "Finish"]
-        ws.append(headers)
-        for cell in ws[current_row]:
-            cell.font = header_style
-        current_row += 1
-        
-        for change in items:
-            row = [
-                change.item.short_code,
-                change.item.product_code,
-                change.item.sub_category,
-                change.item.quantity_active,
-                change.item.handing,
-                change.item.finish_ansi
-            ]
-            ws.append(row)
-            for cell in ws[current_row]:
-                cell.fill = fill_style
-            current_row += 1
-        
-        ws.append([])
-        return current_row + 1
+            yield [], None
     
     @staticmethod
     def _format_opening_change(change) -> Dict[str, Any]:
@@ -1,7 +1,8 @@
+import multiprocessing
 import typer
-from typing import Optional
-from src.parser import XMLParser
+from typing import List, Optional
 from src.comparator import Comparator
+from src.diff_engine import opening_history
 from src.ui import UI
 from src.exporter import Exporter
 
@@ -11,7 +12,8 @@ app = typer.Typer()
 def compare(
     old_file: Optional[str] = typer.Argument(None),
     new_file: Optional[str] = typer.Argument(None),
-    export_file: Optional[str] = typer.Option(None, "--export", "-e")
+    export_file: Optional[str] = typer.Option(None, "--export", "-e"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Processes used to diff large schedules")
 ):
     """Compare two door hardware schedule XML files."""
     ui = UI()
@@ -21,14 +23,11 @@ def compare(
         old_file, new_file = ui.prompt_for_files()
     
     try:
-        # Parse XML files
-        parser = XMLParser()
-        old_openings = parser.parse_file(old_file)
-        new_openings = parser.parse_file(new_file)
+        # Parse and compare, reusing the cached diff for a known pair of files
+        diff = Comparator.diff_files(old_file, new_file, workers=workers)
         
-        # Compare openings
-        comparator = Comparator()
-        summary = comparator.compare(old_openings, new_openings)
+        # Models are only built for the changed openings shown and exported
+        summary = Comparator.summary_from_diff(diff)
         
         # Show summary
         ui.show_summary(summary)
@@ -43,19 +42,50 @@ def compare(
         
         # Export if requested
         if export_file or (export_path := ui.export_prompt()):
-            Exporter.export_to_json(
+            output_file = export_file or export_path
+            export = Exporter.export_to_jsonl if output_file.endswith('.jsonl') else Exporter.export_to_json
+            export(
                 summary,
                 old_file,
                 new_file,
-                export_file or export_path
+                output_file
             )
     
     except Exception as e:
         typer.echo(f"Error: {str(e)}", err=True)
         raise typer.Exit(1)
 
+@app.command("compare-series")
+def compare_series(
+    files: List[str] = typer.Argument(..., help="Schedule XML files, oldest revision first"),
+    export_file: Optional[str] = typer.Option(None, "--export", "-e", help="Write the per-opening history as JSON Lines"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Processes used to parse revisions")
+):
+    """Compare a series of door hardware schedule revisions."""
+    if len(files) < 2:
+        typer.echo("Error: At least two revisions are needed", err=True)
+        raise typer.Exit(1)
+    
+    ui = UI()
+    
+    try:
+        # Each revision is parsed once; cached revisions and diffs are reused
+        diffs = Comparator.diff_series(files, workers=workers)
+        history = opening_history(diffs)
+        
+        ui.show_series_summary(files, diffs, history)
+        
+        if export_file:
+            Exporter.export_history_to_jsonl(files, history, export_file)
+    
+    except Exception as e:
+        typer.echo(f"Error: {str(e)}", err=True)
+        raise typer.Exit(1)
+
 def main():
     """Entry point for direct execution."""
+    # Needed for --workers in the PyInstaller build
+    multiprocessing.freeze_support()
     app()
 
 if __name__ == "__main__":
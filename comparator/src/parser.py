@@ -10,6 +10,30 @@ class XMLParser:
         """
         Parse XML file and return a dictionary of Openings keyed by number.
         """
+        schedule = XMLParser.parse_schedule(file_path)
+        
+        # Openings in the same hardware group share one list of models
+        hardware_models = {}
+        openings = {}
+        for number, opening in schedule.items():
+            items = opening['hardware_items']
+            if id(items) not in hardware_models:
+                hardware_models[id(items)] = [HardwareItem(**item) for item in items]
+            openings[number] = Opening(
+                number=number,
+                door_info=DoorInfo(**opening['door_info']),
+                hardware_items=hardware_models[id(items)]
+            )
+        return openings
+    
+    @staticmethod
+    def parse_schedule(file_path: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse XML file into the diff engine's schedule dicts, keyed by number.
+        
+        This is the fast path used for comparisons: no models are validated,
+        and openings in the same hardware group share one item list.
+        """
         with open(file_path, 'r', encoding='utf-8') as f:
             xml_dict = xmltodict.parse(f.read())
         
@@ -32,8 +56,8 @@ class XMLParser:
             openings = {}
             for opening_data in openings_data:
                 try:
-                    opening = XMLParser._parse_opening(opening_data, hardware_groups)
-                    openings[opening.number] = opening
+                    number, opening = XMLParser._parse_opening(opening_data, hardware_groups)
+                    openings[number] = opening
                 except Exception as e:
                     print(f"Error parsing opening {opening_data.get('@Number', 'unknown')}: {str(e)}")
                     raise
@@ -44,7 +68,7 @@ class XMLParser:
             raise ValueError(f"Invalid XML structure. Missing required section: {str(e)}")
     
     @staticmethod
-    def _parse_hardware_groups(division8: Dict[str, Any]) -> Dict[str, List[HardwareItem]]:
+    def _parse_hardware_groups(division8: Dict[str, Any]) -> Dict[str, List[Dict[str, str]]]:
         """Parse all hardware groups into a dictionary keyed by group name."""
         groups = {}
         
@@ -65,14 +89,14 @@ class XMLParser:
                     
                 hardware_items = []
                 for item in items:
-                    hardware_items.append(HardwareItem(
-                        short_code=str(item.get('ShortCode', '')),
-                        product_code=str(item.get('ProductCode', '')),
-                        sub_category=str(item.get('SubCategory', '')),
-                        quantity_active=str(item.get('QuantityActive', '')),
-                        handing=str(item.get('Handing', '')),
-                        finish_ansi=str(item.get('Finish_ANSI', ''))
-                    ))
+                    hardware_items.append({
+                        'short_code': str(item.get('ShortCode', '')),
+                        'product_code': str(item.get('ProductCode', '')),
+                        'sub_category': str(item.get('SubCategory', '')),
+                        'quantity_active': str(item.get('QuantityActive', '')),
+                        'handing': str(item.get('Handing', '')),
+                        'finish_ansi': str(item.get('Finish_ANSI', ''))
+                    })
                     
                 groups[group_name] = hardware_items
                 
@@ -82,32 +106,30 @@ class XMLParser:
         return groups
     
     @staticmethod
-    def _parse_opening(opening_data: Dict[str, Any], hardware_groups: Dict[str, List[HardwareItem]]) -> Opening:
-        """Parse Opening data from XML dictionary."""
+    def _parse_opening(opening_data: Dict[str, Any], hardware_groups: Dict[str, List[Dict[str, str]]]):
+        """Parse Opening data from XML dictionary into (number, schedule entry)."""
         try:
             # Extract door info with safe value handling
-            door_info = DoorInfo(
-                quantity=str(opening_data.get('Quantity', '')),
-                type=str(opening_data.get('Type', '')),
-                nominal_width=str(opening_data.get('NominalWidth', '')),
-                nominal_height=str(opening_data.get('NominalHeight', '')),
-                hand=str(opening_data.get('Hand', '')),
-                location1=str(opening_data.get('Location1', '')),
-                to_from=str(opening_data.get('ToFrom', '')),
-                location2=str(opening_data.get('Location2', '')),
-                hardware_group=str(opening_data.get('HardwareGroup', ''))
-            )
+            door_info = {
+                'quantity': str(opening_data.get('Quantity', '')),
+                'type': str(opening_data.get('Type', '')),
+                'nominal_width': str(opening_data.get('NominalWidth', '')),
+                'nominal_height': str(opening_data.get('NominalHeight', '')),
+                'hand': str(opening_data.get('Hand', '')),
+                'location1': str(opening_data.get('Location1', '')),
+                'to_from': str(opening_data.get('ToFrom', '')),
+                'location2': str(opening_data.get('Location2', '')),
+                'hardware_group': str(opening_data.get('HardwareGroup', ''))
+            }
             
             # Get hardware items from the hardware groups
-            hardware_group = str(opening_data.get('HardwareGroup', ''))
-            hardware_items = hardware_groups.get(hardware_group, [])
+            hardware_items = hardware_groups.get(door_info['hardware_group'], [])
             
-            return Opening(
-                number=str(opening_data.get('@Number', '')),
-                door_info=door_info,
-                hardware_items=hardware_items
-            )
+            return str(opening_data.get('@Number', '')), {
+                'door_info': door_info,
+                'hardware_items': hardware_items
+            }
         except KeyError as e:
             raise ValueError(f"Missing required field in Opening: {str(e)}")
         except ValueError as e:
-            raise ValueError(f"Invalid value in Opening: {str(e)}") 
\ No newline at end of file
+            raise ValueError(f"Invalid value in Opening: {str(e)}")
@@ -3,8 +3,10 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich.prompt import Prompt
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from src.models import ComparisonSummary, OpeningChange
+from src.diff_engine import ScheduleDiff
+from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog
 
@@ -41,6 +43,54 @@ class UI:
         
         self.console.print(table)
     
+    def show_series_summary(
+        self,
+        files: List[str],
+        diffs: List[ScheduleDiff],
+        history: Dict[str, List[Tuple[int, Any]]]
+    ):
+        """Display change counts per revision step and each opening's history."""
+        self.console.print("\n[bold blue]Door Hardware Schedule Revision Series[/bold blue]")
+        
+        # One row per consecutive pair of revisions
+        steps = Table(show_header=True, header_style="bold magenta")
+        steps.add_column("Step", style="dim")
+        steps.add_column("Revision")
+        steps.add_column("Added", justify="right")
+        steps.add_column("Deleted", justify="right")
+        steps.add_column("Modified", justify="right")
+        
+        for index, diff in enumerate(diffs, 1):
+            statuses = [opening.status for opening in diff.openings]
+            steps.add_row(
+                str(index),
+                Path(files[index]).name,
+                str(statuses.count('added')),
+                str(statuses.count('deleted')),
+                str(statuses.count('modified'))
+            )
+        
+        self.console.print(steps)
+        
+        if not history:
+            self.console.print("\nNo openings changed across the series.")
+            return
+        
+        # One row per changed opening, one column per step
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Opening Number")
+        for index in range(1, len(diffs) + 1):
+            table.add_column(f"Step {index}", justify="center")
+        
+        styles = {'added': "green", 'deleted': "red", 'modified': "yellow"}
+        for number, changes in history.items():
+            cells = ["-"] * len(diffs)
+            for index, opening in changes:
+                cells[index] = f"[{styles[opening.status]}]{opening.status}[/{styles[opening.status]}]"
+            table.add_row(number, *cells)
+        
+        self.console.print(table)
+    
     def show_changed_openings_list(
         self,
         changes: List[OpeningChange]
@@ -201,6 +251,6 @@ class UI:
             return filedialog.asksaveasfilename(
                 title="Save JSON Report",
                 defaultextension=".json",
-                filetypes=[("JSON files", "*.json")]
+                filetypes=[("JSON files", "*.json"), ("JSON Lines files", "*.jsonl")]
             )
         return None 
\ No newline at end of file
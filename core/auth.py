@@ -6,6 +6,7 @@ import time
 import threading
 from datetime import datetime, timedelta
 from config.settings import ACCOUNT_BASE_URL, PROJECT_BASE_URL, TOKEN_URL, API_VERSION
+from utils.rate_limiter import current_rate_limiter
 
 class TokenManager:
     """Singleton class to manage API tokens with thread safety."""
@@ -182,6 +183,11 @@ class AuthManager:
         if 'json' in kwargs:
             print("Payload:", kwargs['json'])
         
+        # Requests made inside fetch_concurrently share its rate limiter
+        rate_limiter = current_rate_limiter()
+        if rate_limiter:
+            rate_limiter.wait_for_slot()
+        
         response = requests.request(method, url, headers=request_headers, **kwargs)
         
         # Handle 401 (unauthorized) by refreshing token and retrying once
@@ -190,6 +196,8 @@ class AuthManager:
             # This will now be thread-safe:
             self.token_manager.refresh_access_token()
             request_headers = self.merge_headers(headers)  # Get fresh headers with new token
+            if rate_limiter:
+                rate_limiter.wait_for_slot()
             response = requests.request(method, url, headers=request_headers, **kwargs)
         
         # Only print error messages for unexpected status codes
@@ -27,6 +27,7 @@ a = Analysis(
         'utils.decorators',
         'utils.rate_limiter',
         'processors.xml_processor',
+        'comparator.src.diff_engine',
         'processors.hardware_processor',
         'config.settings',
         'config.constants',
@@ -1,10 +1,33 @@
 """Main entry point for Fieldwire API CLI."""
 
-from cli.cli import run_cli
+import argparse
+import sys
+from cli.cli import run_cli, run_offline_reports
 from core.auth import AuthManager
 from services.project import ProjectService
 
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Fieldwire API CLI")
+    parser.add_argument('--from-snapshot', metavar='DIR',
+                        help="Generate reports offline from a saved project snapshot")
+    parser.add_argument('--report', choices=['fc', 'uca', 'filter'],
+                        help="With --from-snapshot, run one report and exit")
+    parser.add_argument('--output', '-o', metavar='FILE',
+                        help="With --report fc or uca, the Excel file to write")
+    args = parser.parse_args()
+    if (args.report or args.output) and not args.from_snapshot:
+        parser.error("--report and --output require --from-snapshot")
+    return args
+
 def main():
+    args = parse_args()
+    if args.from_snapshot:
+        # No token or network access needed
+        if not run_offline_reports(args.from_snapshot, args.report, args.output):
+            sys.exit(1)
+        return
+    
     print("     __( )_")
     print("    (      (o____")
     print("     |          |")
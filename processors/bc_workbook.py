@@ -0,0 +1,115 @@
+"""BC Excel export processing functions."""
+
+import numpy as np
+import pandas as pd
+from utils.excel_reader import read_excel_sheet
+
+BC_SHEET_NAME = "Sheet0"
+OPENING_ID_COLUMN = "Opening ID"
+TIER_COLUMNS = [f"Tier {i}" for i in range(1, 6)]
+CHECKLIST_NAME_FIELDS = ['Qty', 'Description', 'Part Number', 'Hand', 'Item']
+
+def load_bc_workbook(file_path, columns=None):
+    """Load Sheet0 of a BC export.
+
+    The Opening ID and Tier 1-5 columns are matched case-insensitively and
+    renamed to 'Opening ID' and 'Tier N'. All values are read as strings. The
+    whole sheet is parsed once per export and cached by read_excel_sheet, so
+    later BC workflows on the same file skip the XLSX parse.
+
+    Args:
+        file_path (str): Path to the Excel file
+        columns (list, optional): Columns to keep besides Opening ID and the Tier
+            columns, matched case-insensitively. If None, every column is kept.
+
+    Returns:
+        pandas.DataFrame: The sheet, or None if it could not be loaded (the reason is printed)
+    """
+    df = read_excel_sheet(file_path, BC_SHEET_NAME)
+    if df is None:
+        return None
+
+    if OPENING_ID_COLUMN.lower() not in {str(col).lower() for col in df.columns if col is not None}:
+        print("Error: Required column 'Opening ID' (case insensitive) not found in the Excel file")
+        print("Available columns:", ", ".join(str(c) if c is not None else 'None' for c in df.columns))
+        return None
+
+    if columns is not None:
+        wanted = {str(c).lower() for c in [OPENING_ID_COLUMN, *TIER_COLUMNS, *columns]}
+        df = df[[col for col in df.columns if col is not None and str(col).lower() in wanted]]
+
+    # Case-insensitive match of the Opening ID and Tier columns
+    canonical = {name.lower(): name for name in [OPENING_ID_COLUMN, *TIER_COLUMNS]}
+    renames = {}
+    for col in df.columns:
+        name = canonical.get(str(col).lower()) if col is not None else None
+        if name and name not in renames.values():
+            renames[col] = name
+    return df.rename(columns=renames)
+
+def find_tier_columns(df):
+    """Return the Tier 1-5 columns present in a loaded BC sheet, in tier order."""
+    return [col for col in TIER_COLUMNS if col in df.columns]
+
+def clean_column(series):
+    """Return a column as stripped strings, with empty cells as ''."""
+    return series.fillna('').astype(str).str.strip()
+
+def extract_opening_ids(df):
+    """Return the stripped Opening ID of every row, with empty cells as ''."""
+    return clean_column(df[OPENING_ID_COLUMN])
+
+def extract_location_paths(df, tier_columns):
+    """Extract each opening's location path from the Tier columns.
+
+    Trailing empty tiers are dropped, and rows without an Opening ID or without
+    any tier are skipped. If an opening appears on several rows, the last row wins.
+
+    Args:
+        df (pandas.DataFrame): Loaded BC sheet
+        tier_columns (list): Tier columns, from the top tier down
+
+    Returns:
+        tuple: (opening_ids, path_codes, paths) where opening_ids and path_codes
+            are arrays with one entry per opening, and paths[path_codes[i]] is the
+            path tuple of opening_ids[i]
+    """
+    opening_ids = extract_opening_ids(df).to_numpy()
+    if not tier_columns or len(df) == 0:
+        return np.array([], dtype=object), np.array([], dtype=np.intp), []
+
+    tiers = pd.DataFrame({col: clean_column(df[col]) for col in tier_columns})
+
+    # Depth is the position of the last non-empty tier
+    filled = tiers.ne('').to_numpy()
+    depth = np.where(filled.any(axis=1), len(tier_columns) - np.argmax(filled[:, ::-1], axis=1), 0)
+    keep = (opening_ids != '') & (depth > 0)
+
+    # Number the distinct (tiers, depth) combinations
+    keys = tiers[keep].assign(_depth=depth[keep])
+    codes, uniques = pd.factorize(pd.MultiIndex.from_frame(keys))
+    paths = [tuple(values[:values[-1]]) for values in uniques]
+
+    openings = pd.DataFrame({'opening_id': opening_ids[keep], 'code': codes})
+    openings = openings.drop_duplicates('opening_id', keep='last')
+    return openings['opening_id'].to_numpy(), openings['code'].to_numpy(), paths
+
+def build_checklist_names(df, fields=None):
+    """Build the checklist item name for every row, e.g. '(2) (Hinge) (BB1279)'.
+
+    Args:
+        df (pandas.DataFrame): Loaded BC sheet
+        fields (list, optional): Columns joined into the name. Defaults to CHECKLIST_NAME_FIELDS.
+
+    Returns:
+        pandas.Series: One name per row, '' for rows where every field is empty
+    """
+    names = pd.Series('', index=df.index, dtype=object)
+    for field in fields or CHECKLIST_NAME_FIELDS:
+        if field not in df.columns:
+            continue
+        values = clean_column(df[field])
+        part = ('(' + values + ')').where(values != '', '')
+        separator = pd.Series(np.where((names != '') & (part != ''), ' ', ''), index=df.index)
+        names = names + separator + part
+    return names
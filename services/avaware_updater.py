@@ -2,20 +2,35 @@
 
 from core.auth import AuthManager
 from utils.decorators import update_last_response, paginate_response
-from utils.input_helpers import get_user_input, prompt_user_for_xml_file
+from utils.input_helpers import get_user_input, prompt_user_for_xml_file, prompt_user_for_change_plan_file
 from processors.xml_processor import parse_xml_file, parse_hardware_items
 from config.constants import HARDWARE_FILTERS
-from utils.rate_limiter import RateLimitedExecutor
+from utils.rate_limiter import RateLimitedExecutor, fetch_concurrently
+from utils.change_plan import ChangePlan
+from utils.excel_reader import hash_file
+import os
 import re
 import time
 
 class AvawareUpdater(AuthManager):
     """Service for updating hardware schedules on Fieldwire."""
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.NEW_PREFIX = "NEW "
-        self.DELETED_PREFIX = "DELETED "
+    # Change plan operation types in the order they are applied
+    PLAN_PHASES = [
+        ('rename_task', 'task name changes'),
+        ('set_attribute', 'attribute changes'),
+        ('rename_check_item', 'checklist changes'),
+        ('create_check_item', 'hardware changes')
+    ]
+    
+    NEW_PREFIX = "NEW "
+    DELETED_PREFIX = "DELETED "
+    
+    # Opening attributes compared against the UCI task and propagated to related tasks
+    COMPARED_ATTRIBUTES = [
+        "Quantity", "Label", "NominalWidth", "NominalHeight", 
+        "Hand", "Material", "HardwareGroup"
+    ]
     
     def update_hardware_from_xml(self, project_id, user_id, task_service, attribute_service):
         """Update hardware schedules from XML file.
@@ -24,11 +39,22 @@ class AvawareUpdater(AuthManager):
         1. Gets the existing tasks and checklist items from Fieldwire
         2. Parses the new hardware schedule XML
         3. Compares the XML data with existing Fieldwire data
-        4. Updates task names and checklist items with NEW/DELETED prefixes
-        5. Propagates attribute changes from UCI to other tasks
-        6. Sorts checklist items to match the order in the XML file
+        4. Saves the changes as a change plan next to the XML file
+        5. Updates task names and checklist items with NEW/DELETED prefixes
+        6. Propagates attribute changes from UCI to other tasks
+        7. Sorts checklist items to match the order in the XML file
+        
+        A saved plan can be applied later instead of a new XML file. Operations
+        that already went through are skipped, so an interrupted run can be
+        resumed from its plan.
         """
         try:
+            # A saved plan skips parsing and comparing entirely
+            use_saved = get_user_input("\nApply a saved change plan instead of a new XML file? (y/n): ")
+            if use_saved.lower() == 'y':
+                self._apply_saved_change_plan(project_id, user_id, task_service, attribute_service)
+                return
+            
             # Step 1: Get XML file
             print("\n=== Step 1: Select XML File ===")
             file_path = prompt_user_for_xml_file()
@@ -53,20 +79,29 @@ class AvawareUpdater(AuthManager):
             # Step 3: Get existing Fieldwire data
             print("\n=== Step 3: Retrieve Fieldwire Data ===")
             
-            # Get tasks
-            existing_tasks = task_service.get_all_tasks_in_project(project_id, filter_option='active')
+            # Fetch tasks, attributes and checklist items at the same time
+            data = fetch_concurrently({
+                'tasks': lambda: task_service.get_all_tasks_in_project(project_id, filter_option='active'),
+                'task_attributes': lambda: attribute_service.get_all_task_attributes_in_project(project_id),
+                'task_type_attributes': lambda: attribute_service.get_all_task_type_attributes_in_project(project_id),
+                'checklist_items': lambda: attribute_service.get_all_task_check_items_in_project(project_id)
+            })
+            
+            missing = [name for name, value in data.items() if value is None]
+            if missing:
+                print(f"Failed to retrieve {', '.join(missing)} from Fieldwire. Aborting.")
+                return
+
+            existing_tasks = data['tasks']
             print(f"Retrieved {len(existing_tasks)} tasks from Fieldwire.")
             
-            # Get task attributes
-            task_attributes = attribute_service.get_all_task_attributes_in_project(project_id)
+            task_attributes = data['task_attributes']
             print(f"Retrieved {len(task_attributes)} task attributes from Fieldwire.")
             
-            # Get task type attributes
-            task_type_attributes = attribute_service.get_all_task_type_attributes_in_project(project_id)
+            task_type_attributes = data['task_type_attributes']
             print(f"Retrieved {len(task_type_attributes)} task type attributes from Fieldwire.")
             
-            # Get checklist items
-            checklist_items = attribute_service.get_all_task_check_items_in_project(project_id)
+            checklist_items = data['checklist_items']
             print(f"Retrieved {len(checklist_items)} checklist items from Fieldwire.")
             
             # Step 4: Organize the data
@@ -123,40 +158,22 @@ class AvawareUpdater(AuthManager):
                 task_type_attribute_map=task_type_attribute_map
             )
             
-            # Step 6: Display summary and confirm
+            # Step 6: Display summary and save the plan
             print("\n=== Step 6: Change Summary ===")
             self._display_changes_summary(changes)
             
+            plan = self._build_change_plan(project_id, changes, new_hardware_by_group, file_path)
+            plan_path = f"{os.path.splitext(file_path)[0]}_change_plan.json"
+            plan.save(plan_path)
+            print(f"\nPlanned {len(plan)} operations ({plan.merged_count} merged). Plan saved to {plan_path}")
+            
             proceed = get_user_input("\nProceed with updating Fieldwire? (y/n): ")
             if proceed.lower() != 'y':
-                print("Operation cancelled.")
-                return
-            
-            # Step 7: Apply changes
-            print("\n=== Step 7: Applying Changes ===")
-            self._apply_changes(
-                project_id=project_id,
-                user_id=user_id,
-                changes=changes,
-                task_service=task_service,
-                attribute_service=attribute_service
-            )
-            
-            # Ask for confirmation before sorting
-            sort_confirmation = get_user_input("\nProceed with sorting checklist items? (y/n): ")
-            if sort_confirmation.lower() != 'y':
-                print("Sorting skipped. Hardware schedule update complete!")
+                print("Operation cancelled. The saved plan can be applied later.")
                 return
             
-            # Step 8: Sort checklist items to match XML order
-            print("\n=== Step 8: Sorting Checklist Items ===")
-            self._sort_checklist_items(
-                project_id=project_id,
-                user_id=user_id,
-                new_hardware_by_group=new_hardware_by_group,
-                task_service=task_service,
-                attribute_service=attribute_service
-            )
+            # Step 7 and 8: Apply changes and sort
+            self._run_change_plan(project_id, user_id, plan, task_service, attribute_service)
             
             print("\nHardware schedule update complete!")
             
@@ -234,14 +251,20 @@ class AvawareUpdater(AuthManager):
             'checklist_changes': []     # Checklist item changes
         }
         
+        # Index the XML once so every lookup below is a dict access
+        openings_by_number = {opening['Number']: opening for opening in new_openings}
+        attribute_type_ids = self._get_attribute_type_ids(task_type_attribute_map)
+        new_item_sets = {group: set(items) for group, items in new_hardware_by_group.items()}
+        uca_items_by_group = {}  # Filled lazily by _update_uca_hardware_items
+        
         # Step 1: Find new openings (in XML but not in Fieldwire)
-        xml_opening_numbers = {opening['Number'] for opening in new_openings}
+        xml_opening_numbers = set(openings_by_number)
         fw_opening_numbers = set(uci_tasks.keys())
         
         # New openings that don't exist in Fieldwire
         new_opening_numbers = xml_opening_numbers - fw_opening_numbers
         for opening_number in new_opening_numbers:
-            opening = next((o for o in new_openings if o['Number'] == opening_number), None)
+            opening = openings_by_number.get(opening_number)
             if opening:
                 changes['new_openings'].append({
                     'number': opening_number,
@@ -325,7 +348,7 @@ class AvawareUpdater(AuthManager):
         
         for opening_number in common_opening_numbers:
             # Get new opening data from XML
-            new_opening = next((o for o in new_openings if o['Number'] == opening_number), None)
+            new_opening = openings_by_number.get(opening_number)
             if not new_opening:
                 continue
             
@@ -359,7 +382,8 @@ class AvawareUpdater(AuthManager):
                 attributes_by_task=attributes_by_task,
                 task_type_attribute_map=task_type_attribute_map,
                 changes=changes,
-                opening_changes=opening_changes
+                opening_changes=opening_changes,
+                attribute_type_ids=attribute_type_ids
             )
             
             # Compare hardware/checklist items
@@ -372,7 +396,9 @@ class AvawareUpdater(AuthManager):
                 attributes_by_task=attributes_by_task,
                 checklist_items_by_task=checklist_items_by_task,
                 changes=changes,
-                opening_changes=opening_changes
+                opening_changes=opening_changes,
+                new_item_sets=new_item_sets,
+                uca_items_by_group=uca_items_by_group
             )
             
             # Add to updated openings if there were any changes
@@ -381,19 +407,23 @@ class AvawareUpdater(AuthManager):
         
         return changes 
 
+    def _get_attribute_type_ids(self, task_type_attribute_map):
+        """Map the compared attribute names to their task type attribute IDs."""
+        attribute_type_ids = {}
+        for type_id, name in task_type_attribute_map.items():
+            if name in self.COMPARED_ATTRIBUTES:
+                attribute_type_ids[name] = type_id
+        return attribute_type_ids
+    
     def _compare_attributes(self, opening_number, new_opening, uci_task, uca_task, fc_task, def_task, 
-                          attributes_by_task, task_type_attribute_map, changes, opening_changes):
+                          attributes_by_task, task_type_attribute_map, changes, opening_changes,
+                          attribute_type_ids=None):
         """Compare attributes between new opening and existing tasks."""
-        relevant_attributes = [
-            "Quantity", "Label", "NominalWidth", "NominalHeight", 
-            "Hand", "Material", "HardwareGroup"
-        ]
+        relevant_attributes = self.COMPARED_ATTRIBUTES
         
         # Map attribute names to their type IDs
-        attribute_type_ids = {}
-        for type_id, name in task_type_attribute_map.items():
-            if name in relevant_attributes:
-                attribute_type_ids[name] = type_id
+        if attribute_type_ids is None:
+            attribute_type_ids = self._get_attribute_type_ids(task_type_attribute_map)
         
         # Get existing UCI attributes
         uci_attributes = attributes_by_task.get(uci_task['id'], {})
@@ -544,7 +574,8 @@ class AvawareUpdater(AuthManager):
             })
     
     def _compare_hardware_items(self, opening_number, new_opening, new_hardware_by_group, uci_task, uca_task, 
-                               attributes_by_task, checklist_items_by_task, changes, opening_changes):
+                               attributes_by_task, checklist_items_by_task, changes, opening_changes,
+                               new_item_sets=None, uca_items_by_group=None):
         """Compare hardware items between new opening and existing tasks."""
         # Get hardware group from attributes
         uci_attributes = attributes_by_task.get(uci_task['id'], {})
@@ -593,6 +624,10 @@ class AvawareUpdater(AuthManager):
         new_items = []
         if new_hardware_group and new_hardware_group in new_hardware_by_group:
             new_items = new_hardware_by_group[new_hardware_group]
+        if new_item_sets is not None:
+            new_item_set = new_item_sets.get(new_hardware_group, set())
+        else:
+            new_item_set = set(new_items)
         
         # Find deleted items (in Fieldwire but not in XML)
         for normalized_name, item_info in existing_items.items():
@@ -601,7 +636,7 @@ class AvawareUpdater(AuthManager):
                 continue
                 
             # Check if item exists in new hardware items
-            if normalized_name not in new_items:
+            if normalized_name not in new_item_set:
                 # Item was deleted
                 changes['checklist_changes'].append({
                     'task_id': uci_task['id'],
@@ -620,12 +655,13 @@ class AvawareUpdater(AuthManager):
                 })
         
         # Find new items (in XML but not in Fieldwire)
-        for new_item in new_items:
+        for position, new_item in enumerate(new_items):
             if new_item not in existing_items:
                 # Item is new
                 opening_changes['hardware_changes'].append({
                     'task_id': uci_task['id'],
                     'item_name': new_item,
+                    'position': position,
                     'old_name': None,
                     'new_name': f"{self.NEW_PREFIX}{new_item}",
                     'action': 'create'
@@ -662,11 +698,30 @@ class AvawareUpdater(AuthManager):
                 uca_task=uca_task,
                 checklist_items_by_task=checklist_items_by_task,
                 changes=changes,
-                opening_changes=opening_changes
+                opening_changes=opening_changes,
+                uca_items_by_group=uca_items_by_group
             )
     
+    def _get_uca_additional_items(self, new_items):
+        """Return the UCA items created for a hardware group, in creation order.
+        
+        Items are repeated when several hardware items call for them, matching
+        the order the filters are evaluated in.
+        """
+        additional_items = []
+        for item_name in new_items:
+            for hardware_type, filter_def in HARDWARE_FILTERS.items():
+                matched = any(
+                    self._uca_check_conditions(item_name, condition_set)
+                    for condition_set in filter_def.get('conditions', [])
+                )
+                if matched and 'create_items' in filter_def:
+                    additional_items.extend(filter_def['create_items'])
+        return additional_items
+    
     def _update_uca_hardware_items(self, opening_number, new_hardware_group, new_hardware_by_group,
-                                 uci_task, uca_task, checklist_items_by_task, changes, opening_changes):
+                                 uci_task, uca_task, checklist_items_by_task, changes, opening_changes,
+                                 uca_items_by_group=None):
         """Update UCA task hardware items based on UCI hardware and HARDWARE_FILTERS."""
         # Get checklist items for UCA task
         uca_checklist_items = checklist_items_by_task.get(uca_task['id'], [])
@@ -693,53 +748,47 @@ class AvawareUpdater(AuthManager):
         if new_hardware_group and new_hardware_group in new_hardware_by_group:
             new_items = new_hardware_by_group[new_hardware_group]
         
-        # Process each hardware item through the UCA filters
-        for item_name in new_items:
-            matching_hardware_types = []
-            for hardware_type, filter_def in HARDWARE_FILTERS.items():
-                for condition_set in filter_def.get('conditions', []):
-                    # Check if the item matches any of the conditions
-                    if self._uca_check_conditions(item_name, condition_set):
-                        matching_hardware_types.append(hardware_type)
-                        break
-            
-            # For each matching hardware type, check if we need to create items
-            for hardware_type in matching_hardware_types:
-                filter_def = HARDWARE_FILTERS[hardware_type]
+        # Run the UCA filters once per hardware group; every opening in the
+        # group gets the same additional items
+        if uca_items_by_group is None:
+            additional_items = self._get_uca_additional_items(new_items)
+        else:
+            if new_hardware_group not in uca_items_by_group:
+                uca_items_by_group[new_hardware_group] = self._get_uca_additional_items(new_items)
+            additional_items = uca_items_by_group[new_hardware_group]
+        
+        for position, additional_item in enumerate(additional_items):
+            if additional_item not in existing_items:
+                # New additional item
+                opening_changes['hardware_changes'].append({
+                    'task_id': uca_task['id'],
+                    'item_name': additional_item,
+                    'position': position,
+                    'old_name': None,
+                    'new_name': f"{self.NEW_PREFIX}{additional_item}",
+                    'action': 'create'
+                })
+            else:
+                # Additional item exists - handle prefix updates
+                item_info = existing_items[additional_item]
                 
-                # Check if we need to create additional items for this hardware type
-                if 'create_items' in filter_def:
-                    for additional_item in filter_def['create_items']:
-                        if additional_item not in existing_items:
-                            # New additional item
-                            opening_changes['hardware_changes'].append({
-                                'task_id': uca_task['id'],
-                                'item_name': additional_item,
-                                'old_name': None,
-                                'new_name': f"{self.NEW_PREFIX}{additional_item}",
-                                'action': 'create'
-                            })
-                        else:
-                            # Additional item exists - handle prefix updates
-                            item_info = existing_items[additional_item]
-                            
-                            if item_info['name'].startswith(self.NEW_PREFIX):
-                                # Remove NEW prefix for items that were previously new
-                                changes['checklist_changes'].append({
-                                    'task_id': uca_task['id'],
-                                    'item_id': item_info['id'],
-                                    'old_name': item_info['name'],
-                                    'new_name': additional_item,
-                                    'reason': 'remove_new_prefix'
-                                })
-                                
-                                opening_changes['hardware_changes'].append({
-                                    'task_id': uca_task['id'],
-                                    'item_name': additional_item,
-                                    'old_name': item_info['name'],
-                                    'new_name': additional_item,
-                                    'action': 'update'
-                                })
+                if item_info['name'].startswith(self.NEW_PREFIX):
+                    # Remove NEW prefix for items that were previously new
+                    changes['checklist_changes'].append({
+                        'task_id': uca_task['id'],
+                        'item_id': item_info['id'],
+                        'old_name': item_info['name'],
+                        'new_name': additional_item,
+                        'reason': 'remove_new_prefix'
+                    })
+                    
+                    opening_changes['hardware_changes'].append({
+                        'task_id': uca_task['id'],
+                        'item_name': additional_item,
+                        'old_name': item_info['name'],
+                        'new_name': additional_item,
+                        'action': 'update'
+                    })
     
     def _uca_check_conditions(self, text, condition_set, use_word_boundaries=True):
         """Check if text matches UCA hardware filter condition set."""
@@ -827,221 +876,209 @@ class AvawareUpdater(AuthManager):
             for change in changes['checklist_changes']:
                 print(f"  - {change['old_name']} -> {change['new_name']}")
     
-    def _apply_changes(self, project_id, user_id, changes, task_service, attribute_service):
-        """Apply the changes to Fieldwire using parallel processing."""
-        # Create executor for parallel operations
-        executor = RateLimitedExecutor()
-        
-        # Phase 1: Process task name changes in parallel
-        if changes['task_name_changes']:
-            print(f"\nApplying {len(changes['task_name_changes'])} task name changes...")
-            
-            # Prepare operations
-            task_name_operations = []
-            for change in changes['task_name_changes']:
-                def update_task_name(change=change):
-                    return task_service.update_task_name(
-                        project_id=project_id,
-                        task_id=change['task_id'],
-                        new_name=change['new_name'],
-                        last_editor_user_id=user_id
-                    )
-                task_name_operations.append((update_task_name, change))
-            
-            # Execute operations in parallel
-            operations = [op[0] for op in task_name_operations]
-            results = executor.execute_parallel(operations)
-            
-            # Process results
-            successful_updates = 0
-            if isinstance(results, bool):
-                if results:
-                    successful_updates = len(task_name_operations)
-                    for _, change in task_name_operations:
-                        print(f"  ✓ Updated task name: {change['old_name']} -> {change['new_name']}")
-                else:
-                    print("  ✗ Error: All task name updates failed")
-            else:
-                for (_, change), result in zip(task_name_operations, results):
-                    if result:
-                        successful_updates += 1
-                        print(f"  ✓ Updated task name: {change['old_name']} -> {change['new_name']}")
-                    else:
-                        print(f"  ✗ Error updating task name: {change['old_name']}")
-            
-            print(f"Task name changes: {successful_updates}/{len(task_name_operations)} successful")
+    def _build_change_plan(self, project_id, changes, new_hardware_by_group, xml_file):
+        """Turn the compared changes into a serializable change plan.
+
+        Operations that target the same thing on the same task are merged. New
+        checklist items are targeted by name and position in the hardware list,
+        so identical items on one task are each created.
+        """
+        plan = ChangePlan(project_id, metadata={
+            'xml_file': xml_file,
+            'xml_hash': hash_file(xml_file),
+            'hardware_by_group': new_hardware_by_group
+        })
         
-        # Phase 2: Process attribute changes in parallel
-        if changes['attribute_changes']:
-            print(f"\nApplying {len(changes['attribute_changes'])} attribute changes...")
-            
-            # Prepare operations
-            attribute_operations = []
-            for change in changes['attribute_changes']:
-                def update_attribute(change=change):
-                    # Both create and update actions use create_a_task_attribute_in_task
-                    return attribute_service.create_a_task_attribute_in_task(
-                        project_id=project_id,
-                        task_id=change['task_id'],
-                        task_type_attribute_id=change['attr_type_id'],
-                        attribute_value=change['new_value'],
-                        user_id=user_id
-                    )
-                attribute_operations.append((update_attribute, change))
-            
-            # Execute operations in parallel
-            operations = [op[0] for op in attribute_operations]
-            results = executor.execute_parallel(operations)
-            
-            # Process results
-            successful_updates = 0
-            if isinstance(results, bool):
-                if results:
-                    successful_updates = len(attribute_operations)
-                    for _, change in attribute_operations:
-                        if change['action'] == 'create':
-                            print(f"  ✓ Created attribute {change['attr_name']} = {change['new_value']} for task {change['task_name']}")
-                        else:
-                            print(f"  ✓ Updated attribute {change['attr_name']}: {change['old_value']} -> {change['new_value']} for task {change['task_name']}")
-                else:
-                    print("  ✗ Error: All attribute updates failed")
-            else:
-                for (_, change), result in zip(attribute_operations, results):
-                    if result:
-                        successful_updates += 1
-                        if change['action'] == 'create':
-                            print(f"  ✓ Created attribute {change['attr_name']} = {change['new_value']} for task {change['task_name']}")
-                        else:
-                            print(f"  ✓ Updated attribute {change['attr_name']}: {change['old_value']} -> {change['new_value']} for task {change['task_name']}")
-                    else:
-                        print(f"  ✗ Error updating attribute {change['attr_name']} for task {change['task_name']}")
-            
-            print(f"Attribute changes: {successful_updates}/{len(attribute_operations)} successful")
+        # Every planned task belongs to a deleted or updated opening
+        opening_by_task = {}
+        for opening in changes['deleted_openings'] + changes['updated_openings']:
+            for task_key in ('uci_task', 'uca_task', 'fc_task', 'def_task'):
+                if opening[task_key]:
+                    opening_by_task[opening[task_key]['id']] = opening['number']
         
-        # Phase 3: Process checklist changes in parallel
-        if changes['checklist_changes']:
-            print(f"\nApplying {len(changes['checklist_changes'])} checklist changes...")
-            
-            # Prepare operations
-            checklist_operations = []
-            for change in changes['checklist_changes']:
-                def update_checklist_item(change=change):
-                    return attribute_service.update_task_check_item(
-                        project_id=project_id,
-                        task_id=change['task_id'],
-                        check_item_id=change['item_id'],
-                        new_name=change['new_name'],
-                        last_editor_user_id=user_id
-                    )
-                checklist_operations.append((update_checklist_item, change))
-            
-            # Execute operations in parallel
-            operations = [op[0] for op in checklist_operations]
-            results = executor.execute_parallel(operations)
-            
-            # Process results
-            successful_updates = 0
-            if isinstance(results, bool):
-                if results:
-                    successful_updates = len(checklist_operations)
-                    for _, change in checklist_operations:
-                        print(f"  ✓ Updated checklist item: {change['old_name']} -> {change['new_name']}")
-                else:
-                    print("  ✗ Error: All checklist updates failed")
-            else:
-                for (_, change), result in zip(checklist_operations, results):
+        def context(task_id):
+            return {'opening_number': opening_by_task.get(task_id)}
+
+        for change in changes['task_name_changes']:
+            plan.add('rename_task', change['task_id'], change['task_id'], change['new_name'],
+                     old_value=change['old_name'], reason=change['reason'], **context(change['task_id']))
+
+        for change in changes['attribute_changes']:
+            plan.add('set_attribute', change['task_id'], change['attr_type_id'], change['new_value'],
+                     old_value=change['old_value'], task_name=change['task_name'],
+                     attr_name=change['attr_name'], action=change['action'], **context(change['task_id']))
+
+        for change in changes['checklist_changes']:
+            plan.add('rename_check_item', change['task_id'], change['item_id'], change['new_name'],
+                     old_value=change['old_name'], reason=change['reason'], **context(change['task_id']))
+
+        # Only new items need an API call; hardware updates are covered by checklist_changes
+        for opening in changes['updated_openings']:
+            for change in opening['hardware_changes']:
+                if change['action'] != 'create':
+                    continue
+                task_label = "UCI" if change['task_id'] == opening['uci_task']['id'] else "UCA"
+                plan.add('create_check_item', change['task_id'], (change['item_name'], change['position']),
+                         change['new_name'],
+                         task_label=task_label, **context(change['task_id']))
+
+        return plan
+
+    def _describe_plan_operation(self, op):
+        """Return a one-line description of a change plan operation."""
+        details = op['details']
+        if op['type'] == 'rename_task':
+            return f"task name: {details['old_value']} -> {op['value']}"
+        if op['type'] == 'set_attribute':
+            return f"attribute {details['attr_name']}: {details['old_value']} -> {op['value']} for task {details['task_name']}"
+        if op['type'] == 'rename_check_item':
+            return f"checklist item: {details['old_value']} -> {op['value']}"
+        if op['type'] == 'create_check_item':
+            return f"checklist item {op['value']} for {details['task_label']} task {details['opening_number']}"
+        return f"{op['type']} on task {op['task_id']}"
+
+    def _apply_saved_change_plan(self, project_id, user_id, task_service, attribute_service):
+        """Load a saved change plan and apply its remaining operations."""
+        print("\n=== Step 1: Select Change Plan ===")
+        plan_path = prompt_user_for_change_plan_file()
+        if not plan_path:
+            print("No file selected. Aborting.")
+            return
+
+        plan = ChangePlan.load(plan_path)
+        if plan.project_id != project_id:
+            print(f"Change plan was made for project {plan.project_id}, not {project_id}. Aborting.")
+            return
+
+        print("\n=== Step 2: Change Plan Summary ===")
+        print(f"Plan created {plan.created_at} from {plan.metadata.get('xml_file', 'unknown XML file')}")
+        for op_type, _ in self.PLAN_PHASES:
+            counts = plan.summary().get(op_type)
+            if counts:
+                print(f"  {op_type}: {counts['done']}/{counts['total']} already applied")
+
+        pending = plan.operations(pending_only=True)
+        if pending:
+            print(f"\nPending operations: {len(pending)}")
+            for op in pending:
+                print(f"  - {self._describe_plan_operation(op)}")
+
+        proceed = get_user_input("\nProceed with updating Fieldwire? (y/n): ")
+        if proceed.lower() != 'y':
+            print("Operation cancelled.")
+            return
+
+        self._run_change_plan(project_id, user_id, plan, task_service, attribute_service)
+        print("\nHardware schedule update complete!")
+
+    def _run_change_plan(self, project_id, user_id, plan, task_service, attribute_service):
+        """Apply a change plan, then optionally sort checklist items."""
+        print("\n=== Step 7: Applying Changes ===")
+        self._apply_change_plan(
+            project_id=project_id,
+            user_id=user_id,
+            plan=plan,
+            task_service=task_service,
+            attribute_service=attribute_service
+        )
+
+        # Ask for confirmation before sorting
+        sort_confirmation = get_user_input("\nProceed with sorting checklist items? (y/n): ")
+        if sort_confirmation.lower() != 'y':
+            print("Sorting skipped.")
+            return
+
+        # Step 8: Sort checklist items to match XML order
+        print("\n=== Step 8: Sorting Checklist Items ===")
+        self._sort_checklist_items(
+            project_id=project_id,
+            user_id=user_id,
+            new_hardware_by_group=plan.metadata['hardware_by_group'],
+            task_service=task_service,
+            attribute_service=attribute_service
+        )
+
+    def _apply_change_plan(self, project_id, user_id, plan, task_service, attribute_service):
+        """Apply the pending operations of a change plan using parallel processing.
+
+        Phases run in a fixed order (task names, attributes, checklist renames,
+        new checklist items). Each operation is journaled as soon as it succeeds,
+        so re-applying the plan only repeats operations that did not go through.
+        """
+        executor = RateLimitedExecutor()
+
+        def execute(op):
+            if op['type'] == 'rename_task':
+                return task_service.update_task_name(
+                    project_id=project_id,
+                    task_id=op['task_id'],
+                    new_name=op['value'],
+                    last_editor_user_id=user_id
+                )
+            if op['type'] == 'set_attribute':
+                # Both create and update actions use create_a_task_attribute_in_task
+                return attribute_service.create_a_task_attribute_in_task(
+                    project_id=project_id,
+                    task_id=op['task_id'],
+                    task_type_attribute_id=op['target'],
+                    attribute_value=op['value'],
+                    user_id=user_id
+                )
+            if op['type'] == 'rename_check_item':
+                return attribute_service.update_task_check_item(
+                    project_id=project_id,
+                    task_id=op['task_id'],
+                    check_item_id=op['target'],
+                    new_name=op['value'],
+                    last_editor_user_id=user_id
+                )
+            if op['type'] == 'create_check_item':
+                return attribute_service.create_a_new_task_check_item(
+                    project_id=project_id,
+                    task_id=op['task_id'],
+                    creator_user_id=user_id,
+                    last_editor_user_id=user_id,
+                    name=op['value']
+                )
+            raise ValueError(f"Unknown change plan operation: {op['type']}")
+
+        for op_type, label in self.PLAN_PHASES:
+            ops = plan.operations(op_type)
+            if not ops:
+                continue
+            pending = [op for op in ops if not plan.is_done(op['id'])]
+            if not pending:
+                print(f"\nAll {len(ops)} {label} already applied.")
+                continue
+
+            print(f"\nApplying {len(pending)} {label}...")
+            if len(pending) < len(ops):
+                print(f"  Skipping {len(ops) - len(pending)} already applied")
+
+            operations = []
+            for op in pending:
+                def apply_operation(op=op):
+                    result = execute(op)
                     if result:
-                        successful_updates += 1
-                        print(f"  ✓ Updated checklist item: {change['old_name']} -> {change['new_name']}")
-                    else:
-                        print(f"  ✗ Error updating checklist item: {change['old_name']} (ID: {change['item_id']})")
-            
-            print(f"Checklist changes: {successful_updates}/{len(checklist_operations)} successful")
-        
-        # Phase 4: Process hardware changes in parallel
-        if changes['updated_openings']:
-            print(f"\nApplying hardware changes for {len(changes['updated_openings'])} openings...")
-            
-            # Collect all hardware operations across all openings
-            all_hardware_operations = []
-            for opening in changes['updated_openings']:
-                opening_number = opening['number']
-                uci_task = opening['uci_task']
-                uca_task = opening['uca_task']
-                
-                if opening['hardware_changes']:
-                    for change in opening['hardware_changes']:
-                        task_id = change['task_id']
-                        task_name = task_id == uci_task['id'] and "UCI" or "UCA"
-                        
-                        if change['action'] == 'create':
-                            def create_checklist_item(change=change, task_id=task_id):
-                                return attribute_service.create_a_new_task_check_item(
-                                    project_id=project_id,
-                                    task_id=task_id,
-                                    creator_user_id=user_id,
-                                    last_editor_user_id=user_id,
-                                    name=change['new_name']
-                                )
-                            all_hardware_operations.append((
-                                create_checklist_item, 
-                                change, 
-                                task_name, 
-                                opening_number, 
-                                'create'
-                            ))
-                        elif change['action'] == 'update' and 'item_id' in change:
-                            def update_checklist_item(change=change, task_id=task_id):
-                                return attribute_service.update_task_check_item(
-                                    project_id=project_id,
-                                    task_id=task_id,
-                                    check_item_id=change['item_id'],
-                                    new_name=change['new_name'],
-                                    last_editor_user_id=user_id
-                                )
-                            all_hardware_operations.append((
-                                update_checklist_item, 
-                                change, 
-                                task_name, 
-                                opening_number, 
-                                'update'
-                            ))
-            
-            if all_hardware_operations:
-                # Execute operations in parallel
-                operations = [op[0] for op in all_hardware_operations]
-                results = executor.execute_parallel(operations)
-                
-                # Process results
-                successful_updates = 0
-                if isinstance(results, bool):
-                    if results:
-                        successful_updates = len(all_hardware_operations)
-                        for _, change, task_name, opening_number, action in all_hardware_operations:
-                            if action == 'create':
-                                print(f"  ✓ Created checklist item {change['new_name']} for {task_name} task {opening_number}")
-                            else:
-                                print(f"  ✓ Updated checklist item: {change['old_name']} -> {change['new_name']} for {task_name} task {opening_number}")
+                        plan.mark_done(op['id'])
+                        print(f"  ✓ Applied {self._describe_plan_operation(op)}")
                     else:
-                        print("  ✗ Error: All hardware updates failed")
-                else:
-                    for (_, change, task_name, opening_number, action), result in zip(all_hardware_operations, results):
-                        if result:
-                            successful_updates += 1
-                            if action == 'create':
-                                print(f"  ✓ Created checklist item {change['new_name']} for {task_name} task {opening_number}")
-                            else:
-                                print(f"  ✓ Updated checklist item: {change['old_name']} -> {change['new_name']} for {task_name} task {opening_number}")
-                        else:
-                            if action == 'create':
-                                print(f"  ✗ Error creating checklist item {change['new_name']} for {task_name} task {opening_number}")
-                            else:
-                                print(f"  ✗ Error updating checklist item {change['old_name']} (ID: {change.get('item_id', 'unknown')}) for {task_name} task {opening_number}")
-                
-                print(f"Hardware changes: {successful_updates}/{len(all_hardware_operations)} successful")
-        
-        print("\nAll changes applied!")
-    
+                        print(f"  ✗ Error applying {self._describe_plan_operation(op)}")
+                    return result
+                operations.append(apply_operation)
+
+            if not executor.execute_parallel(operations):
+                print(f"  ✗ Error: {label} stopped after an error")
+
+            successful_updates = sum(1 for op in pending if plan.is_done(op['id']))
+            print(f"{label.capitalize()}: {successful_updates}/{len(pending)} successful")
+
+        remaining = len(plan.operations(pending_only=True))
+        if remaining:
+            print(f"\n{remaining} operations did not complete. Apply the saved plan again to retry them.")
+        else:
+            print("\nAll changes applied!")
+
     def _sort_checklist_items(self, project_id, user_id, new_hardware_by_group, task_service, attribute_service):
         """Sort checklist items within each task to match the order in the XML file.
         
@@ -1053,18 +1090,22 @@ class AvawareUpdater(AuthManager):
             attribute_service: Attribute service instance
         """
         try:
-            # Import hardware filters
-            from config.constants import HARDWARE_FILTERS
-            
             # Step 1: Get latest tasks with attributes
-            print("Retrieving updated task data...")
-            tasks = task_service.get_all_tasks_in_project(project_id, filter_option='active')
-            
-            # Get task attributes
-            task_attributes = attribute_service.get_all_task_attributes_in_project(project_id)
-            
-            # Get task type attributes
-            task_type_attributes = attribute_service.get_all_task_type_attributes_in_project(project_id)
+            print("Retrieving updated task data and checklist items...")
+            data = fetch_concurrently({
+                'tasks': lambda: task_service.get_all_tasks_in_project(project_id, filter_option='active'),
+                'task_attributes': lambda: attribute_service.get_all_task_attributes_in_project(project_id),
+                'task_type_attributes': lambda: attribute_service.get_all_task_type_attributes_in_project(project_id),
+                'checklist_items': lambda: attribute_service.get_all_task_check_items_in_project(project_id)
+            })
+            missing = [name for name, value in data.items() if value is None]
+            if missing:
+                print(f"Failed to retrieve {', '.join(missing)} from Fieldwire. Aborting.")
+                return
+
+            tasks = data['tasks']
+            task_attributes = data['task_attributes']
+            task_type_attributes = data['task_type_attributes']
             
             # Create lookup maps
             task_type_attribute_map = {}
@@ -1090,9 +1131,8 @@ class AvawareUpdater(AuthManager):
                     attr_value = attr.get('text_value') or attr.get('number_value') or attr.get('uuid_value')
                     attributes_by_task[task_id]['HardwareGroup'] = attr_value
             
-            # Step 2: Get latest checklist items
-            print("Retrieving updated checklist items...")
-            checklist_items = attribute_service.get_all_task_check_items_in_project(project_id)
+            # Step 2: Group the latest checklist items
+            checklist_items = data['checklist_items']
             
             # Group checklist items by task
             checklist_items_by_task = {}
@@ -1102,328 +1142,79 @@ class AvawareUpdater(AuthManager):
                     checklist_items_by_task[task_id] = []
                 checklist_items_by_task[task_id].append(item)
             
-            # Step 3: Sort checklist items for each task
-            print("Sorting checklist items...")
+            # Step 3: Plan the order of every task before any API call
+            print("Planning checklist order...")
+            sort_plan = self._plan_checklist_sort(
+                tasks, attributes_by_task, checklist_items_by_task, new_hardware_by_group
+            )
+            
+            if not sort_plan:
+                print("All checklists are already in order.")
+                return
+            
+            total_moves = sum(len(entry['moved_items']) for entry in sort_plan)
+            print(f"\nSort plan: {len(sort_plan)} tasks need reordering, {total_moves} items move")
+            for entry in sort_plan:
+                print(f"  - {entry['task_name']}: move {len(entry['moved_items'])} of {entry['item_count']} items")
+            
+            # Step 4: Apply the plan
             tasks_sorted = 0
             items_updated = 0
             
-            # Helper function to identify hardware type from item name
-            def identify_hardware_type(item_name):
-                """Identify hardware type based on item name using HARDWARE_FILTERS."""
-                item_name_lower = item_name.lower()
-                
-                for hardware_type, config in HARDWARE_FILTERS.items():
-                    conditions = config.get('conditions', [])
-                    
-                    for condition in conditions:
-                        matches_any = True
-                        matches_all = True
-                        matches_none = True
-                        
-                        if 'any' in condition:
-                            matches_any = any(keyword.lower() in item_name_lower for keyword in condition['any'])
-                        
-                        if 'all' in condition:
-                            matches_all = all(keyword.lower() in item_name_lower for keyword in condition['all'])
-                        
-                        if 'none' in condition:
-                            matches_none = not any(keyword.lower() in item_name_lower for keyword in condition['none'])
-                        
-                        if matches_any and matches_all and matches_none:
-                            return hardware_type, config.get('create_items', [])
-                
-                return None, []
-            
-            # Create a mapping function to match checklist items to hardware items
-            def get_base_name(item_name):
-                # Remove NEW or DELETED prefix if present
-                if item_name.startswith('NEW '):
-                    item_name = item_name[4:]
-                elif item_name.startswith('DELETED '):
-                    item_name = item_name[8:]
-                return item_name
-            
-            # Process tasks
-            for task in tasks:
-                task_id = task['id']
-                task_name = task['name']
-                
-                # Skip FC and DEF tasks
-                if task_name.startswith('FC ') or task_name.startswith('DEF '):
-                    continue
-                
-                # Skip if task has no checklist items
-                if task_id not in checklist_items_by_task or not checklist_items_by_task[task_id]:
-                    continue
-                
-                # Skip if task has no hardware group attribute
-                if task_id not in attributes_by_task or 'HardwareGroup' not in attributes_by_task[task_id]:
-                    continue
-                
-                # Get hardware group for this task
-                hardware_group = attributes_by_task[task_id]['HardwareGroup']
-                
-                # Skip if hardware group not in XML data
-                if hardware_group not in new_hardware_by_group:
-                    continue
-                
-                # Get hardware items in XML order
-                hardware_items = new_hardware_by_group[hardware_group]
-                
-                # Get checklist items for this task
-                task_checklist_items = checklist_items_by_task[task_id]
-                
-                # Work with the full list - don't separate DELETED items yet
-                print(f"Processing {len(task_checklist_items)} total items in task: {task_name}")
-                
-                # Count DELETED vs non-DELETED for info
-                deleted_count = sum(1 for item in task_checklist_items if item['name'].startswith('DELETED'))
-                non_deleted_count = len(task_checklist_items) - deleted_count
-                print(f"Found {deleted_count} DELETED items and {non_deleted_count} non-DELETED items")
-                
-                # Skip if no non-DELETED items
-                if non_deleted_count == 0:
-                    continue
-                
-                # Create a list of only non-DELETED items for sorting purposes
-                non_deleted_items = [item for item in task_checklist_items if not item['name'].startswith('DELETED')]
-                
-                # Determine the final sorted order for non-DELETED items
-                sorted_non_deleted_items = []
-                
-                # Special handling for UCA tasks
-                if task_name.startswith('UCA '):
-                    # Group items by their parent hardware item
-                    hardware_groups = []
-                    
-                    # First pass: identify hardware items and their positions
-                    hardware_positions = {}
-                    for i, item in enumerate(non_deleted_items):
-                        base_name = get_base_name(item['name'])
-                        
-                        # Check if this is a hardware item (matches format in XML)
-                        is_hardware_item = any(hw_item == base_name for hw_item in hardware_items)
-                        
-                        if is_hardware_item:
-                            hardware_positions[item['id']] = i
-                    
-                    # Second pass: group items with their hardware parent
-                    for hw_id, hw_pos in hardware_positions.items():
-                        # Find the hardware item
-                        hw_item = next(item for item in non_deleted_items if item['id'] == hw_id)
-                        base_name = get_base_name(hw_item['name'])
-                        
-                        # Create a new group with this hardware item
-                        current_group = [hw_item]
-                        
-                        # Identify hardware type and expected additional items
-                        hardware_type, expected_items = identify_hardware_type(base_name)
-                        
-                        # Find additional items that belong to this hardware item
-                        # They should be immediately after the hardware item
-                        pos = hw_pos + 1
-                        while pos < len(non_deleted_items):
-                            next_item = non_deleted_items[pos]
-                            next_base_name = get_base_name(next_item['name'])
-                            
-                            # If this is another hardware item, stop
-                            if next_item['id'] in hardware_positions:
-                                break
-                                
-                            # If this matches an expected additional item, add it
-                            if hardware_type and any(expected == next_base_name for expected in expected_items):
-                                current_group.append(next_item)
-                                
-                            pos += 1
-                            
-                            # If we've found all expected items, stop looking
-                            if len(current_group) - 1 >= len(expected_items):
-                                break
-                        
-                        hardware_groups.append(current_group)
-                    
-                    # Sort hardware groups based on XML order
-                    def get_hardware_position(group):
-                        if not group:
-                            return float('inf')
-                        
-                        # Get the hardware item (first item in the group)
-                        hardware_item = group[0]
-                        base_name = get_base_name(hardware_item['name'])
-                        
-                        # Find its position in the XML
-                        return next((idx for idx, hw_item in enumerate(hardware_items) 
-                                    if hw_item == base_name), float('inf'))
-                    
-                    # Sort groups by their hardware item's position in XML
-                    hardware_groups.sort(key=get_hardware_position)
-                    
-                    # Flatten the sorted groups into our result list
-                    for group in hardware_groups:
-                        sorted_non_deleted_items.extend(group)
-                    
-                    # Add any remaining non-hardware items at the end
-                    # (items not associated with any hardware group)
-                    all_grouped_ids = set(item['id'] for group in hardware_groups for item in group)
-                    remaining_items = [item for item in non_deleted_items if item['id'] not in all_grouped_ids]
-                    sorted_non_deleted_items.extend(remaining_items)
-                
-                # Standard sorting for UCI tasks
-                elif task_name.startswith('UCI '):
-                    # Create a list of (item, position) pairs for sorting
-                    items_with_positions = []
-                    for item in non_deleted_items:
-                        base_name = get_base_name(item['name'])
-                        
-                        # Find position in XML order
-                        position = next((idx for idx, hw_item in enumerate(hardware_items) 
-                                        if hw_item == base_name), float('inf'))
-                        
-                        # Debug output for sorting
-                        print(f"  Item: {item['name']}, Base name: {base_name}, Position: {position if position != float('inf') else 'Not found'}")
-                        
-                        items_with_positions.append((item, position))
-                    
-                    # Sort by position
-                    items_with_positions.sort(key=lambda x: x[1])
-                    
-                    # Extract just the items
-                    sorted_non_deleted_items = [item for item, _ in items_with_positions]
-                    
-                    # Debug output for sorted items
-                    print("\nSorted items (before adding DELETED items):")
-                    for i, item in enumerate(sorted_non_deleted_items):
-                        print(f"  {i}: {item['name']}")
-                
-                # Create the final sorted order: sorted non-DELETED items + DELETED items at the end
-                final_sorted_order = []
-                
-                # Add sorted non-DELETED items first
-                final_sorted_order.extend(sorted_non_deleted_items)
-                
-                # Add DELETED items at the end (preserve their relative order from original list)
-                deleted_items = [item for item in task_checklist_items if item['name'].startswith('DELETED')]
-                final_sorted_order.extend(deleted_items)
-                
-                # Debug output for final sorted items
-                print("\nFinal sorted items (with DELETED items at the end):")
-                for i, item in enumerate(final_sorted_order):
-                    print(f"  {i}: {item['name']} (ID: {item['id']})")
-                
-                # Debug output for current order
-                print("\nCurrent order in Fieldwire:")
-                for i, item in enumerate(task_checklist_items):
-                    print(f"  {i}: {item['name']} (ID: {item['id']})")
-                
-                # Now we have the final desired order in final_sorted_order
-                # Check if any reordering is needed by comparing item names in order
-                current_names = [item['name'] for item in task_checklist_items]
-                desired_names = [item['name'] for item in final_sorted_order]
-                
-                if current_names == desired_names:
-                    print(f"Task {task_name} is already properly sorted")
-                    continue
-                
-                # We need to delete all items and recreate them in the correct order
-                print(f"Reordering {len(final_sorted_order)} items in task {task_name}")
-                print("Current order:", [item['name'] for item in task_checklist_items])
-                print("Desired order:", [item['name'] for item in final_sorted_order])
-                
-                
-                # Step 1: Delete all existing checklist items in parallel
-                print(f"\nDeleting {len(task_checklist_items)} existing checklist items...")
+            for entry in sort_plan:
+                task_id = entry['task_id']
+                task_name = entry['task_name']
+                kept_items = entry['kept_items']
+                moved_items = entry['moved_items']
+                print(f"\nReordering task {task_name}: {len(kept_items)} items stay in place, {len(moved_items)} items move")
                 
-                # Create executor for parallel deletion
-                delete_executor = RateLimitedExecutor()
+                # Recreate displaced items one at a time so they are appended in order
+                print(f"\nRecreating {len(moved_items)} checklist items in sorted order...")
+                recreated_items = []
+                for position, item in enumerate(moved_items, len(kept_items) + 1):
+                    # Preserve original creator, last editor and state
+                    created = attribute_service.create_a_new_task_check_item(
+                        project_id=project_id,
+                        task_id=task_id,
+                        creator_user_id=item.get('creator_user_id', user_id),
+                        last_editor_user_id=item.get('last_editor_user_id', user_id),
+                        name=item['name'],
+                        state=item.get('state')
+                    )
+                    if not created:
+                        # Later items would land out of order, so stop here; originals are kept
+                        print(f"  ✗ Failed to create: {item['name']} - stopping reorder for this task")
+                        break
+                    recreated_items.append(item)
+                    print(f"  ✓ Created {position}/{entry['item_count']}: {item['name']} (state: {item.get('state') or 'empty'})")
                 
-                # Prepare deletion operations
+                # Then delete the originals of recreated items in parallel (order no longer matters)
+                print(f"\nDeleting {len(recreated_items)} original checklist items...")
+                delete_results = {}
                 delete_operations = []
-                for item in task_checklist_items:
+                for item in recreated_items:
                     def delete_item(item_id=item['id']):
-                        return attribute_service.delete_task_check_item(
+                        delete_results[item_id] = attribute_service.delete_task_check_item(
                             project_id=project_id,
                             check_item_id=item_id
                         )
-                    delete_operations.append((delete_item, item))
+                        return delete_results[item_id]
+                    delete_operations.append(delete_item)
                 
-                # Execute deletions in parallel
-                operations = [op[0] for op in delete_operations]
-                delete_results = delete_executor.execute_parallel(operations)
+                delete_executor = RateLimitedExecutor()
+                delete_executor.execute_parallel(delete_operations)
                 
-                # Process deletion results
                 items_deleted = 0
-                if isinstance(delete_results, bool):
-                    if delete_results:
-                        items_deleted = len(delete_operations)
-                        for _, item in delete_operations:
-                            print(f"  ✓ Deleted: {item['name']} (ID: {item['id']})")
-                    else:
-                        print("  ✗ Error: All deletions failed")
-                else:
-                    for (_, item), result in zip(delete_operations, delete_results):
-                        if result:
-                            items_deleted += 1
-                            print(f"  ✓ Deleted: {item['name']} (ID: {item['id']})")
-                        else:
-                            print(f"  ✗ Failed to delete: {item['name']} (ID: {item['id']})")
-                
-                print(f"Successfully deleted {items_deleted} out of {len(task_checklist_items)} items")
-                
-                # Step 2: Recreate items in the correct order in parallel
-                print(f"\nRecreating {len(final_sorted_order)} checklist items in sorted order...")
-                
-                # Create executor for parallel creation
-                create_executor = RateLimitedExecutor()
-                
-                # Prepare creation operations
-                create_operations = []
-                for i, item in enumerate(final_sorted_order):
-                    # Preserve original creator and last editor user IDs if available
-                    creator_user_id = item.get('creator_user_id', user_id)
-                    last_editor_user_id = item.get('last_editor_user_id', user_id)
-                    state = item.get('state')  # Preserve original state
-                    
-                    def create_item(task_id=task_id, creator_user_id=creator_user_id, 
-                                  last_editor_user_id=last_editor_user_id, 
-                                  name=item['name'], state=state):
-                        return attribute_service.create_a_new_task_check_item(
-                            project_id=project_id,
-                            task_id=task_id,
-                            creator_user_id=creator_user_id,
-                            last_editor_user_id=last_editor_user_id,
-                            name=name,
-                            state=state
-                        )
-                    create_operations.append((create_item, item, i + 1))
-                
-                # Execute creations in parallel
-                operations = [op[0] for op in create_operations]
-                create_results = create_executor.execute_parallel(operations)
-                
-                # Process creation results
-                items_created = 0
-                if isinstance(create_results, bool):
-                    if create_results:
-                        items_created = len(create_operations)
-                        for _, item, position in create_operations:
-                            state = item.get('state')
-                            print(f"  ✓ Created {position}/{len(final_sorted_order)}: {item['name']} (state: {state or 'empty'})")
+                for item in recreated_items:
+                    if delete_results.get(item['id']):
+                        items_deleted += 1
                     else:
-                        print("  ✗ Error: All creations failed")
-                else:
-                    for (_, item, position), result in zip(create_operations, create_results):
-                        if result:
-                            items_created += 1
-                            state = item.get('state')
-                            print(f"  ✓ Created {position}/{len(final_sorted_order)}: {item['name']} (state: {state or 'empty'})")
-                        else:
-                            print(f"  ✗ Failed to create: {item['name']}")
-                
-                print(f"Successfully created {items_created} out of {len(final_sorted_order)} items")
+                        print(f"  ✗ Failed to delete original: {item['name']} (ID: {item['id']}) - task now has a duplicate")
                 
+                items_created = len(recreated_items)
                 tasks_sorted += 1
                 items_updated += items_created
-                print(f"Completed sorting task {task_name}: {items_deleted} items deleted, {items_created} items recreated")
+                print(f"Completed sorting task {task_name}: {items_created} items moved, {items_deleted} originals deleted")
             
             print(f"Sorting complete. {tasks_sorted} tasks sorted with {items_updated} items updated.")
             
@@ -1431,6 +1222,174 @@ class AvawareUpdater(AuthManager):
             print(f"Error during checklist item sorting: {str(e)}")
             print("Some items may not be properly sorted.")
     
+    def _plan_checklist_sort(self, tasks, attributes_by_task, checklist_items_by_task, new_hardware_by_group):
+        """Compute the target checklist order for every UCI and UCA task in one pass.
+        
+        XML positions are indexed once per hardware group and hardware types are
+        identified once per distinct item name, so planning is linear in the number
+        of check items. Tasks that are already in order are left out of the plan.
+        
+        Args:
+            tasks: Active tasks in the project
+            attributes_by_task: Task ID -> {'HardwareGroup': value}
+            checklist_items_by_task: Task ID -> check items in current API order
+            new_hardware_by_group: Hardware group -> checklist names in XML order
+            
+        Returns:
+            list: Plan entries with 'task_id', 'task_name', 'item_count',
+                'kept_items' and 'moved_items'
+        """
+        # First XML position of each checklist name, per hardware group
+        position_maps = {}
+        for group, hardware_items in new_hardware_by_group.items():
+            positions = {}
+            for idx, name in enumerate(hardware_items):
+                positions.setdefault(name, idx)
+            position_maps[group] = positions
+        
+        # Additional items expected after each hardware line, by base name
+        expected_items_cache = {}
+        def expected_items_for(base_name):
+            if base_name not in expected_items_cache:
+                expected_items_cache[base_name] = self._identify_checklist_hardware_type(base_name)[1]
+            return expected_items_cache[base_name]
+        
+        def get_base_name(item_name):
+            # Remove NEW or DELETED prefix if present
+            if item_name.startswith(self.NEW_PREFIX):
+                return item_name[len(self.NEW_PREFIX):]
+            if item_name.startswith(self.DELETED_PREFIX):
+                return item_name[len(self.DELETED_PREFIX):]
+            return item_name
+        
+        sort_plan = []
+        for task in tasks:
+            task_id = task['id']
+            task_name = task['name']
+            
+            # Only UCI and UCA checklists follow the XML order
+            is_uca = task_name.startswith('UCA ')
+            if not is_uca and not task_name.startswith('UCI '):
+                continue
+            
+            task_checklist_items = checklist_items_by_task.get(task_id)
+            if not task_checklist_items:
+                continue
+            
+            hardware_group = attributes_by_task.get(task_id, {}).get('HardwareGroup')
+            positions = position_maps.get(hardware_group)
+            if positions is None:
+                continue
+            
+            non_deleted_items = [item for item in task_checklist_items if not item['name'].startswith('DELETED')]
+            if not non_deleted_items:
+                continue
+            deleted_items = [item for item in task_checklist_items if item['name'].startswith('DELETED')]
+            base_names = [get_base_name(item['name']) for item in non_deleted_items]
+            
+            if is_uca:
+                # Group each hardware line with the additional items that follow it
+                hardware_indexes = [i for i, base_name in enumerate(base_names) if base_name in positions]
+                hardware_index_set = set(hardware_indexes)
+                hardware_groups = []
+                grouped_indexes = set()
+                
+                for hw_index in hardware_indexes:
+                    group = [hw_index]
+                    expected_items = expected_items_for(base_names[hw_index])
+                    expected_set = set(expected_items)
+                    
+                    pos = hw_index + 1
+                    while pos < len(non_deleted_items):
+                        # If this is another hardware item, stop
+                        if pos in hardware_index_set:
+                            break
+                        if base_names[pos] in expected_set:
+                            group.append(pos)
+                        pos += 1
+                        # If we've found all expected items, stop looking
+                        if len(group) - 1 >= len(expected_items):
+                            break
+                    
+                    hardware_groups.append((positions[base_names[hw_index]], group))
+                    grouped_indexes.update(group)
+                
+                # Stable sort keeps groups for the same XML line in their current order
+                hardware_groups.sort(key=lambda group: group[0])
+                sorted_non_deleted_items = [
+                    non_deleted_items[i] for _, group in hardware_groups for i in group
+                ]
+                
+                # Items not associated with any hardware line go at the end
+                sorted_non_deleted_items.extend(
+                    item for i, item in enumerate(non_deleted_items) if i not in grouped_indexes
+                )
+            else:
+                # UCI: sort by XML position, unknown items last
+                order = sorted(
+                    range(len(non_deleted_items)),
+                    key=lambda i: positions.get(base_names[i], float('inf'))
+                )
+                sorted_non_deleted_items = [non_deleted_items[i] for i in order]
+            
+            # DELETED items stay at the end in their current relative order
+            final_sorted_order = sorted_non_deleted_items + deleted_items
+            
+            if [item['id'] for item in final_sorted_order] == [item['id'] for item in task_checklist_items]:
+                continue
+            
+            kept_items, moved_items = self._plan_checklist_reorder(task_checklist_items, final_sorted_order)
+            sort_plan.append({
+                'task_id': task_id,
+                'task_name': task_name,
+                'item_count': len(final_sorted_order),
+                'kept_items': kept_items,
+                'moved_items': moved_items
+            })
+        
+        return sort_plan
+    
+    def _identify_checklist_hardware_type(self, item_name):
+        """Identify the hardware type of a checklist item using HARDWARE_FILTERS.
+        
+        Returns:
+            tuple: (hardware_type, create_items) or (None, []) if nothing matches
+        """
+        item_name_lower = item_name.lower()
+        
+        for hardware_type, config in HARDWARE_FILTERS.items():
+            for condition in config.get('conditions', []):
+                if 'any' in condition and not any(keyword.lower() in item_name_lower for keyword in condition['any']):
+                    continue
+                if 'all' in condition and not all(keyword.lower() in item_name_lower for keyword in condition['all']):
+                    continue
+                if 'none' in condition and any(keyword.lower() in item_name_lower for keyword in condition['none']):
+                    continue
+                return hardware_type, config.get('create_items', [])
+        
+        return None, []
+    
+    def _plan_checklist_reorder(self, current_items, desired_items):
+        """Plan the fewest check item moves that turn the current order into the desired one.
+        
+        Fieldwire always appends new check items to the end of a checklist, so an item
+        can only stay in place if it belongs to the leading run of the desired order
+        that already appears, in sequence, in the current list. Every other item is
+        recreated after them in desired order.
+        
+        Args:
+            current_items: Check items in their current API order
+            desired_items: The same check items in the desired order
+            
+        Returns:
+            tuple: (kept_items, moved_items), with moved_items in desired order
+        """
+        matched = 0
+        for item in current_items:
+            if matched < len(desired_items) and item['id'] == desired_items[matched]['id']:
+                matched += 1
+        return desired_items[:matched], desired_items[matched:]
+    
     def _create_hardware_by_group(self, hardware_items):
         """Create a map of hardware items by group name."""
         hardware_by_group = {}
@@ -4,8 +4,15 @@ from core.auth import AuthManager
 from utils.decorators import paginate_response, update_last_response
 from utils.input_helpers import get_user_input, prompt_user_for_xml_file, prompt_user_for_excel_file
 from processors.xml_processor import parse_xml_file, parse_hardware_items
+from processors.bc_workbook import (
+    CHECKLIST_NAME_FIELDS, TIER_COLUMNS, load_bc_workbook, find_tier_columns,
+    extract_opening_ids, extract_location_paths, build_checklist_names
+)
 from config.constants import HARDWARE_FILTERS, FC_CHECKLIST_ITEMS
-from utils.rate_limiter import RateLimitedExecutor
+from utils.rate_limiter import RateLimitedExecutor, fetch_concurrently
+from utils.excel_writer import create_workbook, write_sheet
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import pandas as pd
 from tqdm import tqdm
 from utils.task_helpers import compare_openings_with_tasks
@@ -598,9 +605,9 @@ class HardwareService(AuthManager):
                     return True
                 return False
 
-        # Get UCA team ID
+        # Check the UCA team exists before fetching the project data
         print("\n=== Getting UCA Team ID ===")
-        print("Retrieving teams from project...")
+        print("Retrieving teams...")
         teams = attribute_service.get_all_teams_in_project(project_id)
         if teams is None:
             print("Failed to retrieve teams from project")
@@ -616,14 +623,25 @@ class HardwareService(AuthManager):
         uca_team_id = uca_team['id']
         print(f"Found UCA team (ID: {uca_team_id})")
 
-        # Get all tasks, checklist items, and task attributes
-        print("\nRetrieving project data...")
-        tasks = task_service.get_all_tasks_in_project(project_id, filter_option='active')
-        check_items = attribute_service.get_all_task_check_items_in_project(project_id)
-        task_attributes = attribute_service.get_all_task_attributes_in_project(project_id)
+        # Get all tasks, checklist items, and task attributes together; they are independent
+        print("Retrieving project data...")
+        data = fetch_concurrently({
+            'tasks': lambda: task_service.get_all_tasks_in_project(project_id, filter_option='active'),
+            'check_items': lambda: attribute_service.get_all_task_check_items_in_project(project_id),
+            'task_attributes': lambda: attribute_service.get_all_task_attributes_in_project(project_id),
+            'task_type_attributes': lambda: attribute_service.get_all_task_type_attributes_in_project(project_id)
+        })
+        missing = [name for name, value in data.items() if value is None]
+        if missing:
+            print(f"Failed to retrieve {', '.join(missing)} from project")
+            return
+
+        tasks = data['tasks']
+        check_items = data['check_items']
+        task_attributes = data['task_attributes']
 
         # Get task type attributes and create mapping
-        task_type_attributes = attribute_service.get_all_task_type_attributes_in_project(project_id)
+        task_type_attributes = data['task_type_attributes']
         task_type_attribute_map = {}
         for attr in task_type_attributes:
             task_type_attribute_map[attr['id']] = attr['name']
@@ -1027,8 +1045,14 @@ class HardwareService(AuthManager):
         try:
             # Step 1: Validate Teams
             print("\n=== Getting Required Teams ===")
-            print("Retrieving teams from project...")
-            teams = attribute_service.get_all_teams_in_project(project_id)
+            print("Retrieving teams and statuses...")
+            
+            # Teams and statuses are validated before the project data is fetched
+            setup = fetch_concurrently({
+                'teams': lambda: attribute_service.get_all_teams_in_project(project_id),
+                'statuses': lambda: self.get_statuses_for_project_id(project_id)
+            })
+            teams = setup['teams']
             if teams is None:
                 print("Failed to retrieve teams from project")
                 return
@@ -1053,8 +1077,7 @@ class HardwareService(AuthManager):
 
             # Step 1.5: Get and validate "Commissioned" status
             print("\n=== Getting Commissioned Status ===")
-            print("Retrieving statuses from project...")
-            statuses = self.get_statuses_for_project_id(project_id)
+            statuses = setup['statuses']
             if statuses is None:
                 print("Failed to retrieve statuses from project")
                 return
@@ -1087,14 +1110,25 @@ class HardwareService(AuthManager):
             commissioned_status_id = commissioned_status['id']
             print(f"Found commissioned status (ID: {commissioned_status_id}, Name: '{commissioned_status['name']}')")
 
-            # Step 2: Get all tasks, checklist items, and task attributes
-            print("\nRetrieving project data...")
-            tasks = task_service.get_all_tasks_in_project(project_id, filter_option='active')
-            check_items = attribute_service.get_all_task_check_items_in_project(project_id)
-            task_attributes = attribute_service.get_all_task_attributes_in_project(project_id)
+            # Step 2: Get all tasks, checklist items, and task attributes together
+            print("Retrieving project data...")
+            data = fetch_concurrently({
+                'tasks': lambda: task_service.get_all_tasks_in_project(project_id, filter_option='active'),
+                'check_items': lambda: attribute_service.get_all_task_check_items_in_project(project_id),
+                'task_attributes': lambda: attribute_service.get_all_task_attributes_in_project(project_id),
+                'task_type_attributes': lambda: attribute_service.get_all_task_type_attributes_in_project(project_id)
+            })
+            missing = [name for name, value in data.items() if value is None]
+            if missing:
+                print(f"Failed to retrieve {', '.join(missing)} from project")
+                return
+
+            tasks = data['tasks']
+            check_items = data['check_items']
+            task_attributes = data['task_attributes']
 
             # Get task type attributes and create mapping
-            task_type_attributes = attribute_service.get_all_task_type_attributes_in_project(project_id)
+            task_type_attributes = data['task_type_attributes']
             task_type_attribute_map = {}
             for attr in task_type_attributes:
                 task_type_attribute_map[attr['id']] = attr['name']
@@ -1541,30 +1575,10 @@ class HardwareService(AuthManager):
             print("\n=== Step 4: Parse Excel File ===")
             print("Loading Excel file...")
             try:
-                # Read the entire Sheet0
-                xl = pd.ExcelFile(file_path)
-                if "Sheet0" not in xl.sheet_names:
-                    print("Error: Sheet 'Sheet0' not found in Excel file")
-                    print("Available sheets:", xl.sheet_names)
+                # Only the Opening ID and checklist name columns are needed
+                df = load_bc_workbook(file_path, columns=CHECKLIST_NAME_FIELDS)
+                if df is None:
                     return
-                
-                df = pd.read_excel(file_path, sheet_name="Sheet0", dtype=str)
-                
-                # Case-insensitive check for Opening ID column
-                opening_id_col = None
-                for col in df.columns:
-                    if col is not None and str(col).lower() == 'opening id':
-                        opening_id_col = col
-                        break
-                
-                if not opening_id_col:
-                    print("Error: Required column 'Opening ID' (case insensitive) not found in the Excel file")
-                    print("Available columns:", ", ".join(str(c) if c is not None else 'None' for c in df.columns))
-                    return
-                
-                # Rename the column to our expected format if it's different
-                if opening_id_col != 'Opening ID':
-                    df = df.rename(columns={opening_id_col: 'Opening ID'})
                     
             except Exception as sheet_error:
                 print(f"Error reading Excel file: {str(sheet_error)}")
@@ -1582,15 +1596,9 @@ class HardwareService(AuthManager):
             print("\nFound columns:", ", ".join(str(c) if c is not None else 'None' for c in df.columns))
 
             # Step 5: Get unique Opening IDs from the Excel file
-            unique_opening_ids = set()
-            empty_opening_ids = 0
-            
-            for index, row in df.iterrows():
-                opening_id = str(row['Opening ID']).strip()
-                if opening_id:
-                    unique_opening_ids.add(opening_id)
-                else:
-                    empty_opening_ids += 1
+            opening_ids = extract_opening_ids(df)
+            unique_opening_ids = set(opening_ids[opening_ids != ''])
+            empty_opening_ids = int((opening_ids == '').sum())
             
             print(f"\nFound {len(unique_opening_ids)} unique Opening IDs in the Excel file")
             if empty_opening_ids > 0:
@@ -1709,27 +1717,14 @@ class HardwareService(AuthManager):
             # Step 9: Process Excel rows and group by tasks
             print("\n=== Processing Excel Data for Checklist Items ===")
             task_checklist_items = {}  # {task_id: [checklist_items]}
-            unmatched_openings = set()
-            
-            # Using tqdm for progress tracking
             total_rows = len(df)
-            for index, row in tqdm(df.iterrows(), total=total_rows, desc="Processing rows"):
-                opening_id = str(row['Opening ID']).strip()
-                if not opening_id or opening_id not in task_map:
-                    if opening_id.strip():  # Only track non-empty IDs
-                        unmatched_openings.add(opening_id)
-                    continue
-
-                # Build checklist item name
-                name_parts = []
-                for field in ['Qty', 'Description', 'Part Number', 'Hand', 'Item']:
-                    if field in df.columns and pd.notna(row[field]) and str(row[field]).strip():
-                        name_parts.append(f"({str(row[field]).strip()})")
-
-                if not name_parts:  # Skip if all fields are empty
-                    continue
-
-                checklist_name = " ".join(name_parts)
+            checklist_names = build_checklist_names(df)
+            matched = opening_ids.isin(list(task_map))
+            unmatched_openings = set(opening_ids[~matched & (opening_ids != '')])
+            
+            # Skip rows where all name fields are empty
+            rows = matched & (checklist_names != '')
+            for opening_id, checklist_name in zip(opening_ids[rows], checklist_names[rows]):
                 task_id = task_map[opening_id]['id']
 
                 # Skip if checklist item already exists
@@ -1850,44 +1845,13 @@ class HardwareService(AuthManager):
             print("\n=== Step 3: Parse Excel File ===")
             print("Loading Excel file...")
             try:
-                # Read the entire Sheet0
-                xl = pd.ExcelFile(file_path)
-                if "Sheet0" not in xl.sheet_names:
-                    print("Error: Sheet 'Sheet0' not found in Excel file")
-                    print("Available sheets:", xl.sheet_names)
+                # Read the entire Sheet0; every column may map to an attribute
+                df = load_bc_workbook(file_path)
+                if df is None:
                     return
                 
-                df = pd.read_excel(file_path, sheet_name="Sheet0", dtype=str)
-                
-                # Case-insensitive check for Opening ID column
-                opening_id_col = None
-                for col in df.columns:
-                    if col is not None and str(col).lower() == 'opening id':
-                        opening_id_col = col
-                        break
-                
-                if not opening_id_col:
-                    print("Error: Required column 'Opening ID' (case insensitive) not found in the Excel file")
-                    print("Available columns:", ", ".join(str(c) if c is not None else 'None' for c in df.columns))
-                    return
+                tier_columns = find_tier_columns(df)
                 
-                # Rename the column to our expected format if it's different
-                if opening_id_col != 'Opening ID':
-                    df = df.rename(columns={opening_id_col: 'Opening ID'})
-                    
-                # Check for tier columns
-                tier_columns = []
-                for i in range(1, 6):
-                    tier_col = None
-                    tier_name = f"Tier {i}"
-                    for col in df.columns:
-                        if col is not None and str(col).lower() == tier_name.lower():
-                            tier_col = col
-                            break
-                    
-                    if tier_col:
-                        tier_columns.append(tier_col)
-                    
                 print(f"Successfully loaded {len(df)} rows from Excel file")
                 print("\nFound columns:", ", ".join(str(c) if c is not None else 'None' for c in df.columns))
                 
@@ -2389,45 +2353,16 @@ class HardwareService(AuthManager):
                 print("\n=== Step 3: Parse Excel File ===")
                 print("Loading Excel file...")
                 try:
-                    # Read the entire Sheet0
-                    xl = pd.ExcelFile(file_path)
-                    if "Sheet0" not in xl.sheet_names:
-                        print("Error: Sheet 'Sheet0' not found in Excel file")
-                        print("Available sheets:", xl.sheet_names)
+                    # Only the Opening ID and Tier columns are needed
+                    df = load_bc_workbook(file_path, columns=[])
+                    if df is None:
                         return
                     
-                    df = pd.read_excel(file_path, sheet_name="Sheet0", dtype=str)
-                    
-                    # Case-insensitive check for Opening ID column
-                    opening_id_col = None
-                    for col in df.columns:
-                        if col is not None and str(col).lower() == 'opening id':
-                            opening_id_col = col
-                            break
-                    
-                    if not opening_id_col:
-                        print("Error: Required column 'Opening ID' (case insensitive) not found in the Excel file")
-                        print("Available columns:", ", ".join(str(c) if c is not None else 'None' for c in df.columns))
-                        return
-                    
-                    # Rename the column to our expected format if it's different
-                    if opening_id_col != 'Opening ID':
-                        df = df.rename(columns={opening_id_col: 'Opening ID'})
-                    
                     # Find tier columns if not provided
                     if tier_columns is None:
-                        tier_columns = []
-                        for i in range(1, 6):
-                            tier_col = None
-                            tier_name = f"Tier {i}"
-                            for col in df.columns:
-                                if col is not None and str(col).lower() == tier_name.lower():
-                                    tier_col = col
-                                    break
-                            
-                            if tier_col:
-                                tier_columns.append(tier_col)
-                            else:
+                        tier_columns = find_tier_columns(df)
+                        for tier_name in TIER_COLUMNS:
+                            if tier_name not in tier_columns:
                                 print(f"Warning: Column '{tier_name}' not found. Location hierarchy may be incomplete.")
                         
                         if not tier_columns:
@@ -2452,32 +2387,9 @@ class HardwareService(AuthManager):
             
             # Step 4: Extract unique location paths
             print("\n=== Step 4: Extract Unique Location Paths ===")
-            unique_paths = set()
-            opening_id_to_path = {}
-            
-            for index, row in tqdm(df.iterrows(), total=len(df), desc="Processing rows"):
-                opening_id = str(row['Opening ID']).strip()
-                if not opening_id:
-                    continue
-                
-                # Extract path from tier columns
-                path = []
-                for col in tier_columns:
-                    value = str(row[col]).strip() if pd.notna(row[col]) else ""
-                    path.append(value)
-                
-                # Remove empty tiers from the end
-                while path and not path[-1]:
-                    path.pop()
-                
-                # Skip if path is empty
-                if not path:
-                    continue
-                
-                # Add to unique paths and map to opening ID
-                path_tuple = tuple(path)  # Convert to tuple for set
-                unique_paths.add(path_tuple)
-                opening_id_to_path[opening_id] = path_tuple
+            opening_ids, path_codes, paths = extract_location_paths(df, tier_columns)
+            opening_id_to_path = {opening_id: paths[code] for opening_id, code in zip(opening_ids, path_codes)}
+            unique_paths = set(paths)
             
             if not unique_paths:
                 print("Error: No valid location paths found in the Excel file")
@@ -2488,101 +2400,14 @@ class HardwareService(AuthManager):
             
             # Step 5: Get existing locations
             print("\n=== Step 5: Retrieve Existing Locations ===")
-            existing_locations = task_service.get_all_locations_in_project(project_id)
-            if existing_locations is None:
+            location_tree = task_service.get_location_tree(project_id, refresh=True)
+            if location_tree is None:
                 print("Failed to retrieve existing locations from project")
-                return
-            
-            # Debug: Print detailed information about the response format
-            print("\nDEBUG - Response from get_all_locations_in_project:")
-            print(f"Response type: {type(existing_locations)}")
-            
-            if isinstance(existing_locations, list):
-                print(f"Response is a list with {len(existing_locations)} items")
-                if existing_locations and len(existing_locations) > 0:
-                    print("First item type:", type(existing_locations[0]))
-                    print("First item keys:", list(existing_locations[0].keys()) if isinstance(existing_locations[0], dict) else "Not a dict")
-                    print("First item:", existing_locations[0])
-            elif isinstance(existing_locations, dict):
-                print("Response is a dictionary with keys:", list(existing_locations.keys()))
-                if 'results' in existing_locations:
-                    results = existing_locations.get('results', [])
-                    print(f"'results' key contains a list with {len(results)} items")
-                    if results and len(results) > 0:
-                        print("First result item type:", type(results[0]))
-                        print("First result keys:", list(results[0].keys()) if isinstance(results[0], dict) else "Not a dict")
-                print("First 100 characters of response:", str(existing_locations)[:100])
-            else:
-                print("Response is neither a list nor a dictionary")
-                print("First 100 characters of response:", str(existing_locations)[:100])
-            
-            # Process the locations response
-            if isinstance(existing_locations, list):
-                all_locations = existing_locations
-            elif isinstance(existing_locations, dict) and 'results' in existing_locations:
-                all_locations = existing_locations.get('results', [])
-            else:
-                print("Error: Unexpected response format from get_all_locations_in_project")
                 print("Cannot continue without properly formatted location data")
                 return
             
-            print(f"Retrieved {len(all_locations)} existing locations")
-            
-            # Debug: Print all existing locations
-            print("\nDEBUG - All existing locations:")
-            for loc in all_locations:
-                print(f"  ID: {loc.get('id')}, Name: {loc.get('name')}, Parent ID: {loc.get('location_id')}")
-            
-            # Build location map by path
-            location_map = {}  # Map path to location ID
-            
-            # First, build parent-child map
-            location_by_id = {loc['id']: loc for loc in all_locations if 'id' in loc}
-            children_map = {}  # Map parent ID to list of child locations
-            
-            for loc in all_locations:
-                if 'id' not in loc:
-                    continue
-                
-                parent_id = loc.get('location_id')
-                if parent_id:
-                    if parent_id not in children_map:
-                        children_map[parent_id] = []
-                    children_map[parent_id].append(loc)
-                else:
-                    # Top-level location (Tier 1)
-                    if None not in children_map:
-                        children_map[None] = []
-                    children_map[None].append(loc)
-            
-            # Helper function to recursively build paths
-            def build_paths(loc_id, current_path=None):
-                if current_path is None:
-                    current_path = []
-                
-                loc = location_by_id.get(loc_id)
-                if not loc:
-                    return
-                
-                # Get the name of this location
-                loc_name = loc.get('name', '')
-                if not loc_name:
-                    return
-                
-                # Append this location's name to the path
-                new_path = current_path + [loc_name]
-                path_tuple = tuple(new_path)
-                location_map[path_tuple] = loc_id
-                
-                # Process children
-                if loc_id in children_map:
-                    for child in children_map[loc_id]:
-                        build_paths(child['id'], new_path)
-            
-            # Build paths for top-level locations
-            for loc in children_map.get(None, []):
-                build_paths(loc['id'], [])
-            
+            location_map = location_tree.paths()
+            print(f"Retrieved {len(location_tree)} existing locations")
             print(f"Built paths for {len(location_map)} existing locations")
             
             # Debug: Print all paths in location map
@@ -2592,10 +2417,7 @@ class HardwareService(AuthManager):
             
             # Step 6: Determine missing paths
             print("\n=== Step 6: Determine Missing Paths ===")
-            missing_paths = []
-            for path in unique_paths:
-                if path not in location_map:
-                    missing_paths.append(list(path))  # Convert tuple back to list
+            missing_paths = [list(path) for path in location_tree.missing(unique_paths)]
             
             print(f"Found {len(missing_paths)} missing location paths")
             
@@ -2610,77 +2432,8 @@ class HardwareService(AuthManager):
             for path in missing_paths:
                 print(f"  {' > '.join(path)}")
             
-            # Step 7: Create missing locations if needed
-            created_locations = []
-            if missing_paths:
-                print("\n=== Step 7: Create Missing Locations ===")
-                print(f"Creating {len(missing_paths)} new location paths...")
-                
-                # Show the missing paths we're about to create
-                print("Paths to be created:")
-                for path in missing_paths[:min(5, len(missing_paths))]:
-                    print(f"  {' > '.join(path)}")
-                if len(missing_paths) > 5:
-                    print(f"  ... and {len(missing_paths) - 5} more")
-                
-                # Batch create locations with a maximum of 500 per request
-                batch_size = 500
-                
-                for i in range(0, len(missing_paths), batch_size):
-                    batch = missing_paths[i:i+batch_size]
-                    print(f"Creating batch {i//batch_size + 1} of {(len(missing_paths) + batch_size - 1) // batch_size} ({len(batch)} paths)...")
-                    
-                    result = task_service.batch_create_locations(project_id, batch)
-                    if result and isinstance(result, list):
-                        created_locations.extend(result)
-                        print(f"Successfully created {len(result)} new locations")
-                    else:
-                        print("Error: Failed to create locations")
-                        print("Cannot continue without all required locations")
-                        return
-                
-                print(f"Successfully created {len(created_locations)} new locations")
-                
-                # Update location map with newly created locations
-                for loc in created_locations:
-                    # We need to rebuild the path for each location
-                    loc_id = loc['id']
-                    loc_name = loc['name']
-                    parent_id = loc.get('location_id')
-                    
-                    # Find the path
-                    path = [loc_name]
-                    current_parent_id = parent_id
-                    
-                    while current_parent_id:
-                        parent_loc = next((l for l in created_locations if l['id'] == current_parent_id), None)
-                        if not parent_loc:
-                            parent_loc = location_by_id.get(current_parent_id)
-                            
-                        if parent_loc and 'name' in parent_loc:
-                            path.insert(0, parent_loc['name'])
-                            current_parent_id = parent_loc.get('location_id')
-                        else:
-                            break
-                    
-                    path_tuple = tuple(path)
-                    location_map[path_tuple] = loc_id
-                
-                print(f"Updated location map, now contains {len(location_map)} paths")
-                
-                # Verify all paths are now available
-                remaining_missing = []
-                for path in unique_paths:
-                    if path not in location_map:
-                        remaining_missing.append(path)
-                
-                if remaining_missing:
-                    print(f"Error: {len(remaining_missing)} paths are still missing after location creation")
-                    print("Cannot continue without all required locations")
-                    return
-            
-            # Step 8: Get all tasks
-            print("\n=== Step 8: Retrieve Tasks ===")
+            # Step 7: Get all tasks
+            print("\n=== Step 7: Retrieve Tasks ===")
             existing_tasks = task_service.get_all_tasks_in_project(project_id, filter_option='active')
             if not existing_tasks:
                 print("No tasks found in project")
@@ -2697,12 +2450,6 @@ class HardwareService(AuthManager):
             
             print(f"Built task map with {len(task_map)} tasks")
             
-            # Step 9: Update tasks with location IDs
-            print("\n=== Step 9: Update Tasks with Location IDs ===")
-            updated_tasks = 0
-            skipped_tasks = 0
-            failed_tasks = 0
-            
             # Group opening IDs by location path for batch processing
             opening_ids_by_path = {}
             for opening_id, path_tuple in opening_id_to_path.items():
@@ -2710,72 +2457,121 @@ class HardwareService(AuthManager):
                     opening_ids_by_path[path_tuple] = []
                 opening_ids_by_path[path_tuple].append(opening_id)
             
-            # Create executor for parallel task updates
-            executor = RateLimitedExecutor()
-            
-            # Prepare operations
-            all_update_operations = []
+            # Step 8: Update tasks with location IDs while missing locations are created.
+            # Updates share the rate limit with location creation.
+            print("\n=== Step 8: Update Tasks with Location IDs ===")
+            updated_tasks = 0
+            skipped_tasks = 0
+            failed_tasks = 0
             
-            # Process each path
-            for path_tuple, opening_ids in opening_ids_by_path.items():
-                # Get location ID for this path
-                location_id = location_map.get(path_tuple)
-                if not location_id:
-                    print(f"Warning: No location ID found for path {' > '.join(path_tuple)}")
-                    skipped_tasks += len(opening_ids)
-                    continue
-                
-                # Prepare update operations for all tasks with this location
-                for opening_id in opening_ids:
-                    task = task_map.get(opening_id.lower())
-                    if not task:
-                        print(f"Warning: No task found for opening ID {opening_id}")
-                        skipped_tasks += 1
+            creation_executor = RateLimitedExecutor()
+            update_pool = ThreadPoolExecutor(max_workers=creation_executor.max_workers)
+            update_futures = []  # (future, opening_id)
+            queued_paths = set()
+            
+            def update_task_location(task_id, location_id):
+                creation_executor.rate_limiter.wait_for_slot()
+                return task_service.update_task_with_location(
+                    project_id=project_id,
+                    task_id=task_id,
+                    location_id=location_id,
+                    user_id=user_id
+                )
+            
+            def queue_task_updates():
+                """Queue updates for tasks whose location exists and was not queued yet."""
+                nonlocal skipped_tasks
+                queued = 0
+                for path_tuple, opening_ids in opening_ids_by_path.items():
+                    if path_tuple in queued_paths:
                         continue
-                    
-                    # Skip if task already has the correct location ID
-                    if task.get('location_id') == location_id:
-                        print(f"Task {opening_id} already has correct location ID {location_id}")
-                        skipped_tasks += 1
+                    location_id = location_tree.id_for(path_tuple)
+                    if not location_id:
                         continue
+                    queued_paths.add(path_tuple)
                     
-                    # Add update operation
-                    def update_task_location(task_id=task["id"], location_id=location_id):
-                        return task_service.update_task_with_location(
-                            project_id=project_id,
-                            task_id=task_id,
-                            location_id=location_id,
-                            user_id=user_id
-                        )
-                    
-                    all_update_operations.append((update_task_location, opening_id))
+                    for opening_id in opening_ids:
+                        task = task_map.get(opening_id.lower())
+                        if not task:
+                            print(f"Warning: No task found for opening ID {opening_id}")
+                            skipped_tasks += 1
+                            continue
+                        
+                        # Skip if task already has the correct location ID
+                        if task.get('location_id') == location_id:
+                            print(f"Task {opening_id} already has correct location ID {location_id}")
+                            skipped_tasks += 1
+                            continue
+                        
+                        future = update_pool.submit(update_task_location, task["id"], location_id)
+                        update_futures.append((future, opening_id))
+                        queued += 1
+                if queued:
+                    print(f"Updating {queued} tasks with location IDs...")
             
-            # Execute operations in parallel with progress reporting
-            if all_update_operations:
-                print(f"Updating {len(all_update_operations)} tasks with location IDs...")
-                
-                # Extract just the operation functions
-                operations = [op[0] for op in all_update_operations]
+            created_locations = []
+            try:
+                # Tasks at existing locations are updated while the rest are created
+                queue_task_updates()
                 
-                # Execute in parallel
-                results = executor.execute_parallel(operations)
+                # Step 9: Create missing locations if needed
+                if missing_paths:
+                    print("\n=== Step 9: Create Missing Locations ===")
+                    print(f"Creating {len(missing_paths)} new location paths...")
+                    
+                    # Show the missing paths we're about to create
+                    print("Paths to be created:")
+                    for path in missing_paths[:min(5, len(missing_paths))]:
+                        print(f"  {' > '.join(path)}")
+                    if len(missing_paths) > 5:
+                        print(f"  ... and {len(missing_paths) - 5} more")
+                    
+                    while True:
+                        # Created locations are added to location_tree, so a retry only sends what is still missing
+                        created_locations.extend(self._create_locations_by_tier(
+                            project_id,
+                            task_service,
+                            location_tree,
+                            missing_paths,
+                            creation_executor,
+                            on_tier_created=lambda depth: queue_task_updates()
+                        ))
+                        
+                        remaining_missing = location_tree.missing(unique_paths)
+                        if not remaining_missing:
+                            break
+                        
+                        print(f"Error: {len(remaining_missing)} paths are still missing after location creation")
+                        retry = get_user_input("Retry creating the missing locations? (y/n): ")
+                        if retry.lower() != 'y':
+                            break
+                    
+                    print(f"Successfully created {len(created_locations)} new locations")
+                    print(f"Updated location map, now contains {len(location_tree.paths())} paths")
                 
-                # Process results
-                if isinstance(results, bool):
-                    # If we got a single boolean result
-                    if results:
-                        updated_tasks = len(all_update_operations)
+                # Wait for task updates to finish
+                for future, opening_id in update_futures:
+                    try:
+                        result = future.result()
+                        error = ""
+                    except Exception as e:
+                        result = None
+                        error = f": {str(e)}"
+                    if result:
+                        updated_tasks += 1
                     else:
-                        failed_tasks = len(all_update_operations)
-                else:
-                    # If we got individual results
-                    for (result, (_, opening_id)) in zip(results, all_update_operations):
-                        if result:
-                            updated_tasks += 1
-                        else:
-                            print(f"Error: Failed to update task for opening ID {opening_id}")
-                            failed_tasks += 1
-            else:
+                        print(f"Error: Failed to update task for opening ID {opening_id}{error}")
+                        failed_tasks += 1
+            finally:
+                update_pool.shutdown(wait=True)
+            
+            # Openings whose location could not be created
+            for path_tuple, opening_ids in opening_ids_by_path.items():
+                if path_tuple not in queued_paths:
+                    print(f"Warning: No location ID found for path {' > '.join(path_tuple)}")
+                    skipped_tasks += len(opening_ids)
+            
+            if not update_futures:
                 print("No task updates needed.")
             
             # Final summary
@@ -2792,6 +2588,65 @@ class HardwareService(AuthManager):
             print(f"\nError: Process stopped due to an error: {str(e)}")
             print("No further items will be processed.")
 
+    def _create_locations_by_tier(self, project_id, task_service, location_tree, paths, executor,
+                                  on_tier_created=None, batch_size=500):
+        """Create missing locations one tier at a time, sending each tier's batches in parallel.
+        
+        A tier's locations are only created once their parents exist, so parallel
+        batches never race to create the same parent. If some locations of a tier
+        cannot be created, deeper paths below them are skipped and the rest continue.
+        
+        Args:
+            project_id (str): Project ID
+            task_service (TaskService): Task service instance
+            location_tree (LocationTree): The project's cached location tree
+            paths (list): Full location paths to create
+            executor (RateLimitedExecutor): Executor for the batch requests
+            on_tier_created (callable, optional): Called with the tier depth after each tier
+            batch_size (int): Maximum paths per batch_create_locations request
+            
+        Returns:
+            list: Created location objects
+        """
+        created_locations = []
+        created_lock = threading.Lock()
+        paths = [tuple(path) for path in paths]
+        max_depth = max((len(path) for path in paths), default=0)
+        
+        for depth in range(1, max_depth + 1):
+            # Distinct missing prefixes at this depth, in first-seen order
+            tier_paths = location_tree.missing(dict.fromkeys(path[:depth] for path in paths if len(path) >= depth))
+            if tier_paths:
+                batches = [tier_paths[i:i+batch_size] for i in range(0, len(tier_paths), batch_size)]
+                print(f"Tier {depth}: creating {len(tier_paths)} locations in {len(batches)} batches...")
+                
+                operations = []
+                for number, batch in enumerate(batches, 1):
+                    def create_batch(batch=batch, number=number):
+                        # Locations are added to location_tree by batch_create_locations
+                        result = task_service.batch_create_locations(project_id, [list(path) for path in batch])
+                        if result and isinstance(result, list):
+                            with created_lock:
+                                created_locations.extend(result)
+                            print(f"  ✓ Tier {depth} batch {number}/{len(batches)}: created {len(result)} locations")
+                        else:
+                            print(f"  ✗ Tier {depth} batch {number}/{len(batches)}: failed to create locations")
+                        return result
+                    operations.append(create_batch)
+                
+                executor.execute_parallel(operations)
+                
+                # Paths below locations that could not be created are skipped
+                failed = set(location_tree.missing(tier_paths))
+                if failed:
+                    print(f"Error: {len(failed)} Tier {depth} locations could not be created")
+                    paths = [path for path in paths if path[:depth] not in failed]
+            
+            if on_tier_created:
+                on_tier_created(depth)
+        
+        return created_locations
+
     def sort_test_get_check_items_from_task(self, project_id, task_service, attribute_service):
         """Test the sorting order of checklist items as received from the API.
         
@@ -2870,7 +2725,8 @@ class HardwareService(AuthManager):
             print(f"\nError: Process stopped due to an error: {str(e)}")
             print("No further items will be processed.")
 
-    def generate_UCA_sheet(self, project_id, task_service, attribute_service):
+    @staticmethod
+    def generate_UCA_sheet(project_id, task_service, attribute_service, output_path=None):
         """Generate UCA spreadsheet with task data, attributes, and hardware line checklist items.
         
         Creates an Excel file with:
@@ -2878,13 +2734,28 @@ class HardwareService(AuthManager):
         - First column: Opening number (UCA prefix removed)
         - Next columns: Task attribute values
         - Hardware type columns: Original hardware line checklist item names
+        
+        Args:
+            project_id (str): Project to report on
+            task_service: TaskService, or an OfflineProjectData to work from a saved snapshot
+            attribute_service: AttributeService, or the same OfflineProjectData
+            output_path (str, optional): File to save to. If None, a save dialog is shown.
+            
+        Returns:
+            str: Path of the saved file, or None if nothing was saved
         """
         try:
             print("\n=== Generating UCA Spreadsheet ===")
             
             # Step 1: Get all tasks and filter UCA tasks
-            print("Retrieving UCA tasks...")
-            all_tasks = task_service.get_all_tasks_in_project(project_id, filter_option='active')
+            print("Retrieving tasks, task attributes and checklist items...")
+            data = fetch_concurrently({
+                'tasks': lambda: task_service.get_all_tasks_in_project(project_id, filter_option='active'),
+                'task_attributes': lambda: attribute_service.get_all_task_attributes_in_project(project_id),
+                'checklist_items': lambda: attribute_service.get_all_task_check_items_in_project(project_id),
+                'task_type_attributes': lambda: attribute_service.get_all_task_type_attributes_in_project(project_id)
+            })
+            all_tasks = data['tasks']
             if not all_tasks:
                 print("No tasks found in project")
                 return
@@ -2897,12 +2768,11 @@ class HardwareService(AuthManager):
             print(f"Found {len(uca_tasks)} UCA tasks")
             
             # Step 2: Get task attributes and checklist items
-            print("Retrieving task attributes and checklist items...")
-            all_task_attributes = attribute_service.get_all_task_attributes_in_project(project_id)
-            all_checklist_items = attribute_service.get_all_task_check_items_in_project(project_id)
+            all_task_attributes = data['task_attributes']
+            all_checklist_items = data['checklist_items']
             
             # Get task type attributes for mapping
-            task_type_attributes = attribute_service.get_all_task_type_attributes_in_project(project_id)
+            task_type_attributes = data['task_type_attributes']
             task_type_attr_map = {attr['id']: attr['name'] for attr in task_type_attributes}
             
             # Step 3: Organize data by UCA task
@@ -2933,24 +2803,14 @@ class HardwareService(AuthManager):
                     task_checklist_map[task_id].append(item)
             
             # Step 4: Helper function to check conditions and identify hardware lines
-            def uca_check_conditions(text, conditions):
-                """Check if text matches any UCA hardware filter condition sets."""
-                text = text.lower()
-                for condition_set in conditions:
-                    if 'any' in condition_set:
-                        any_match = any(term.lower() in text for term in condition_set['any'])
-                        if not any_match:
-                            continue
-                    if 'all' in condition_set:
-                        all_match = all(term.lower() in text for term in condition_set['all'])
-                        if not all_match:
-                            continue
-                    if 'none' in condition_set:
-                        none_match = not any(term.lower() in text for term in condition_set['none'])
-                        if not none_match:
-                            continue
-                    return True
-                return False
+            def uca_check_conditions(text, conditions, exclusions=None):
+                """Check if text matches any UCA hardware filter condition sets.
+                
+                Uses the same matching as process_uca_tasks, so the sheet finds
+                the hardware lines that UCA tasks were created from.
+                """
+                from config.constants import check_enhanced_conditions
+                return check_enhanced_conditions(text, conditions, exclusions)
             
             def is_hardware_line(item_name):
                 """Determine if checklist item is an original hardware line (not additional item)."""
@@ -3051,45 +2911,17 @@ class HardwareService(AuthManager):
             df = pd.DataFrame(rows, columns=columns)
             
             # Step 8: Export to Excel file
-            file_path = get_export_file_path("UCA_Tasks_Export", "xlsx")
+            file_path = output_path or get_export_file_path("UCA_Tasks_Export", "xlsx")
             if not file_path:
                 print("Export cancelled by user")
                 return
             
             print(f"Saving to: {file_path}")
             
-            # Create Excel writer with formatting
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='UCA Tasks', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['UCA Tasks']
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    # Set minimum width of 10, maximum of 50
-                    adjusted_width = min(max(max_length + 2, 10), 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # Format header row
-                from openpyxl.styles import Font, PatternFill
-                header_font = Font(bold=True)
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                
-                for cell in worksheet[1]:
-                    cell.font = header_font
-                    cell.fill = header_fill
+            # Stream the sheet with widths between 10 and 50 and a blue header
+            workbook = create_workbook()
+            write_sheet(workbook, 'UCA Tasks', df, header_fill='366092', min_width=10, max_width=50)
+            workbook.save(file_path)
             
             # Step 9: Summary
             print(f"\n=== Export Complete ===")
@@ -3105,6 +2937,7 @@ class HardwareService(AuthManager):
                 print(f"\nHardware type columns: {', '.join(sorted_hardware_types)}")
             
             print("\nUCA spreadsheet generation complete!")
+            return file_path
             
         except Exception as e:
             print(f"\nError: Failed to generate UCA spreadsheet: {str(e)}")
@@ -1,8 +1,12 @@
 """Report service for filtering and analyzing Fieldwire project data."""
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional
-import openpyxl
+from typing import Dict, List, Optional, Tuple
+from utils.excel_writer import create_workbook, write_sheet
+from utils.project_snapshot import RECORDS_SUFFIX, records_table
+from utils.rate_limiter import fetch_concurrently
+from utils.table_store import load_tables, require_parquet, save_tables
 from enum import Enum, auto
 
 class FilterType(Enum):
@@ -34,6 +38,29 @@ class FilterState:
     def __init__(self):
         self.task_filters = []
         self.check_item_filters = []
+        # The filter list each filter was added to, oldest first
+        self.added_order = []
+    
+    def __len__(self):
+        return len(self.added_order)
+    
+    def add_task_filter(self, filter_type, filter_value):
+        self.task_filters.append((filter_type, filter_value))
+        self.added_order.append(self.task_filters)
+    
+    def add_check_item_filter(self, filter_type, filter_value):
+        self.check_item_filters.append((filter_type, filter_value))
+        self.added_order.append(self.check_item_filters)
+    
+    def remove_last(self):
+        """Remove the most recently added filter.
+        
+        Returns:
+            tuple: The removed (filter_type, filter_value), or None if there are no filters
+        """
+        if not self.added_order:
+            return None
+        return self.added_order.pop().pop()
 
 class ReportService:
     """Service for filtering and reporting on Fieldwire project data."""
@@ -54,6 +81,31 @@ class ReportService:
         'not_applicable': '#D3D3D3'  # Light grey for not applicable
     }
     
+    # Columns kept for each project collection and how they are stored:
+    #   'string'   - text that is mostly unique, missing values as ''
+    #   'text'     - text that repeats across rows, categorical with missing values as ''
+    #   'category' - IDs and states, categorical with missing values left missing
+    DATAFRAME_SCHEMA = {
+        'tasks': {'id': 'string', 'team_id': 'category', 'status_id': 'category', 'name': 'string'},
+        'teams': {'id': 'string', 'name': 'string'},
+        'statuses': {'id': 'string', 'name': 'string'},
+        'task_check_items': {'id': 'string', 'task_id': 'category', 'state': 'category', 'name': 'text'},
+        'task_type_attributes': {'id': 'string', 'name': 'string'},
+        'task_attributes': {
+            'id': 'string', 'task_id': 'category', 'task_type_attribute_id': 'category', 'text_value': 'text'
+        }
+    }
+    
+    # Column each DataFrame is indexed on
+    DATAFRAME_INDEX = {
+        'tasks': 'id',
+        'teams': 'id',
+        'statuses': 'id',
+        'task_check_items': 'task_id',
+        'task_type_attributes': 'id',
+        'task_attributes': 'task_id'
+    }
+    
     def __init__(self, project_service, task_service, attribute_service, 
                  status_service, team_service, tag_service):
         """Initialize the report service.
@@ -74,7 +126,40 @@ class ReportService:
         self.tag_service = tag_service
         
         self.dataframes: Dict[str, pd.DataFrame] = {}
+        self.project_id: Optional[str] = None
         self.filter_state = FilterState()
+        self.clear_filter_cache()
+        
+    def fetch_project_collections(self, project_id: str) -> Dict[str, List[dict]]:
+        """Fetch the raw records of every collection in DATAFRAME_SCHEMA.
+        
+        Args:
+            project_id: Project to fetch
+            
+        Returns:
+            Dict[str, List[dict]]: Collection name -> records
+            
+        Raises:
+            ValueError: If a collection could not be fetched or is empty
+        """
+        # The collections are independent, so they are fetched concurrently
+        collections = fetch_concurrently({
+            'tasks': lambda: self.task_service.get_all_tasks_in_project(project_id, filter_option='active'),
+            'teams': lambda: self.team_service.get_all_teams_in_project(project_id),
+            'statuses': lambda: self.status_service.get_statuses_for_project_id(project_id),
+            'task_check_items': lambda: self.attribute_service.get_all_task_check_items_in_project(project_id),
+            'task_type_attributes': lambda: self.attribute_service.get_all_task_type_attributes_in_project(project_id),
+            'task_attributes': lambda: self.attribute_service.get_all_task_attributes_in_project(project_id)
+        })
+        
+        if not all(collections.values()):
+            raise ValueError("Failed to fetch required data")
+            
+        # Wrap a single check item in a list
+        if not isinstance(collections['task_check_items'], list):
+            collections['task_check_items'] = [collections['task_check_items']]
+            
+        return collections
         
     def initialize_project_data(self, project_name: str) -> None:
         """Initialize all DataFrames for a given project."""
@@ -86,64 +171,179 @@ class ReportService:
         print("\nFetching project data...")
         
         try:
-            # Fetch all required data
-            tasks = self.task_service.get_all_tasks_in_project(project_id, filter_option='active')
-            teams = self.team_service.get_all_teams_in_project(project_id)
-            statuses = self.status_service.get_statuses_for_project_id(project_id)
-            task_check_items = self.attribute_service.get_all_task_check_items_in_project(project_id)
-            task_type_attributes = self.attribute_service.get_all_task_type_attributes_in_project(project_id)
-            task_attributes = self.attribute_service.get_all_task_attributes_in_project(project_id)
-            
-            # Convert to DataFrames
-            if not all([tasks, teams, statuses, task_check_items, task_type_attributes, task_attributes]):
-                raise ValueError("Failed to fetch required data")
-                
-            # Convert task_check_items to DataFrame if it's not already
-            if isinstance(task_check_items, list):
-                task_check_items_df = pd.DataFrame(task_check_items)
-            else:
-                task_check_items_df = pd.DataFrame([task_check_items])
-                
-            self.dataframes = {
-                'tasks': pd.DataFrame(tasks)[['id', 'team_id', 'status_id', 'name']],
-                'teams': pd.DataFrame(teams)[['id', 'name']],
-                'statuses': pd.DataFrame(statuses)[['id', 'name']],
-                'task_check_items': task_check_items_df[['id', 'task_id', 'state', 'name']],
-                'task_type_attributes': pd.DataFrame(task_type_attributes)[['id', 'name']],
-                'task_attributes': pd.DataFrame(task_attributes)[['id', 'task_id', 'task_type_attribute_id', 'text_value']]
-            }
-            
-            # Convert all values to strings
-            for name, df in self.dataframes.items():
-                self.dataframes[name] = df.astype(str).replace('nan', '')
+            self.dataframes = self.build_dataframes(self.fetch_project_collections(project_id))
+            self.project_id = project_id
+            self.clear_filter_cache()
                 
             print("Data fetched and processed successfully.")
             
         except Exception as e:
             raise ValueError(f"Failed to initialize project data: {str(e)}")
             
+    def save_project_snapshot(self, project_name: str, directory: str) -> None:
+        """Save the project's data to disk for offline reports.
+        
+        The snapshot is a raw data export (see export_raw_tables) that also
+        holds the raw records generate_fc_task_report and generate_UCA_sheet
+        read, so every report can be run again from it without any API calls
+        (main.py --from-snapshot).
+        
+        Args:
+            project_name: Name or ID of the project to save
+            directory: Directory to write the snapshot to
+            
+        Raises:
+            ValueError: If the project is not found, Parquet support is not
+                installed, or the data cannot be fetched or saved
+        """
+        project_id = self.project_service.get_project_id_from_name_or_id(project_name)
+        if not project_id:
+            raise ValueError(f"Project '{project_name}' not found")
+            
+        # Check before fetching, rather than failing once everything is downloaded
+        require_parquet()
+        print("\nFetching project data...")
+        
+        try:
+            collections = self.fetch_project_collections(project_id)
+            self.dataframes = self.build_dataframes(collections)
+            self.project_id = project_id
+            self.clear_filter_cache()
+            self._save_raw_tables(directory, collections, project_name)
+            
+            print(f"\nProject snapshot saved to {directory}")
+            for name, records in collections.items():
+                print(f"- {name} ({len(records)} records)")
+                
+        except Exception as e:
+            raise ValueError(f"Failed to save project snapshot: {str(e)}")
+            
+    @classmethod
+    def build_dataframes(cls, collections: Dict[str, List[dict]]) -> Dict[str, pd.DataFrame]:
+        """Build the typed project DataFrames from API records.
+        
+        Columns are typed as listed in DATAFRAME_SCHEMA, and each DataFrame is
+        indexed on its DATAFRAME_INDEX column, which is also kept as a regular
+        column.
+        
+        Args:
+            collections: Collection name -> list of records, for every DATAFRAME_SCHEMA name
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Collection name -> DataFrame
+        """
+        return {
+            name: cls._apply_schema(name, pd.DataFrame(collections[name], columns=list(schema)))
+            for name, schema in cls.DATAFRAME_SCHEMA.items()
+        }
+        
+    @staticmethod
+    def _flatten_value(value):
+        """Return the 'value' of an attribute value stored as a dict, other values as they are."""
+        if isinstance(value, dict):
+            return value.get('value', '')
+        if isinstance(value, list):
+            return str(value)
+        return value
+        
+    @classmethod
+    def _apply_schema(cls, name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Type and index one collection's DataFrame as DATAFRAME_SCHEMA describes.
+        
+        Already typed columns are left as they are, so this can also restore a
+        DataFrame loaded from a raw data export.
+        """
+        for column, kind in cls.DATAFRAME_SCHEMA[name].items():
+            if kind == 'string':
+                df[column] = df[column].astype('string').fillna('')
+                continue
+            values = df[column]
+            if values.dtype == object:
+                # Dict values can't be categories; keep their 'value' as the FC report does
+                values = values.map(cls._flatten_value)
+            # Categorize first so only the distinct values are converted to strings
+            values = values.astype('category')
+            if not pd.api.types.is_string_dtype(values.cat.categories):
+                values = values.cat.rename_categories(values.cat.categories.astype(str))
+            if kind == 'text':
+                if '' not in values.cat.categories:
+                    values = values.cat.add_categories('')
+                values = values.fillna('')
+            df[column] = values
+        if name == 'task_check_items':
+            # Every known state is a category, in display order
+            states = list(cls.CHECK_ITEM_STATES)
+            extra = [state for state in df['state'].cat.categories if state not in states]
+            df['state'] = df['state'].cat.set_categories(states + extra)
+        df.index = pd.Index(df[cls.DATAFRAME_INDEX[name]], name=None)
+        return df
+            
     def start_filtering(self) -> None:
         """Start the filtering process by asking the user what to filter."""
         print("\nWhat would you like to do?")
         print("1. Filter Tasks")
         print("2. Filter Check Items")
         print("3. Export All Raw Data to Excel")
+        print("4. Export All Raw Data to Parquet")
         
-        choice = input("Enter your choice (1-3): ").strip()
+        choice = input("Enter your choice (1-4): ").strip()
         
         if choice == "1":
             self._handle_task_filtering()
+            self._review_filter_results()
         elif choice == "2":
             self._handle_check_item_filtering()
+            self._review_filter_results()
         elif choice == "3":
             filename = input("\nEnter filename for Excel export (e.g., raw_data.xlsx): ").strip()
             if not filename.endswith('.xlsx'):
                 filename += '.xlsx'
             self.export_raw_data(filename)
+        elif choice == "4":
+            directory = input("\nEnter directory for the export (e.g., raw_data): ").strip()
+            self.export_raw_tables(directory)
         else:
             print("Invalid choice. Please try again.")
             self.start_filtering()
             
+    def _review_filter_results(self) -> None:
+        """Show the filtered results and let the user refine or export them.
+        
+        Results are cached per combination of filters, so going back to an
+        earlier combination does not filter the data again.
+        """
+        while True:
+            result = self.apply_filters()
+            filter_count = len(self.filter_state)
+            print(f"\n{len(result)} check items match the {filter_count} active filters.")
+            print("1. Add task filters")
+            print("2. Add check item filters")
+            print("3. Remove the last filter")
+            print("4. Export results to Excel")
+            print("5. Done")
+            
+            choice = input("Enter your choice (1-5): ").strip()
+            
+            if choice == "1":
+                self._handle_task_filtering()
+            elif choice == "2":
+                self._handle_check_item_filtering()
+            elif choice == "3":
+                if self.filter_state.remove_last() is None:
+                    print("No filters to remove.")
+            elif choice == "4":
+                filename = input("\nEnter filename for Excel export (e.g., report.xlsx): ").strip()
+                if not filename.endswith('.xlsx'):
+                    filename += '.xlsx'
+                try:
+                    self.export_to_excel(filename, result)
+                except ValueError as e:
+                    print(f"Error: {str(e)}")
+            elif choice == "5":
+                break
+            else:
+                print("Invalid choice. Please try again.")
+            
     def _handle_task_filtering(self) -> None:
         """Handle the task filtering process."""
         while True:
@@ -201,9 +401,7 @@ class ReportService:
             choice = int(input("Enter team number: "))
             if 1 <= choice <= len(teams):
                 selected_team = teams[choice - 1]
-                self.filter_state.task_filters.append(
-                    ('team', selected_team)
-                )
+                self.filter_state.add_task_filter('team', selected_team)
                 print(f"Added filter for team: {selected_team}")
             else:
                 print("Invalid choice.")
@@ -221,9 +419,7 @@ class ReportService:
             choice = int(input("Enter status number: "))
             if 1 <= choice <= len(statuses):
                 selected_status = statuses[choice - 1]
-                self.filter_state.task_filters.append(
-                    ('status', selected_status)
-                )
+                self.filter_state.add_task_filter('status', selected_status)
                 print(f"Added filter for status: {selected_status}")
             else:
                 print("Invalid choice.")
@@ -264,9 +460,7 @@ class ReportService:
                 value_choice = int(input("Enter value number: "))
                 if 1 <= value_choice <= len(values):
                     selected_value = values[value_choice - 1]
-                    self.filter_state.task_filters.append(
-                        ('attribute', (selected_type_id, selected_value))
-                    )
+                    self.filter_state.add_task_filter('attribute', (selected_type_id, selected_value))
                     print(f"Added filter for {selected_type_name} = {selected_value}")
                 else:
                     print("Invalid value choice.")
@@ -286,9 +480,7 @@ class ReportService:
             choice = int(input("Enter state number: "))
             if 1 <= choice <= len(states):
                 selected_state = states[choice - 1][0]
-                self.filter_state.check_item_filters.append(
-                    ('state', selected_state)
-                )
+                self.filter_state.add_check_item_filter('state', selected_state)
                 print(f"Added filter for state: {self.CHECK_ITEM_STATES[selected_state]}")
             else:
                 print("Invalid choice.")
@@ -320,78 +512,156 @@ class ReportService:
             "4": "exactly_matches"
         }
         
-        self.filter_state.check_item_filters.append(
-            ('name', (match_types[match_type], search_text))
-        )
+        self.filter_state.add_check_item_filter('name', (match_types[match_type], search_text))
         print(f"Added name filter: {match_types[match_type]} '{search_text}'")
             
-    def apply_filters(self) -> pd.DataFrame:
-        """Apply all filters and return the resulting DataFrame."""
-        # Start with all tasks
-        filtered_tasks = self.dataframes['tasks'].copy()
+    def clear_filter_cache(self) -> None:
+        """Forget cached filter results, e.g. after the DataFrames change."""
+        self._filter_cache_source = self.dataframes
+        self._filter_results = {}
+        self._predicate_masks = {}
+        self._name_ids = {}
+        
+    def _check_filter_cache(self) -> None:
+        """Clear the filter caches if self.dataframes was replaced."""
+        if self._filter_cache_source is not self.dataframes:
+            self.clear_filter_cache()
+            
+    def _id_for_name(self, collection: str, name: str) -> Optional[str]:
+        """Return the ID of the first team or status with a name, or None."""
+        if collection not in self._name_ids:
+            df = self.dataframes[collection].drop_duplicates('name')
+            self._name_ids[collection] = dict(zip(df['name'], df['id']))
+        return self._name_ids[collection].get(name)
+        
+    def plan_filters(self) -> Tuple[frozenset, frozenset]:
+        """Resolve the current filters into ID-based predicates.
+        
+        Team and status names are resolved to IDs, and duplicate filters are
+        dropped. Filters are combined with AND, so the order they were added in
+        does not matter and the plan works as a cache key.
         
-        # Apply task filters
+        Returns:
+            Tuple[frozenset, frozenset]: (task_predicates, item_predicates), e.g.
+                ('team_id', id), ('status_id', id), ('attribute', type_id, value),
+                ('state', state) and ('name', match_type, search_text)
+        """
+        task_predicates = set()
         for filter_type, filter_value in self.filter_state.task_filters:
             if filter_type == 'team':
-                team_id = self.dataframes['teams'][
-                    self.dataframes['teams']['name'] == filter_value
-                ]['id'].iloc[0]
-                filtered_tasks = filtered_tasks[filtered_tasks['team_id'] == team_id]
+                task_predicates.add(('team_id', self._id_for_name('teams', filter_value)))
             elif filter_type == 'status':
-                status_id = self.dataframes['statuses'][
-                    self.dataframes['statuses']['name'] == filter_value
-                ]['id'].iloc[0]
-                filtered_tasks = filtered_tasks[filtered_tasks['status_id'] == status_id]
+                task_predicates.add(('status_id', self._id_for_name('statuses', filter_value)))
             elif filter_type == 'attribute':
                 attr_type_id, attr_value = filter_value
-                # Get task IDs that match the attribute filter
-                matching_task_ids = self.dataframes['task_attributes'][
-                    (self.dataframes['task_attributes']['task_type_attribute_id'] == attr_type_id) &
-                    (self.dataframes['task_attributes']['text_value'] == attr_value)
-                ]['task_id'].unique()
-                filtered_tasks = filtered_tasks[filtered_tasks['id'].isin(matching_task_ids)]
-        
-        # Get check items for filtered tasks
-        check_items = self.dataframes['task_check_items'][
-            self.dataframes['task_check_items']['task_id'].isin(filtered_tasks['id'])
-        ]
-        
-        # Apply check item filters
+                task_predicates.add(('attribute', attr_type_id, attr_value))
+                
+        item_predicates = set()
         for filter_type, filter_value in self.filter_state.check_item_filters:
             if filter_type == 'state':
-                check_items = check_items[check_items['state'] == filter_value]
+                item_predicates.add(('state', filter_value))
             elif filter_type == 'name':
                 match_type, search_text = filter_value
-                if match_type == 'contains':
-                    check_items = check_items[check_items['name'].str.contains(search_text, na=False)]
-                elif match_type == 'starts_with':
-                    check_items = check_items[check_items['name'].str.startswith(search_text, na=False)]
-                elif match_type == 'ends_with':
-                    check_items = check_items[check_items['name'].str.endswith(search_text, na=False)]
-                elif match_type == 'exactly_matches':
-                    check_items = check_items[check_items['name'] == search_text]
-        
-        # Create final result
-        result = pd.merge(
-            filtered_tasks[['id', 'name']],
-            check_items[['task_id', 'name', 'state']],
-            left_on='id',
-            right_on='task_id',
-            suffixes=('_task', '_check_item')
-        )
+                item_predicates.add(('name', match_type, search_text))
+                
+        return frozenset(task_predicates), frozenset(item_predicates)
+        
+    def _predicate_mask(self, predicate: tuple) -> np.ndarray:
+        """Return the cached row mask of one predicate.
+        
+        Task predicates give a mask over the tasks DataFrame, check item
+        predicates one over the check items DataFrame.
+        """
+        if predicate in self._predicate_masks:
+            return self._predicate_masks[predicate]
+            
+        kind = predicate[0]
+        if kind in ('team_id', 'status_id'):
+            mask = (self.dataframes['tasks'][kind] == predicate[1]).to_numpy(dtype=bool)
+        elif kind == 'attribute':
+            task_attributes = self.dataframes['task_attributes']
+            matching_task_ids = task_attributes.index[
+                (task_attributes['task_type_attribute_id'] == predicate[1]).to_numpy(dtype=bool) &
+                (task_attributes['text_value'] == predicate[2]).to_numpy(dtype=bool)
+            ]
+            mask = self.dataframes['tasks'].index.isin(matching_task_ids)
+        elif kind == 'state':
+            mask = (self.dataframes['task_check_items']['state'] == predicate[1]).to_numpy(dtype=bool)
+        else:
+            mask = self._match_text(self.dataframes['task_check_items']['name'], predicate[1], predicate[2])
+            
+        self._predicate_masks[predicate] = mask
+        return mask
+        
+    def _combine_masks(self, predicates: frozenset, length: int) -> np.ndarray:
+        """AND the masks of some predicates, stopping once nothing is left."""
+        mask = np.ones(length, dtype=bool)
+        for predicate in predicates:
+            mask &= self._predicate_mask(predicate)
+            if not mask.any():
+                break
+        return mask
+            
+    def apply_filters(self) -> pd.DataFrame:
+        """Apply all filters and return the resulting DataFrame.
         
-        # Rename columns
-        result = result.rename(columns={
-            'name_task': 'Task Name',
-            'name_check_item': 'Check Item',
-            'state': 'State'
+        The check item filters run on the check items alone, before they are
+        joined to their tasks, and each predicate's mask and each plan's
+        result are cached until the DataFrames change.
+        """
+        self._check_filter_cache()
+        plan = self.plan_filters()
+        if plan in self._filter_results:
+            return self._filter_results[plan].copy()
+            
+        task_predicates, item_predicates = plan
+        tasks = self.dataframes['tasks']
+        check_items = self.dataframes['task_check_items']
+        
+        # Push the check item filters down, then keep the items of matching tasks
+        item_mask = self._combine_masks(item_predicates, len(check_items))
+        if item_mask.any():
+            task_mask = self._combine_masks(task_predicates, len(tasks))
+            filtered_tasks = tasks[task_mask]
+            item_mask &= check_items.index.isin(filtered_tasks.index)
+        else:
+            filtered_tasks = tasks.iloc[:0]
+        
+        # Join the task names onto the check items through the task index
+        items = check_items[item_mask]
+        result = pd.DataFrame({
+            'Task Name': filtered_tasks['name'].reindex(items.index).to_numpy(),
+            'Check Item': items['name'].to_numpy(),
+            'State': items['state'].to_numpy()
         })
         
-        # Drop ID columns and sort
-        result = result.drop(columns=['id', 'task_id'])
-        result = result.sort_values('Task Name')
+        result = result.sort_values('Task Name', kind='stable')
+        self._filter_results[plan] = result
+        return result.copy()
+            
+    @staticmethod
+    def _match_text(values: pd.Series, match_type: str, search_text: str) -> np.ndarray:
+        """Match a categorical text column, testing each distinct value once.
         
-        return result
+        Args:
+            values: Categorical column to match
+            match_type: 'contains', 'starts_with', 'ends_with' or 'exactly_matches'
+            search_text: Text to look for
+            
+        Returns:
+            np.ndarray: Boolean mask with one entry per row
+        """
+        categories = values.cat.categories.astype(str)
+        if match_type == 'contains':
+            hits = categories.str.contains(search_text, regex=True)
+        elif match_type == 'starts_with':
+            hits = categories.str.startswith(search_text)
+        elif match_type == 'ends_with':
+            hits = categories.str.endswith(search_text)
+        else:
+            hits = categories == search_text
+        # Code -1 (missing) picks the trailing False
+        return np.append(np.asarray(hits, dtype=bool), False)[values.cat.codes.to_numpy()]
             
     def export_to_excel(self, filename: str, df: pd.DataFrame) -> None:
         """Export DataFrame to Excel with formatting.
@@ -404,57 +674,15 @@ class ReportService:
             ValueError: If export fails
         """
         try:
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                # Export to Excel
-                df.to_excel(writer, sheet_name='Report', index=False)
-                
-                # Get the worksheet
-                worksheet = writer.sheets['Report']
-                
-                # Apply color coding for check item states if State column exists
-                if 'State' in df.columns:
-                    state_col_idx = df.columns.get_loc('State') + 1
-                    for row_idx, value in enumerate(df['State'], start=2):
-                        cell = worksheet.cell(row=row_idx, column=state_col_idx)
-                        if value in self.CHECK_ITEM_COLORS:
-                            cell.fill = openpyxl.styles.PatternFill(
-                                start_color=self.CHECK_ITEM_COLORS[value].replace('#', ''),
-                                end_color=self.CHECK_ITEM_COLORS[value].replace('#', ''),
-                                fill_type='solid'
-                            )
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column = [cell for cell in column]
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = (max_length + 2)
-                    worksheet.column_dimensions[openpyxl.utils.get_column_letter(column[0].column)].width = adjusted_width
-                
-                # Add alternating row colors
-                prev_task = None
-                row_color = 'F0F0F0'
-                for row_idx, task in enumerate(df['Opening' if 'Opening' in df.columns else 'Task Name'], start=2):
-                    if task != prev_task:
-                        row_color = 'F0F0F0' if row_color == 'FFFFFF' else 'FFFFFF'
-                    prev_task = task
-                    
-                    for col_idx in range(1, len(df.columns) + 1):
-                        if 'State' in df.columns and col_idx == df.columns.get_loc('State') + 1:
-                            continue  # Skip state column as it has its own coloring
-                        cell = worksheet.cell(row=row_idx, column=col_idx)
-                        cell.fill = openpyxl.styles.PatternFill(
-                            start_color=row_color,
-                            end_color=row_color,
-                            fill_type='solid'
-                        )
-                
-                print(f"\nData exported successfully to {filename}")
+            workbook = create_workbook()
+            write_sheet(
+                workbook, 'Report', df,
+                band_by='Opening' if 'Opening' in df.columns else 'Task Name',
+                value_fills={'State': self.CHECK_ITEM_COLORS}
+            )
+            workbook.save(filename)
+            
+            print(f"\nData exported successfully to {filename}")
                 
         except Exception as e:
             raise ValueError(f"Failed to export to Excel: {str(e)}")
@@ -469,54 +697,85 @@ class ReportService:
             ValueError: If export fails
         """
         try:
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                # Export each DataFrame to its own sheet
-                for name, df in self.dataframes.items():
-                    # Create a copy to avoid modifying original
-                    export_df = df.copy()
-                    
-                    # Convert all values to strings and replace empty values
-                    export_df = export_df.astype(str).replace(['nan', ''], '')
-                    
-                    # Export to sheet
-                    sheet_name = name.replace('_', ' ').title()
-                    export_df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    
-                    # Get the worksheet
-                    worksheet = writer.sheets[sheet_name]
-                    
-                    # Auto-adjust column widths
-                    for column in worksheet.columns:
-                        max_length = 0
-                        column = [cell for cell in column]
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        adjusted_width = (max_length + 2)
-                        worksheet.column_dimensions[openpyxl.utils.get_column_letter(column[0].column)].width = adjusted_width
-                    
-                    # Add alternating row colors
-                    for row_idx in range(2, len(export_df) + 2):  # Start from 2 to skip header
-                        row_color = 'F0F0F0' if row_idx % 2 == 0 else 'FFFFFF'
-                        for col_idx in range(1, len(export_df.columns) + 1):
-                            cell = worksheet.cell(row=row_idx, column=col_idx)
-                            cell.fill = openpyxl.styles.PatternFill(
-                                start_color=row_color,
-                                end_color=row_color,
-                                fill_type='solid'
-                            )
+            workbook = create_workbook()
+            for name, df in self.dataframes.items():
+                # Convert all values to strings and replace empty values
+                export_df = df.astype(str).replace(['nan', ''], '')
                 
-                print(f"\nAll raw data exported successfully to {filename}")
-                print("The following sheets were created:")
-                for name in self.dataframes.keys():
-                    print(f"- {name.replace('_', ' ').title()}")
+                # Export to sheet
+                sheet_name = name.replace('_', ' ').title()
+                write_sheet(workbook, sheet_name, export_df, band_rows=True)
+            workbook.save(filename)
+            
+            print(f"\nAll raw data exported successfully to {filename}")
+            print("The following sheets were created:")
+            for name in self.dataframes.keys():
+                print(f"- {name.replace('_', ' ').title()}")
                 
         except Exception as e:
             raise ValueError(f"Failed to export raw data to Excel: {str(e)}")
 
+    def export_raw_tables(self, directory: str) -> None:
+        """Export the project DataFrames as typed tables for offline use.
+        
+        Each collection is written as Parquet, with a manifest.json listing
+        the tables. pyarrow (or fastparquet) must be installed. load_raw_tables reads the export back without any API calls,
+        e.g. for the filter report under main.py --from-snapshot.
+        
+        Args:
+            directory: Directory to write the tables to
+            
+        Raises:
+            ValueError: If export fails
+        """
+        try:
+            self._save_raw_tables(directory)
+            
+            print(f"\nAll raw data exported successfully to {directory}")
+            print("The following tables were created:")
+            for name, df in self.dataframes.items():
+                print(f"- {name} ({len(df)} rows)")
+                
+        except Exception as e:
+            raise ValueError(f"Failed to export raw data tables: {str(e)}")
+            
+    def _save_raw_tables(self, directory: str, collections: Optional[Dict[str, List[dict]]] = None,
+                         project_name: Optional[str] = None) -> dict:
+        """Write the project DataFrames, and optionally the raw records, with save_tables."""
+        tables = dict(self.dataframes)
+        for name, records in (collections or {}).items():
+            tables[f"{name}{RECORDS_SUFFIX}"] = records_table(records)
+        return save_tables(
+            tables, directory,
+            metadata={'project_id': self.project_id, 'project_name': project_name,
+                      'schema': self.DATAFRAME_SCHEMA}
+        )
+            
+    def load_raw_tables(self, directory: str) -> None:
+        """Load the project DataFrames from an export_raw_tables directory.
+        
+        Args:
+            directory: Directory written by export_raw_tables
+            
+        Raises:
+            ValueError: If the export cannot be read or a collection is missing
+        """
+        try:
+            tables, metadata = load_tables(directory, self.DATAFRAME_SCHEMA)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Failed to load raw data tables: {str(e)}")
+            
+        missing = [name for name in self.DATAFRAME_SCHEMA if name not in tables]
+        if missing:
+            raise ValueError(f"Raw data export is missing: {', '.join(missing)}")
+            
+        self.dataframes = {
+            name: self._apply_schema(name, tables[name]) for name in self.DATAFRAME_SCHEMA
+        }
+        self.project_id = metadata.get('project_id')
+        self.clear_filter_cache()
+        print(f"Loaded project data from {directory}.")
+
     def generate_fc_task_report(self, project_name: str, output_filename: str) -> None:
         """Generate a report of FC tasks with their attributes.
         
@@ -536,9 +795,14 @@ class ReportService:
             print("\nFetching project data...")
             
             # Get all required data
-            tasks = self.task_service.get_all_tasks_in_project(project_id, filter_option='active')
-            task_type_attributes = self.attribute_service.get_all_task_type_attributes_in_project(project_id)
-            task_attributes = self.attribute_service.get_all_task_attributes_in_project(project_id)
+            data = fetch_concurrently({
+                'tasks': lambda: self.task_service.get_all_tasks_in_project(project_id, filter_option='active'),
+                'task_type_attributes': lambda: self.attribute_service.get_all_task_type_attributes_in_project(project_id),
+                'task_attributes': lambda: self.attribute_service.get_all_task_attributes_in_project(project_id)
+            })
+            tasks = data['tasks']
+            task_type_attributes = data['task_type_attributes']
+            task_attributes = data['task_attributes']
             
             if not all([tasks, task_type_attributes, task_attributes]):
                 raise ValueError("Failed to fetch required data")
@@ -564,77 +828,47 @@ class ReportService:
             
             print(f"\nFound {len(fc_tasks)} FC tasks. Processing...")
             
-            # Create result DataFrame
-            result_data = []
+            # Attribute type ID -> report column, using the first type with each name
+            report_columns = {
+                task_type_attributes_df.loc[task_type_attributes_df['name'] == name, 'id'].iloc[0]: name
+                for name in required_attributes
+            }
             
-            # Process each FC task with progress bar
-            from tqdm import tqdm
-            for _, task in tqdm(fc_tasks.iterrows(), total=len(fc_tasks), desc="Processing tasks"):
-                task_attrs = task_attributes_df[task_attributes_df['task_id'] == task['id']]
-                
-                # Get attribute values
-                strike_jamb = ''
-                hinge_jamb = ''
-                frame_header = ''
-                
-                # Get attribute IDs
-                strike_jamb_id = task_type_attributes_df[task_type_attributes_df['name'] == 'Strike Jamb']['id'].iloc[0] if not task_type_attributes_df[task_type_attributes_df['name'] == 'Strike Jamb'].empty else None
-                hinge_jamb_id = task_type_attributes_df[task_type_attributes_df['name'] == 'Hinge Jamb']['id'].iloc[0] if not task_type_attributes_df[task_type_attributes_df['name'] == 'Hinge Jamb'].empty else None
-                frame_header_id = task_type_attributes_df[task_type_attributes_df['name'] == 'Frame Header']['id'].iloc[0] if not task_type_attributes_df[task_type_attributes_df['name'] == 'Frame Header'].empty else None
-                
-                if not task_attrs.empty:
-                    if strike_jamb_id:
-                        strike_jamb_attr = task_attrs[task_attrs['task_type_attribute_id'] == strike_jamb_id]
-                        if not strike_jamb_attr.empty:
-                            strike_jamb = strike_jamb_attr['text_value'].iloc[0]
-                            if isinstance(strike_jamb, dict):
-                                strike_jamb = strike_jamb.get('value', '')
-                    
-                    if hinge_jamb_id:
-                        hinge_jamb_attr = task_attrs[task_attrs['task_type_attribute_id'] == hinge_jamb_id]
-                        if not hinge_jamb_attr.empty:
-                            hinge_jamb = hinge_jamb_attr['text_value'].iloc[0]
-                            if isinstance(hinge_jamb, dict):
-                                hinge_jamb = hinge_jamb.get('value', '')
-                    
-                    if frame_header_id:
-                        frame_header_attr = task_attrs[task_attrs['task_type_attribute_id'] == frame_header_id]
-                        if not frame_header_attr.empty:
-                            frame_header = frame_header_attr['text_value'].iloc[0]
-                            if isinstance(frame_header, dict):
-                                frame_header = frame_header.get('value', '')
-                
-                # Get latest updated_at or created_at
-                latest_date = None
-                for attr in [strike_jamb_attr, hinge_jamb_attr, frame_header_attr]:
-                    if not attr.empty:
-                        # Try updated_at first
-                        if 'updated_at' in attr and attr['updated_at'].iloc[0]:
-                            date = pd.to_datetime(attr['updated_at'].iloc[0])
-                            # Convert to timezone-unaware datetime
-                            if date.tz is not None:
-                                date = date.tz_localize(None)
-                            if latest_date is None or date > latest_date:
-                                latest_date = date
-                        # Fall back to created_at if updated_at is not available
-                        elif 'created_at' in attr and attr['created_at'].iloc[0]:
-                            date = pd.to_datetime(attr['created_at'].iloc[0])
-                            # Convert to timezone-unaware datetime
-                            if date.tz is not None:
-                                date = date.tz_localize(None)
-                            if latest_date is None or date > latest_date:
-                                latest_date = date
-                
-                result_data.append({
-                    'Opening': task['name'],
-                    'Strike Jamb': strike_jamb,
-                    'Hinge Jamb': hinge_jamb,
-                    'Frame Header': frame_header,
-                    'Date Submitted': latest_date if latest_date else ''
-                })
-            
-            # Create final DataFrame
-            result_df = pd.DataFrame(result_data)
+            # First value of each report attribute on each FC task
+            fc_attributes = task_attributes_df[
+                task_attributes_df['task_type_attribute_id'].isin(list(report_columns)) &
+                task_attributes_df['task_id'].isin(fc_tasks['id'])
+            ].drop_duplicates(['task_id', 'task_type_attribute_id'])
+            fc_attributes = fc_attributes.assign(
+                column=fc_attributes['task_type_attribute_id'].map(report_columns),
+                value=fc_attributes['text_value'].map(self._flatten_value)
+            )
+            values = fc_attributes.pivot(index='task_id', columns='column', values='value')
+            
+            # Latest updated_at (or created_at if not updated) across the report attributes
+            def timestamps(column):
+                if column not in fc_attributes:
+                    return pd.Series(None, index=fc_attributes.index, dtype=object)
+                stamps = fc_attributes[column]
+                return stamps.where(stamps.notna() & (stamps != ''))
+            
+            dates = pd.to_datetime(
+                timestamps('updated_at').fillna(timestamps('created_at')),
+                utc=True, format='ISO8601', errors='coerce'
+            ).dt.tz_localize(None)
+            latest_dates = dates.groupby(fc_attributes['task_id']).max()
+            
+            # Create final DataFrame in FC task order
+            task_ids = fc_tasks['id']
+            result_df = pd.DataFrame({'Opening': fc_tasks['name']})
+            for name in required_attributes:
+                column = task_ids.map(values[name]) if name in values else pd.Series('', index=task_ids.index)
+                result_df[name] = column.fillna('')
+            submitted = task_ids.map(latest_dates)
+            if submitted.isna().any():
+                submitted = submitted.astype(object).where(submitted.notna(), '')
+            result_df['Date Submitted'] = submitted
+            result_df = result_df.reset_index(drop=True)
             
             # Export to Excel
             self.export_to_excel(output_filename, result_df)
@@ -11,6 +11,9 @@ from utils.input_helpers import (
     get_single_keypress  # Add this import for global keyboard shortcuts
 )
 from utils.pdf_helpers import create_and_show_preview, close_preview_windows, download_sheets, create_and_show_multi_preview
+from utils.spatial_index import SpatialIndex
+from utils.pipeline import ResultBuffer
+from utils.project_snapshot import get_project_snapshot
 import time
 from tqdm import tqdm
 from concurrent.futures import ThreadPoolExecutor, Future
@@ -29,6 +32,20 @@ import sys
 MAX_DISTANCE = 300  # Maximum reasonable distance
 DISTANCE_STEP = 10  # Amount to adjust distance by
 
+# Default confidence rules for auto-accept mode
+AUTO_ACCEPT_RULES = {
+    'max_matches': 1,           # Matches allowed after merging duplicate highlights
+    'merge_distance': 5.0,      # Highlights closer than this (same sheet) count as one match
+    'require_floorplan': True   # Only accept matches on sheets with a floorplan_id
+}
+
+# Directions for related tasks around a UCI marker, in order of preference
+RELATED_TASK_SLOTS = {
+    'DEF': [(-1, 0), (-1, -1), (-1, 1)],  # Left
+    'FC': [(1, 0), (1, -1), (1, 1)],      # Right
+    'UCA': [(0, 1), (0, -1)]              # Bottom, then top
+}
+
 # Global lock to prevent threading conflicts between preview windows
 _preview_window_lock = threading.Lock()
 _active_preview_window = None
@@ -572,20 +589,13 @@ class PreviewWindow:
                 print("Entering main event loop - this will block until user makes a choice")
                 print(f"Distance controls are {'enabled' if self.enable_distance_controls else 'disabled'}")
                 
-                # Manual event loop to allow processing in a custom way
-                if os.name == 'nt' and 'JUPYTER_KERNEL' not in os.environ:  # Extra care for Windows non-Jupyter environment
-                    # Use native mainloop on Windows
+                # Native event loop: blocks without polling until a choice handler
+                # or the window close handler calls root.quit()
+                try:
                     self.root.mainloop()
-                else:
-                    # Custom event loop that allows us to break out when user choice is made
-                    while not hasattr(self, 'user_choice') or self.user_choice is None:
-                        try:
-                            self.root.update()
-                            time.sleep(0.05)  # Short sleep to prevent 100% CPU
-                        except Exception as e:
-                            # If an error occurs (e.g., window closed), break out
-                            print(f"Event loop interrupted: {str(e)}")
-                            break
+                except Exception as e:
+                    # If an error occurs (e.g., window closed), break out
+                    print(f"Event loop interrupted: {str(e)}")
             
             print(f"User choice received: {self.user_choice}, final distance: {self.current_distance}")
             
@@ -949,6 +959,79 @@ class SheetService(AuthManager):
             return response.json()
         return None
 
+    def batch_update_task_locations(self, project_id, position_updates, last_editor_user_id, max_workers=10, max_attempts=3):
+        """Update the locations of many tasks concurrently.
+
+        The Fieldwire API has no bulk endpoint for task positions, so each update
+        is still a single PATCH, but all of them are flushed together through a
+        rate-limited thread pool. Failed items are retried in rounds so a slow or
+        failing task never blocks the others.
+
+        Args:
+            project_id (str): Project ID
+            position_updates (list): Dicts with 'task_id', 'floorplan_id', 'pos_x',
+                'pos_y' and an optional 'label' used for logging
+            last_editor_user_id (int): User ID of the person making the update
+            max_workers (int): Maximum number of concurrent requests
+            max_attempts (int): Maximum attempts per task
+
+        Returns:
+            dict: Task ID -> updated task data, or None if every attempt failed
+        """
+        from utils.rate_limiter import RateLimiter
+
+        results = {update['task_id']: None for update in position_updates}
+        if not position_updates:
+            return results
+
+        rate_limiter = RateLimiter(max_requests=max_workers)
+
+        def apply_update(update):
+            rate_limiter.wait_for_slot()
+            return self.update_task_location(
+                project_id=project_id,
+                task_id=update['task_id'],
+                floorplan_id=update['floorplan_id'],
+                pos_x=update['pos_x'],
+                pos_y=update['pos_y'],
+                last_editor_user_id=last_editor_user_id
+            )
+
+        pending = list(position_updates)
+        attempt = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending and attempt < max_attempts:
+                attempt += 1
+                if attempt > 1:
+                    print(f"Retrying {len(pending)} failed location update(s) (attempt {attempt}/{max_attempts})")
+                    time.sleep(1)  # One pause per retry round, not per task
+
+                futures = [(update, executor.submit(apply_update, update)) for update in pending]
+                failed = []
+                for update, future in futures:
+                    label = update.get('label', update['task_id'])
+                    try:
+                        updated_task = future.result()
+                    except ValueError as e:
+                        # Invalid input will not succeed on retry
+                        print(f"Invalid location update for {label}: {str(e)}")
+                        continue
+                    except Exception as e:
+                        print(f"Error updating location for {label}: {str(e)}")
+                        updated_task = None
+
+                    if updated_task:
+                        results[update['task_id']] = updated_task
+                    else:
+                        failed.append(update)
+                pending = failed
+
+        succeeded = sum(1 for result in results.values() if result)
+        print(f"Batch location update complete: {succeeded}/{len(results)} task(s) updated")
+        for update in pending:
+            print(f"Failed to update location for {update.get('label', update['task_id'])} after {max_attempts} attempts")
+        return results
+
     @update_last_response()
     def get_sheet_by_id(self, project_id, sheet_id):
         """Get details of a specific sheet.
@@ -1042,48 +1125,55 @@ class SheetService(AuthManager):
         print(f"Search complete for opening number '{number}' - Found {match_count} potential matches")
         return locations
 
-    def process_task_locations(self, project_id, task_service, user_id):
+    def process_task_locations(self, project_id, task_service, user_id, auto_accept_rules=None,
+                               save_dir=None, task_selection=None, processing_mode=None, review=None):
+        """Locate UCI tasks on sheets and position them with their related tasks.
+        
+        Each of save_dir, task_selection, processing_mode and review is asked
+        for when not given. With all four given and processing_mode='auto',
+        review=False, the workflow runs unattended without a terminal or display.
+        
+        Args:
+            project_id (str): Project ID
+            task_service (TaskService): Service used to retrieve tasks
+            user_id (int): User ID recorded as last editor
+            auto_accept_rules (dict, optional): Overrides for AUTO_ACCEPT_RULES used in 'auto' mode
+            save_dir (str, optional): Directory for preview images and sheet files
+            task_selection (str, optional): 'all' or 'unpositioned'
+            processing_mode (str, optional): 'interactive' or 'auto'
+            review (bool, optional): In 'auto' mode, whether to review ambiguous
+                matches after the batch pass
+        """
         print("\n=== Processing Task Locations ===")
         if not isinstance(user_id, int):
             print("Error: user_id must be an integer")
             return
             
-        # Initialize tkinter root for directory selection
-        root = tk.Tk()
-        root.withdraw()  # Hide the main window
-        
-        # Prompt user for save directory
-        print("\nSelect directory to save match preview images:")
-        save_dir = filedialog.askdirectory(title="Select Directory to Save Preview Images")
+        save_dir, sheets_dir = self._prepare_save_dir(save_dir)
         if not save_dir:
-            print("No directory selected. Exiting.")
-            root.destroy()
             return
-        print(f"Images will be saved to: {save_dir}")
-        
-        # Create a subfolder for sheet files
-        sheets_dir = os.path.join(save_dir, "sheet_files")
-        if not os.path.exists(sheets_dir):
-            os.makedirs(sheets_dir)
-            print(f"Sheet files will be saved to: {sheets_dir}")
         
-        # Prompt user for task selection type
-        print("\nChoose which UCI tasks to process:")
-        print("  - Type 'all' to process all UCI tasks")
-        print("  - Type 'unpositioned' to process only UCI tasks without positions")
-        task_selection = input("Enter your choice: ").strip().lower()
-        while task_selection not in ['all', 'unpositioned']:
-            print("Invalid choice. Please enter 'all' or 'unpositioned'.")
-            task_selection = input("Enter your choice: ").strip().lower()
-        
-        # Destroy the root window to avoid conflicts with PreviewWindow
-        root.destroy()
+        task_selection = self._choose_option(task_selection, "Choose which UCI tasks to process:", [
+            ('all', 'process all UCI tasks'),
+            ('unpositioned', 'process only UCI tasks without positions')
+        ])
+        processing_mode = self._choose_option(processing_mode, "Choose processing mode:", [
+            ('interactive', 'confirm every match in the preview window'),
+            ('auto', 'apply unambiguous matches automatically and review only the rest')
+        ])
+        if not task_selection or not processing_mode:
+            return
+        auto_mode = processing_mode == 'auto'
             
         current_distance = 30
         print("\nRetrieving tasks...")
         tasks = task_service.get_all_tasks_in_project(project_id, filter_option='active')
         def_tasks, fc_tasks, uci_tasks, uca_tasks = self._create_task_maps(tasks)
         
+        # Index existing markers so related tasks are not placed on top of them
+        spatial_index = SpatialIndex.from_tasks(tasks)
+        print(f"Indexed {len(spatial_index)} positioned tasks")
+        
         if task_selection == 'all':
             tasks_to_process = uci_tasks
             print(f"\nProcessing all {len(uci_tasks)} UCI tasks")
@@ -1101,7 +1191,7 @@ class SheetService(AuthManager):
             return
             
         print("\nRetrieving sheets...")
-        sheets = self.get_all_sheets_in_project(project_id)
+        sheets = self.get_sheets_from_snapshot(project_id, refresh=True)
         print(f"Found {len(sheets)} active sheets")
         if not sheets:
             print("No active sheets found. Exiting.")
@@ -1127,114 +1217,60 @@ class SheetService(AuthManager):
             
             task_items = list(tasks_to_process.items())
             
-            # Create a larger queue to store more search results
-            results_queue = queue.Queue(maxsize=100)  # Increased from 50 to 100
-            
-            # Create a queue for task location updates
+            # Search results flow from the background searcher to the preview loop through a
+            # bounded buffer, and confirmed updates flow to the update worker through
+            # update_queue. Every thread blocks on a condition variable or queue while idle.
+            search_results = ResultBuffer(max_pending=100)
             update_queue = queue.Queue()
             
-            # Create a set to track which numbers have been searched
-            searched_numbers = set()
-            
             # Create a set to track tasks that have been updated
             updated_tasks = set()
             
-            # Create a threading event to signal the background threads to stop
+            # Wakes the monitor thread when processing ends
             stop_event = threading.Event()
             
             # Add counters for progress reporting
             search_completed_count = 0
             update_completed_count = 0
             
-            # Modified background searcher function that continuously searches
+            # Background searcher: publishes results in task order, waiting while the buffer is full
             def continuous_background_searcher():
                 nonlocal search_completed_count
-                task_index = 0
-                last_progress_time = time.time()
-                last_task_processed_time = time.time()
                 search_status = "running"
                 
                 try:
                     print(f"\nStarting background search for {len(task_items)} opening numbers across {len(sheets)} sheets")
                     
-                    while not stop_event.is_set() and task_index < len(task_items):
-                        # Print periodic progress updates regardless of activity
-                        current_time = time.time()
-                        # Check if we've been stuck for too long (over 5 minutes without progress)
-                        if current_time - last_task_processed_time > 300:  # 5 minutes
-                            print(f"\nWARNING: No search progress for 5 minutes. Last processed task index: {task_index}/{len(task_items)}")
-                            print(f"Current search status: {search_status}")
-                            print("Attempting to continue...")
-                            # Reset the timer to avoid repeated warnings
-                            last_task_processed_time = current_time
-                            
-                        if current_time - last_progress_time > 5:  # Every 5 seconds
-                            print(f"\rBackground search progress: {search_completed_count}/{len(task_items)} completed ({search_completed_count/len(task_items)*100:.1f}%), Queue size: {results_queue.qsize()}/{results_queue.maxsize}, Cache size: {len(cached_results)}", end="")
-                            last_progress_time = current_time
-                            
-                        number, _ = task_items[task_index]
-                        
-                        # Skip if this number has already been searched
-                        if number in searched_numbers:
-                            task_index += 1
-                            last_task_processed_time = time.time()  # Update last processed time
-                            continue
+                    for number, _ in task_items:
+                        if search_results.cancelled:
+                            break
                         
                         search_status = f"searching for '{number}'"
                         try:
-                            # Search for this number
                             locations = self._search_number_across_sheets_with_rate_limit(
                                 executor, project_id, sheets, sheet_paths, number, api_limit=10
                             )
-                            
-                            # Put the result in the queue, but don't block indefinitely
-                            # if the queue is full (which means the user is way behind in processing)
-                            try:
-                                search_status = f"adding '{number}' to queue"
-                                results_queue.put((number, locations), block=True, timeout=1)
-                                # Only add to searched_numbers after successfully adding to queue
-                                searched_numbers.add(number)
-                                # Move to the next task
-                                task_index += 1
-                                search_completed_count += 1
-                                last_task_processed_time = time.time()  # Update last processed time
-                                # Update the last progress time
-                                last_progress_time = time.time()
-                            except queue.Full:
-                                # If the queue is full, mark this number as "searched too far ahead"
-                                # and move on to the next one instead of getting stuck in a loop
-                                # We'll cache the results so they can be retrieved later
-                                search_status = f"caching '{number}' (queue full)"
-                                print(f"\nQueue full, caching results for opening number {number} and moving on")
-                                cached_results[number] = locations
-                                searched_numbers.add(number)
-                                task_index += 1
-                                search_completed_count += 1
-                                last_task_processed_time = time.time()  # Update last processed time
-                                # Update the last progress time
-                                last_progress_time = time.time()
-                                continue
-                            
                         except Exception as e:
-                            search_status = f"error with '{number}': {str(e)}"
                             print(f"\nError searching for opening number {number}: {str(e)}")
-                            # Even on error, move to the next task but don't add to searched_numbers
-                            task_index += 1
-                            last_task_processed_time = time.time()  # Update last processed time
+                            # Publish an empty result so the preview loop moves on
+                            locations = []
+                        
+                        search_status = f"adding '{number}' to buffer"
+                        if not search_results.put(number, locations):
+                            break
+                        search_completed_count += 1
                     
-                    # Final progress report
-                    if task_index >= len(task_items):
-                        search_status = "completed"
-                        print(f"\nBackground search completed: {search_completed_count}/{len(task_items)} items processed")
-                    else:
-                        search_status = "stopped by user"
-                        print(f"\nBackground search stopped: {search_completed_count}/{len(task_items)} items processed")
+                    search_status = "stopped by user" if search_results.cancelled else "completed"
+                    print(f"\nBackground search {search_status}: {search_completed_count}/{len(task_items)} items processed")
                 
                 except Exception as e:
                     search_status = f"failed with error: {str(e)}"
                     print(f"\nBackground search thread encountered an unhandled error: {str(e)}")
                     import traceback
                     traceback.print_exc()
+                finally:
+                    # Wake the preview loop even if the search ended early
+                    search_results.finish()
                 
                 print(f"\nSearch thread status: {search_status} (Completed: {search_completed_count}/{len(task_items)})")
                 
@@ -1245,14 +1281,10 @@ class SheetService(AuthManager):
                 last_check_time = time.time()
                 monitor_interval = 30  # Check every 30 seconds
                 
-                while not stop_event.is_set():
-                    time.sleep(monitor_interval)
+                # wait() returns True as soon as processing ends
+                while not stop_event.wait(monitor_interval):
                     current_time = time.time()
                     
-                    # Skip if just started
-                    if current_time - last_check_time < monitor_interval:
-                        continue
-                    
                     # Check for progress in both threads
                     search_progress = search_completed_count - last_search_count
                     update_progress = update_completed_count - last_update_count
@@ -1267,18 +1299,14 @@ class SheetService(AuthManager):
                     print(f"STATUS REPORT (after {time_diff:.1f} seconds):")
                     print(f"Search: {search_completed_count}/{len(task_items)} ({search_completed_count/len(task_items)*100:.1f}%) - Rate: {search_rate:.1f} items/min")
                     print(f"Updates: {update_completed_count} completed, {update_queue.qsize()} pending - Rate: {update_rate:.1f} items/min")
-                    print(f"Results queue: {results_queue.qsize()}/{results_queue.maxsize} items")
-                    print(f"Cache: {len(cached_results)} items")
+                    print(f"Search results waiting: {len(search_results)}/{search_results.max_pending}")
                     
                     # Report potential issues
-                    if search_progress == 0 and search_completed_count < len(task_items):
-                        print("WARNING: Search appears to be stalled - no progress since last check")
-                    
                     if update_progress == 0 and update_queue.qsize() > 0:
                         print("WARNING: Updates appear to be stalled with pending items")
                     
-                    if results_queue.full():
-                        print("NOTE: Results queue is full - items being cached instead")
+                    if len(search_results) >= search_results.max_pending:
+                        print("NOTE: Search is paused until more results are reviewed")
                     
                     print("="*70)
                     
@@ -1295,98 +1323,118 @@ class SheetService(AuthManager):
             # Task update worker thread function
             def task_update_worker():
                 nonlocal update_completed_count
-                last_update_time = time.time()
-                last_status_time = time.time()
                 update_status = "running"
                 task_retry_counts = {}  # Track retry counts for each task
                 max_task_retries = 3    # Maximum retries per task
+                max_batch_size = 20     # Maximum confirmed openings flushed together
+                stopping = False        # Set once the stop sentinel (None) is received
                 
                 try:
                     print("\nStarting task update background worker")
                     
-                    # Continue processing as long as there are items in the queue, even if stop_event is set
-                    while not (stop_event.is_set() and update_queue.empty()):
-                        current_time = time.time()
+                    while True:
+                        # Block until an update arrives; after the stop sentinel, drain what is left
+                        if stopping:
+                            try:
+                                batch = [update_queue.get_nowait()]
+                            except queue.Empty:
+                                break
+                        else:
+                            update_status = "idle - waiting for tasks"
+                            batch = [update_queue.get()]
+                        
+                        # Accumulate every other confirmed opening already waiting so they
+                        # are flushed together instead of one round trip at a time
+                        while len(batch) < max_batch_size:
+                            try:
+                                batch.append(update_queue.get_nowait())
+                            except queue.Empty:
+                                break
+                        
+                        if None in batch:
+                            stopping = True
+                        updates = [update_task for update_task in batch if update_task is not None]
+                        if not updates:
+                            for _ in batch:
+                                update_queue.task_done()
+                            continue
                         
-                        # Check if we've been idle for too long (5 minutes) with pending updates
-                        if current_time - last_update_time > 300 and update_queue.qsize() > 0:
-                            pending = update_queue.qsize()
-                            print(f"\nWARNING: Update worker idle for 5 minutes with {pending} pending updates")
-                            print(f"Current update status: {update_status}")
-                            print("Attempting to continue processing...")
-                            # Reset timer to avoid repeated warnings
-                            last_update_time = current_time
-                            
-                        # Periodically report update status
-                        if current_time - last_status_time > 10:  # Every 10 seconds
-                            if update_queue.qsize() > 0:
-                                print(f"\rUpdate worker status: {update_completed_count} tasks updated, {update_queue.qsize()} pending", end="")
-                                # If stop event is set but we still have tasks, note that we're finishing
-                                if stop_event.is_set():
-                                    print(f" (finishing final tasks)", end="")
-                            last_status_time = current_time
-                            
                         try:
-                            # Get an update task from the queue with a timeout
-                            # Use a shorter timeout if stop_event is set
-                            timeout = 0.5 if stop_event.is_set() else 1.0
-                            update_task = update_queue.get(timeout=timeout)
+                            update_status = f"updating {len(updates)} opening(s)"
+                            print(f"\nFlushing location updates for {len(updates)} confirmed opening(s)")
                             
-                            # If we're stopping, print that we're processing a final task
-                            if stop_event.is_set():
-                                print("\nProcessing final task from queue before stopping")
-                            
-                            # Unpack the update task
-                            (
+                            # Build one position update per UCI task and per related DEF/FC/UCA task
+                            position_updates = []
+                            for (
                                 update_number, 
                                 uci_task_id, 
                                 related_tasks, 
                                 sheet, 
                                 center_x, 
                                 center_y, 
-                                current_distance, 
-                                user_id,
-                                sheet_path,
-                                task_positions,
-                                save_dir
-                            ) = update_task
-                            
-                            # Track retry count for this task
-                            if update_number not in task_retry_counts:
-                                task_retry_counts[update_number] = 0
+                                update_distance, 
+                                _, 
+                                _, 
+                                task_positions, 
+                                _
+                            ) in updates:
+                                position_updates.append({
+                                    'task_id': uci_task_id,
+                                    'floorplan_id': sheet['floorplan_id'],
+                                    'pos_x': center_x,
+                                    'pos_y': center_y,
+                                    'label': f"UCI {update_number}"
+                                })
+                                
+                                # Positions for related tasks relative to the UCI marker,
+                                # overridden by the positions planned in the preview
+                                related_positions = {
+                                    'DEF': {'x': center_x - update_distance, 'y': center_y},  # Left
+                                    'FC': {'x': center_x + update_distance, 'y': center_y},   # Right
+                                    'UCA': {'x': center_x, 'y': center_y + update_distance}   # Bottom
+                                }
+                                for position in task_positions:
+                                    if not position.get('is_main') and position.get('task_type') in related_positions:
+                                        related_positions[position['task_type']] = {
+                                            'x': position['pos_x'],
+                                            'y': position['pos_y']
+                                        }
+                                for task_type, related_task in related_tasks:
+                                    if related_task:
+                                        pos = related_positions[task_type]
+                                        position_updates.append({
+                                            'task_id': related_task['id'],
+                                            'floorplan_id': sheet['floorplan_id'],
+                                            'pos_x': pos['x'],
+                                            'pos_y': pos['y'],
+                                            'label': f"{task_type} {update_number}"
+                                        })
                             
-                            update_status = f"updating '{update_number}'"
-                            print(f"\nProcessing update for opening number {update_number} on sheet {sheet['name']}")
+                            # All user ids are the same within a session
+                            batch_results = self.batch_update_task_locations(
+                                project_id, position_updates, updates[0][7]
+                            )
                             
-                            try:
-                                # Update the UCI task location with retry handling
-                                retry_attempts = 0
-                                max_attempts = 3
-                                success = False
+                            # Report per-opening status
+                            for update_task in updates:
+                                (
+                                    update_number, 
+                                    uci_task_id, 
+                                    related_tasks, 
+                                    sheet, 
+                                    center_x, 
+                                    center_y, 
+                                    _, 
+                                    _,
+                                    sheet_path,
+                                    task_positions,
+                                    save_dir
+                                ) = update_task
                                 
-                                while retry_attempts < max_attempts and not success:
-                                    try:
-                                        updated_task = self.update_task_location(
-                                            project_id=project_id,
-                                            task_id=uci_task_id,
-                                            floorplan_id=sheet['floorplan_id'],
-                                            pos_x=center_x,
-                                            pos_y=center_y,
-                                            last_editor_user_id=user_id
-                                        )
-                                        
-                                        if updated_task:
-                                            success = True
-                                        else:
-                                            print(f"Attempt {retry_attempts+1}/{max_attempts} failed. Retrying...")
-                                            retry_attempts += 1
-                                            time.sleep(1)  # Brief delay before retry
-                                    except Exception as e:
-                                        print(f"Error on attempt {retry_attempts+1}/{max_attempts}: {str(e)}")
-                                        retry_attempts += 1
-                                        time.sleep(1)  # Brief delay before retry
+                                if update_number not in task_retry_counts:
+                                    task_retry_counts[update_number] = 0
                                 
-                                if success:
+                                if batch_results.get(uci_task_id):
                                     # Save preview image with yes_ prefix in the background
                                     if save_dir:
                                         try:
@@ -1403,95 +1451,35 @@ class SheetService(AuthManager):
                                         except Exception as e:
                                             print(f"Error saving preview image: {str(e)}")
                                     
-                                    # Add positions for related tasks if they exist
-                                    related_positions = {
-                                        'DEF': {'x': center_x - current_distance, 'y': center_y},  # Left
-                                        'FC': {'x': center_x + current_distance, 'y': center_y},   # Right
-                                        'UCA': {'x': center_x, 'y': center_y + current_distance}   # Bottom
-                                    }
-                                    
-                                    # Update related task locations
-                                    related_count = 0
-                                    for task_type, related_task in related_tasks:
-                                        if related_task:
-                                            pos = related_positions[task_type]
-                                            try:
-                                                # Try up to 3 times for each related task
-                                                for attempt in range(3):
-                                                    try:
-                                                        updated_related = self.update_task_location(
-                                                            project_id=project_id,
-                                                            task_id=related_task['id'],
-                                                            floorplan_id=sheet['floorplan_id'],
-                                                            pos_x=pos['x'],
-                                                            pos_y=pos['y'],
-                                                            last_editor_user_id=user_id
-                                                        )
-                                                        if updated_related:
-                                                            print(f"{task_type} task location updated successfully")
-                                                            related_count += 1
-                                                            break  # Success, exit retry loop
-                                                        else:
-                                                            print(f"Failed to update {task_type} task location (attempt {attempt+1}/3)")
-                                                            if attempt < 2:  # Only sleep if we're going to retry
-                                                                time.sleep(1)
-                                                    except Exception as e:
-                                                        print(f"Error updating {task_type} task on attempt {attempt+1}: {str(e)}")
-                                                        if attempt < 2:  # Only sleep if we're going to retry
-                                                            time.sleep(1)
-                                            except Exception as e:
-                                                print(f"Error updating {task_type} task location: {str(e)}")
+                                    related_count = sum(
+                                        1 for _, related_task in related_tasks
+                                        if related_task and batch_results.get(related_task['id'])
+                                    )
                                     
                                     # Add task to the updated tasks set
                                     updated_tasks.add(update_number)
                                     update_completed_count += 1
-                                    last_update_time = time.time()  # Track successful updates
                                     
-                                    # Print detailed completion message
-                                    print(f"\nCompleted update for opening number {update_number}")
-                                    print(f"Updated {related_count} related task(s)")
-                                    print(f"Task updates processed: {update_completed_count}, Pending: {update_queue.qsize()}")
+                                    print(f"Completed update for opening number {update_number} ({related_count} related task(s) updated)")
                                 else:
-                                    # All retries failed
-                                    print(f"Failed to update UCI task {update_number} after {max_attempts} attempts")
+                                    # All attempts for the UCI task failed
                                     task_retry_counts[update_number] += 1
-                                    
                                     if task_retry_counts[update_number] < max_task_retries:
-                                        print(f"Will retry entire task later (attempt {task_retry_counts[update_number]+1}/{max_task_retries})")
+                                        print(f"Will retry opening number {update_number} later (attempt {task_retry_counts[update_number]+1}/{max_task_retries})")
                                         # Put task back in queue for later retry
                                         update_queue.put(update_task)
                                     else:
                                         print(f"Giving up on task {update_number} after {max_task_retries} full retries")
-                                
-                            except Exception as e:
-                                update_status = f"error updating '{update_number}': {str(e)}"
-                                print(f"\nError updating locations for opening number {update_number}: {str(e)}")
-                                
-                                # Increment retry count and decide if we should retry later
-                                task_retry_counts[update_number] += 1
-                                if task_retry_counts[update_number] < max_task_retries:
-                                    print(f"Will retry task {update_number} later (attempt {task_retry_counts[update_number]+1}/{max_task_retries})")
-                                    update_queue.put(update_task)
-                                else:
-                                    print(f"Giving up on task {update_number} after {max_task_retries} retries")
                             
-                            # Mark the task as done in the queue if we're not retrying
-                            if success or task_retry_counts.get(update_number, 0) >= max_task_retries:
-                                update_queue.task_done()
+                            print(f"Task updates processed: {update_completed_count}, Pending: {update_queue.qsize()}")
                         
-                        except queue.Empty:
-                            # Queue is empty, just continue the loop
-                            update_status = "idle - waiting for tasks"
-                            continue
                         except Exception as e:
                             update_status = f"error in task processing: {str(e)}"
                             print(f"\nError in task update worker: {str(e)}")
-                            
-                            # Try to mark the task as done to avoid deadlock
-                            try:
+                        
+                        finally:
+                            for _ in batch:
                                 update_queue.task_done()
-                            except Exception:
-                                pass
                     
                     print(f"\nUpdate worker stopped: {update_completed_count} tasks processed")
                     
@@ -1513,246 +1501,224 @@ class SheetService(AuthManager):
             monitor_thread.daemon = True
             monitor_thread.start()
             
-            # Dictionary to store results for numbers that might be processed out of order
-            cached_results = {}
-            
             current_task_index = 0
             total_tasks = len(task_items)
             remaining_tasks = total_tasks
-            out_of_order_count = 0  # Count consecutive out-of-order results
-            max_out_of_order = 5  # Maximum consecutive out-of-order results before skipping ahead
             
-            while current_task_index < len(task_items):
-                # Process tkinter events to keep UI responsive
-                process_events()
-                
-                number, uci_task = task_items[current_task_index]
-                
-                # Skip if this task has already been updated
-                if number in updated_tasks:
-                    print(f"\nSkipping task: {uci_task['name']} (already updated)")
-                    current_task_index += 1
-                    remaining_tasks -= 1
-                    continue
-                
-                print("\n" + "="*50)
-                print(f"Processing task: {uci_task['name']}")
-                print(f"Remaining opening numbers to process: {remaining_tasks}")
-                print(f"Search progress: {search_completed_count}/{len(task_items)}, Update progress: {update_completed_count}/{len(updated_tasks) + update_queue.qsize()}")
-                print("="*50)
-                
-                # Check if we already have cached results for this number
-                if number in cached_results:
-                    print(f"Using cached results for opening number {number}")
-                    result_number = number
-                    locations = cached_results.pop(number)  # Remove from cache after retrieving
-                    out_of_order_count = 0  # Reset the counter since we found a match
-                else:
-                    # If we've received too many out-of-order results in sequence, 
-                    # we might be falling behind the background thread
-                    if out_of_order_count >= max_out_of_order and len(cached_results) > 0:
-                        # Find the nearest available cached result to skip ahead
-                        nearest_index = float('inf')
-                        nearest_number = None
-                        
-                        for cached_number in cached_results:
-                            # Find this number in the task_items
-                            for i, (task_number, _) in enumerate(task_items):
-                                if task_number == cached_number and i > current_task_index:
-                                    if i < nearest_index:
-                                        nearest_index = i
-                                        nearest_number = cached_number
-                        
-                        if nearest_number:
-                            # Skip ahead to process this cached result
-                            skipped_count = nearest_index - current_task_index
-                            print(f"Falling behind background search - skipping ahead {skipped_count} tasks to {nearest_number}")
-                            current_task_index = nearest_index
-                            remaining_tasks -= skipped_count
-                            out_of_order_count = 0
-                            continue
+            # In auto mode, openings that need a human decision are appended to
+            # work_items and reviewed once the batch pass is complete
+            work_items = list(task_items)
+            review_locations = {}
+            review_rows = []
+            thumbnail_futures = []
+            review_prompted = False
+            auto_accepted_count = 0
+            
+            try:
+                while current_task_index < len(work_items):
+                    # Process tkinter events to keep UI responsive
+                    process_events()
                     
-                    # Wait for the background thread to provide results
-                    try:
-                        # First check if we've received the result for this number already
-                        if not number in searched_numbers:
-                            print(f"Waiting for search results for opening number {number}...")
-                        
-                        # Use a smaller timeout and process events while waiting
-                        wait_start = time.time()
-                        result_received = False
-                        
-                        while not result_received and time.time() - wait_start < 60:  # 1-minute total timeout
-                            try:
-                                # Try to get results with a short timeout
-                                result_number, locations = results_queue.get(timeout=0.5)
-                                result_received = True
-                            except queue.Empty:
-                                # Process UI events while waiting
-                                process_events()
-                                # Short sleep to avoid CPU spinning
-                                time.sleep(0.1)
-                        
-                        if not result_received:
-                            print(f"Timeout waiting for search results for opening number {number}")
-                            # If we time out, skip this number
-                            current_task_index += 1
-                            remaining_tasks -= 1
-                            continue
-                        
-                        # If we got results for a different number, cache them for later
-                        if result_number != number:
-                            print(f"Received results for opening number {result_number} instead of {number} - caching for later")
-                            cached_results[result_number] = locations
-                            # Increment the out-of-order counter
-                            out_of_order_count += 1
-                            # Continue waiting for the right number
-                            continue
-                        else:
-                            # Reset the counter since we found a match
-                            out_of_order_count = 0
-                    except Exception as e:
-                        print(f"Error getting search results: {str(e)}")
-                        # If we encounter an error, skip this number
+                    number, uci_task = work_items[current_task_index]
+                    in_review_phase = current_task_index >= len(task_items)
+                    
+                    if in_review_phase and not review_prompted:
+                        review_prompted = True
+                        print(f"\nAuto mode pass complete: {auto_accepted_count} opening(s) auto-accepted, {len(review_locations)} need review")
+                        if save_dir and review_rows:
+                            self._report_thumbnail_failures(thumbnail_futures)
+                            self._write_review_manifest(save_dir, review_rows)
+                        if not self._confirm_review(review, len(review_locations), 'opening(s)'):
+                            break
+                    
+                    # Skip if this task has already been updated
+                    if number in updated_tasks:
+                        print(f"\nSkipping task: {uci_task['name']} (already updated)")
                         current_task_index += 1
                         remaining_tasks -= 1
                         continue
-                
-                if not locations:
-                    print(f"No locations found for opening number {number}")
-                    remaining_tasks -= 1
-                    current_task_index += 1
-                    continue
                     
-                location_found = False
-                rejected_count = 0  # Counter for rejected matches for sequential filenames
-                current_match_index = 0  # Track current match index for cycling
-                skip_task = False  # Flag to skip to next task
-                
-                # Cycle through matches until user accepts one or skips the task
-                while not location_found and not skip_task:
-                    location = locations[current_match_index]
+                    print("\n" + "="*50)
+                    print(f"Processing task: {uci_task['name']}")
+                    print(f"Remaining opening numbers to process: {remaining_tasks}")
+                    print(f"Search progress: {search_completed_count}/{len(task_items)}, Update progress: {update_completed_count}/{len(updated_tasks) + update_queue.qsize()}")
+                    print("="*50)
                     
-                    # Modified to use new async update method
-                    result = self._process_task_location_with_async_update(
-                        project_id,
-                        uci_task,
-                        location.sheet,
-                        location.center_x,
-                        location.center_y,
-                        def_tasks,
-                        fc_tasks,
-                        uca_tasks,
-                        number,
-                        current_distance,
-                        user_id,
-                        location.sheet_path,
-                        save_dir,  # Pass save directory to the processing function
-                        rejected_count,  # Pass the current rejected count
-                        update_queue,  # Pass the update queue for async updates
-                        match_number=current_match_index + 1,  # Pass current match number
-                        total_matches=len(locations)  # Pass total matches
-                    )
+                    if in_review_phase:
+                        locations = review_locations.pop(number)
+                    else:
+                        # Wait for the background searcher to publish results for this number
+                        found, locations = search_results.get(number)
+                        if not found:
+                            print(f"No search results available for opening number {number}")
+                            current_task_index += 1
+                            remaining_tasks -= 1
+                            continue
                     
-                    if isinstance(result, tuple):
-                        location_found, current_distance, was_rejected = result
-                        if was_rejected:
-                            rejected_count += 1
-                            # Move to next match (cycle back to first if at end)
-                            current_match_index = (current_match_index + 1) % len(locations)
-                            print(f"Moving to match {current_match_index + 1} of {len(locations)} for opening number {number}")
-                    elif result == True:
-                        location_found = result
-                    elif result == "skip_task":
-                        # User pressed 's' to skip the entire task
-                        skip_task = True
-                        print(f"User skipped opening number {number} - moving to next task")
-                    elif result == False:
-                        # This shouldn't happen with the new logic, but handle it just in case
-                        print(f"Unexpected result: {result}. Skipping task.")
-                        skip_task = True
-                
-                # Save any remaining matches as rejected images (only if user accepted one match)
-                if location_found:
-                    for i, location in enumerate(locations):
-                        if i != current_match_index:  # Skip the accepted match
-                            try:
-                                rejected_count += 1
-                                self._save_preview_image(
-                                    sheet_path=location.sheet_path,
-                                    center_x=location.center_x,
-                                    center_y=location.center_y,
-                                    number=number,
-                                    save_dir=save_dir,
-                                    task_positions=[{
-                                        'pos_x': location.center_x,
-                                        'pos_y': location.center_y,
-                                        'task_type': 'UCI',
-                                        'is_main': True
-                                    }],
-                                    filename_prefix=f"no_{number}_{rejected_count}"
-                                )
-                                print(f"Saved rejected match image: no_{number}_{rejected_count}.jpg")
-                            except Exception as e:
-                                print(f"Error saving rejected match image: {str(e)}")
+                    if not locations:
+                        print(f"No locations found for opening number {number}")
+                        remaining_tasks -= 1
+                        current_task_index += 1
+                        continue
+                    
+                    if auto_mode and not in_review_phase:
+                        auto_location = self._select_auto_accept_location(locations, auto_accept_rules)
+                        if auto_location and not auto_location.sheet.get('floorplan_id'):
+                            # Task positions need a floorplan even when the rules allow sheets without one
+                            print(f"Match for opening number {number} is on a sheet without a floorplan - not auto-accepting")
+                            auto_location = None
+                        if auto_location:
+                            # Queue the update exactly as a confirmed preview would
+                            related_tasks = [
+                                ('DEF', def_tasks.get(number)),
+                                ('FC', fc_tasks.get(number)),
+                                ('UCA', uca_tasks.get(number))
+                            ]
+                            floorplan_id = auto_location.sheet.get('floorplan_id')
+                            related_positions = self._plan_related_positions(
+                                spatial_index, floorplan_id, number, uci_task['id'],
+                                auto_location.center_x, auto_location.center_y,
+                                related_tasks, current_distance
+                            )
+                            task_positions = [{
+                                'pos_x': auto_location.center_x,
+                                'pos_y': auto_location.center_y,
+                                'task_type': 'UCI',
+                                'is_main': True
+                            }]
+                            for task_type, related_task in related_tasks:
+                                if related_task:
+                                    task_positions.append({
+                                        'pos_x': related_positions[task_type]['x'],
+                                        'pos_y': related_positions[task_type]['y'],
+                                        'task_type': task_type,
+                                        'is_main': False
+                                    })
+                            update_queue.put((
+                                number,
+                                uci_task['id'],
+                                related_tasks,
+                                auto_location.sheet,
+                                auto_location.center_x,
+                                auto_location.center_y,
+                                current_distance,
+                                user_id,
+                                auto_location.sheet_path,
+                                task_positions,
+                                save_dir
+                            ))
+                            self._record_placement(
+                                spatial_index, floorplan_id, uci_task['id'],
+                                auto_location.center_x, auto_location.center_y,
+                                related_tasks, related_positions
+                            )
+                            auto_accepted_count += 1
+                            remaining_tasks -= 1
+                            print(f"Auto-accepted single match for opening number {number} on sheet {auto_location.sheet.get('name', 'Unknown Sheet')}")
+                        else:
+                            print(f"{len(locations)} ambiguous match(es) for opening number {number} - queued for review")
+                            review_locations[number] = locations
+                            work_items.append((number, uci_task))
+                            if save_dir:
+                                review_rows.extend(self._queue_review_thumbnails(executor, number, locations, save_dir, futures=thumbnail_futures))
+                        current_task_index += 1
+                        continue
                         
-                if location_found:
-                    print(f"Successfully processed opening number {number} (Update in progress)")
-                else:
-                    print(f"No suitable location found for opening number {number}")
+                    location_found = False
+                    rejected_count = 0  # Counter for rejected matches for sequential filenames
+                    current_match_index = 0  # Track current match index for cycling
+                    skip_task = False  # Flag to skip to next task
                     
-                remaining_tasks -= 1
-                current_task_index += 1
-                
-            # Before stopping the threads, make sure all queued updates have been processed
-            print("\nAll tasks have been processed by user. Waiting for update queue to empty...")
-            
-            # Wait for queued updates to complete before stopping threads
-            wait_start = time.time()
-            wait_timeout = 30  # 30 seconds
-            
-            # If there are pending updates, wait for the queue to empty or timeout
-            if not update_queue.empty():
-                queue_size = update_queue.qsize()
-                print(f"Waiting for {queue_size} pending updates to complete before stopping threads...")
-                
-                while not update_queue.empty() and time.time() - wait_start < wait_timeout:
-                    # Process events to keep UI responsive
-                    process_events()
+                    # Cycle through matches until user accepts one or skips the task
+                    while not location_found and not skip_task:
+                        location = locations[current_match_index]
+                        
+                        # Modified to use new async update method
+                        result = self._process_task_location_with_async_update(
+                            project_id,
+                            uci_task,
+                            location.sheet,
+                            location.center_x,
+                            location.center_y,
+                            def_tasks,
+                            fc_tasks,
+                            uca_tasks,
+                            number,
+                            current_distance,
+                            user_id,
+                            location.sheet_path,
+                            save_dir,  # Pass save directory to the processing function
+                            rejected_count,  # Pass the current rejected count
+                            update_queue,  # Pass the update queue for async updates
+                            match_number=current_match_index + 1,  # Pass current match number
+                            total_matches=len(locations),  # Pass total matches
+                            spatial_index=spatial_index
+                        )
+                        
+                        if isinstance(result, tuple):
+                            location_found, current_distance, was_rejected = result
+                            if was_rejected:
+                                rejected_count += 1
+                                # Move to next match (cycle back to first if at end)
+                                current_match_index = (current_match_index + 1) % len(locations)
+                                print(f"Moving to match {current_match_index + 1} of {len(locations)} for opening number {number}")
+                        elif result == True:
+                            location_found = result
+                        elif result == "skip_task":
+                            # User pressed 's' to skip the entire task
+                            skip_task = True
+                            print(f"User skipped opening number {number} - moving to next task")
+                        elif result == False:
+                            # This shouldn't happen with the new logic, but handle it just in case
+                            print(f"Unexpected result: {result}. Skipping task.")
+                            skip_task = True
                     
-                    # Check progress
-                    current_size = update_queue.qsize()
-                    if current_size != queue_size:
-                        print(f"Update progress: {current_size} updates remaining")
-                        queue_size = current_size
-                        # Reset timeout when making progress
-                        wait_start = time.time()
+                    # Save any remaining matches as rejected images (only if user accepted one match)
+                    if location_found:
+                        for i, location in enumerate(locations):
+                            if i != current_match_index:  # Skip the accepted match
+                                try:
+                                    rejected_count += 1
+                                    self._save_preview_image(
+                                        sheet_path=location.sheet_path,
+                                        center_x=location.center_x,
+                                        center_y=location.center_y,
+                                        number=number,
+                                        save_dir=save_dir,
+                                        task_positions=[{
+                                            'pos_x': location.center_x,
+                                            'pos_y': location.center_y,
+                                            'task_type': 'UCI',
+                                            'is_main': True
+                                        }],
+                                        filename_prefix=f"no_{number}_{rejected_count}"
+                                    )
+                                    print(f"Saved rejected match image: no_{number}_{rejected_count}.jpg")
+                                except Exception as e:
+                                    print(f"Error saving rejected match image: {str(e)}")
+                            
+                    if location_found:
+                        print(f"Successfully processed opening number {number} (Update in progress)")
+                    else:
+                        print(f"No suitable location found for opening number {number}")
                         
-                    time.sleep(0.5)
+                    remaining_tasks -= 1
+                    current_task_index += 1
                     
-                if update_queue.empty():
-                    print("All updates completed successfully before stopping threads")
-                else:
-                    print(f"Warning: {update_queue.qsize()} updates still pending, but proceeding")
-            
-            # Signal the background threads to stop
-            print("Signaling background threads to stop...")
-            stop_event.set()
-            
-            # Wait for the background threads to finish
-            search_thread.join(timeout=5)
-            update_thread.join(timeout=5)
-            monitor_thread.join(timeout=5)
-            
-            # Final check to make sure everything was processed
-            if update_queue.empty():
-                print("\nSuccess: All task updates were completed before threads stopped")
-            else:
-                remaining = update_queue.qsize()
-                print(f"\nWarning: {remaining} task updates were not processed before threads stopped")
-                print("These tasks will be manually processed now.")
+                if auto_mode:
+                    print(f"\nAuto mode summary: {auto_accepted_count} opening(s) auto-accepted, {len(review_locations)} left unreviewed")
+            finally:
+                # Stop the searcher, then let the update worker finish every confirmed update
+                search_results.cancel()
+                update_queue.put(None)
+                if update_queue.qsize() > 1:
+                    print(f"\nWaiting for {update_queue.qsize() - 1} pending update(s) to complete...")
+                update_thread.join()
                 
-                # Use the direct processing method already implemented for the final timeout case
+                stop_event.set()
+                search_thread.join(timeout=5)
+                monitor_thread.join(timeout=5)
+                print(f"\nAll queued updates processed: {update_completed_count} opening(s) updated")
             
         print("\nTask location processing completed")
 
@@ -1774,7 +1740,8 @@ class SheetService(AuthManager):
         rejected_count: int = 0,
         update_queue: queue.Queue = None,
         match_number: int = 1,
-        total_matches: int = 1
+        total_matches: int = 1,
+        spatial_index: SpatialIndex = None
     ) -> Union[bool, Tuple[bool, int, bool]]:
         """Process a single task location with user interaction and async updates."""
         # Store the preview window reference for image saving
@@ -1791,19 +1758,18 @@ class SheetService(AuthManager):
                 }
             ]
             
-            # Add positions for related tasks if they exist
-            related_positions = {
-                'DEF': {'x': center_x - current_distance, 'y': center_y},  # Left
-                'FC': {'x': center_x + current_distance, 'y': center_y},   # Right
-                'UCA': {'x': center_x, 'y': center_y + current_distance}   # Bottom
-            }
-            
             related_tasks = [
                 ('DEF', def_tasks.get(number)),
                 ('FC', fc_tasks.get(number)),
                 ('UCA', uca_tasks.get(number))
             ]
             
+            # Add positions for related tasks, avoiding markers already on the sheet
+            related_positions = self._plan_related_positions(
+                spatial_index, sheet.get('floorplan_id'), number, uci_task['id'],
+                center_x, center_y, related_tasks, current_distance
+            )
+            
             for task_type, related_task in related_tasks:
                 if related_task:
                     pos = related_positions[task_type]
@@ -1898,6 +1864,12 @@ class SheetService(AuthManager):
                         update_queue.put(update_task)
                         print("Task update queued - continuing to next task")
                         
+                        # Later openings on this sheet must avoid these markers
+                        self._record_placement(
+                            spatial_index, sheet['floorplan_id'], uci_task['id'],
+                            center_x, center_y, related_tasks, related_positions
+                        )
+                        
                         # Return immediately to continue processing
                         return True, current_distance, False
                     else:  
@@ -1969,6 +1941,255 @@ class SheetService(AuthManager):
                 print(f"User choice '{choice}' not recognized or window was closed. Skipping task.")
                 return False
 
+    def _plan_related_positions(self, spatial_index, floorplan_id, number, uci_task_id,
+                                center_x, center_y, related_tasks, distance):
+        """Compute the DEF/FC/UCA positions around one opening's UCI marker.
+        
+        Each related task takes the first slot from RELATED_TASK_SLOTS that has no
+        other marker within half the spacing, trying the regular distance before
+        doubling it. Openings placed earlier are already in the spatial index, and
+        the opening's own related tasks avoid each other.
+        
+        Args:
+            spatial_index (SpatialIndex): Existing task positions, or None for fixed offsets
+            floorplan_id (str): Floorplan the opening is placed on
+            number (str): Opening number, used in messages
+            uci_task_id (str): ID of the opening's UCI task
+            center_x (float): X position of the UCI marker
+            center_y (float): Y position of the UCI marker
+            related_tasks (list): [(task_type, task or None), ...]
+            distance (int): Spacing between the UCI marker and its related tasks
+            
+        Returns:
+            dict: task_type -> {'x': x, 'y': y}
+        """
+        min_spacing = max(distance / 2, 1)
+        claimed = []  # Positions planned for this opening
+        
+        # The opening's own tasks may already be on the sheet when re-positioning
+        own_ids = {uci_task_id}
+        own_ids.update(task['id'] for _, task in related_tasks if task)
+        
+        plan = {}
+        for task_type, related_task in related_tasks:
+            slots = RELATED_TASK_SLOTS[task_type]
+            default_x = center_x + slots[0][0] * distance
+            default_y = center_y + slots[0][1] * distance
+            position = {'x': default_x, 'y': default_y}
+            
+            if spatial_index is not None and related_task:
+                candidates = [
+                    (center_x + dx * distance * scale, center_y + dy * distance * scale)
+                    for scale in (1, 2)
+                    for dx, dy in slots
+                ]
+                for x, y in candidates:
+                    if not spatial_index.is_free(floorplan_id, x, y, min_spacing, ignore=own_ids):
+                        continue
+                    if any((x - cx) ** 2 + (y - cy) ** 2 < min_spacing ** 2 for cx, cy in claimed):
+                        continue
+                    position = {'x': x, 'y': y}
+                    break
+                
+                if (position['x'], position['y']) != (default_x, default_y):
+                    print(f"{task_type} {number} moved to avoid an existing marker")
+            
+            plan[task_type] = position
+            if related_task:
+                claimed.append((position['x'], position['y']))
+        
+        return plan
+
+    def _record_placement(self, spatial_index, floorplan_id, uci_task_id, center_x, center_y, related_tasks, related_positions):
+        """Add an accepted opening and its related tasks to the spatial index."""
+        if spatial_index is None:
+            return
+        spatial_index.insert(uci_task_id, floorplan_id, center_x, center_y)
+        for task_type, related_task in related_tasks:
+            if related_task:
+                pos = related_positions[task_type]
+                spatial_index.insert(related_task['id'], floorplan_id, pos['x'], pos['y'])
+
+    def _select_auto_accept_location(self, locations, rules=None):
+        """Return the single unambiguous match for auto-accept mode.
+        
+        Args:
+            locations (list): LocationData results for one opening number
+            rules (dict, optional): Overrides for AUTO_ACCEPT_RULES
+            
+        Returns:
+            LocationData: The match to apply, or None if a human should review it
+        """
+        rules = {**AUTO_ACCEPT_RULES, **(rules or {})}
+        merge_distance = rules['merge_distance']
+        
+        # Merge duplicate highlights of the same text on the same sheet
+        distinct = []
+        for location in locations:
+            duplicate = any(
+                kept.sheet['id'] == location.sheet['id'] and
+                abs(kept.center_x - location.center_x) <= merge_distance and
+                abs(kept.center_y - location.center_y) <= merge_distance
+                for kept in distinct
+            )
+            if not duplicate:
+                distinct.append(location)
+        
+        if not distinct or len(distinct) > rules['max_matches']:
+            return None
+        
+        location = distinct[0]
+        if rules['require_floorplan'] and not location.sheet.get('floorplan_id'):
+            return None
+        return location
+
+    def _queue_review_thumbnails(self, executor, number, locations, save_dir, task_type='UCI', futures=None):
+        """Write thumbnails for every candidate match of an opening awaiting review.
+        
+        Images are rendered on the given executor so the batch pass never waits on them.
+        
+        Args:
+            futures (list, optional): Collects (image filename, future) pairs, so
+                failed thumbnails can be reported with _report_thumbnail_failures
+        
+        Returns:
+            list: Manifest rows describing each candidate match
+        """
+        rows = []
+        for index, location in enumerate(locations, 1):
+            filename_prefix = f"review_{number}_{index}"
+            future = executor.submit(
+                self._save_preview_image,
+                sheet_path=location.sheet_path,
+                center_x=location.center_x,
+                center_y=location.center_y,
+                number=number,
+                save_dir=save_dir,
+                task_positions=[{
+                    'pos_x': location.center_x,
+                    'pos_y': location.center_y,
+                    'task_type': task_type,
+                    'is_main': True
+                }],
+                filename_prefix=filename_prefix
+            )
+            if futures is not None:
+                futures.append((f"{filename_prefix}.jpg", future))
+            rows.append({
+                'number': number,
+                'match': index,
+                'total_matches': len(locations),
+                'sheet': location.sheet.get('name', 'Unknown Sheet'),
+                'page_number': location.sheet.get('page_number', ''),
+                'pos_x': location.center_x,
+                'pos_y': location.center_y,
+                'image': f"{filename_prefix}.jpg"
+            })
+        return rows
+
+    def _prepare_save_dir(self, save_dir=None):
+        """Return (save_dir, sheets_dir), asking for the directory when none is given.
+        
+        Only the directory dialog needs a display, so callers that pass save_dir
+        can run without one.
+        
+        Returns:
+            tuple: (save_dir, sheets_dir), or (None, None) if no directory was selected
+        """
+        if save_dir is None:
+            # Initialize tkinter root for directory selection
+            root = tk.Tk()
+            root.withdraw()  # Hide the main window
+            
+            # Prompt user for save directory
+            print("\nSelect directory to save match preview images:")
+            save_dir = filedialog.askdirectory(title="Select Directory to Save Preview Images")
+            
+            # Destroy the root window to avoid conflicts with PreviewWindow
+            root.destroy()
+        if not save_dir:
+            print("No directory selected. Exiting.")
+            return None, None
+        print(f"Images will be saved to: {save_dir}")
+        
+        # Create a subfolder for sheet files
+        sheets_dir = os.path.join(save_dir, "sheet_files")
+        if not os.path.exists(sheets_dir):
+            os.makedirs(sheets_dir)
+            print(f"Sheet files will be saved to: {sheets_dir}")
+        return save_dir, sheets_dir
+
+    def _choose_option(self, value, heading, options):
+        """Return value if it is one of options, or ask for one when value is None.
+        
+        Args:
+            value (str): Choice given by the caller, or None to prompt
+            heading (str): Question shown when prompting
+            options (list): (choice, description) pairs
+            
+        Returns:
+            str: The chosen option, or None if value is not a valid option
+        """
+        choices = [choice for choice, _ in options]
+        if value is not None:
+            if value in choices:
+                return value
+            print(f"Error: '{value}' is not one of: {', '.join(choices)}")
+            return None
+        
+        print(f"\n{heading}")
+        for choice, description in options:
+            print(f"  - Type '{choice}' to {description}")
+        value = input("Enter your choice: ").strip().lower()
+        while value not in choices:
+            print(f"Invalid choice. Please enter {' or '.join(repr(choice) for choice in choices)}.")
+            value = input("Enter your choice: ").strip().lower()
+        return value
+
+    def _confirm_review(self, review, count, noun):
+        """Decide whether to review the ambiguous matches left by an auto pass.
+        
+        Args:
+            review (bool): True or False from the caller, or None to ask
+            count (int): Number of ambiguous openings or tasks
+            noun (str): What is being reviewed, e.g. 'opening(s)'
+        """
+        if review is None:
+            review = input(f"Review {count} ambiguous {noun} now? (y/n): ").strip().lower() == 'y'
+        if not review:
+            print("Skipping review. Re-run in 'unpositioned' mode to review them later.")
+        return review
+
+    def _report_thumbnail_failures(self, futures):
+        """Wait for queued review thumbnails and report any that could not be saved.
+        
+        Args:
+            futures (list): (image filename, future) pairs from _queue_review_thumbnails
+        """
+        failed = []
+        for image, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                failed.append((image, e))
+        if failed:
+            print(f"Warning: {len(failed)} of {len(futures)} review thumbnail(s) could not be saved:")
+            for image, error in failed:
+                print(f"  {image}: {str(error)}")
+
+    def _write_review_manifest(self, save_dir, rows):
+        """Write the list of openings that need a human decision to review_queue.csv."""
+        import csv
+        
+        file_path = os.path.join(save_dir, "review_queue.csv")
+        fieldnames = ['number', 'match', 'total_matches', 'sheet', 'page_number', 'pos_x', 'pos_y', 'image']
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"Review queue written to: {file_path}")
+        return file_path
+
     def _create_task_maps(self, tasks: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
         """Create task maps for different task types."""
         def_tasks: Dict[str, Dict[str, Any]] = {}
@@ -1997,25 +2218,83 @@ class SheetService(AuthManager):
                 
         return def_tasks, fc_tasks, uci_tasks, uca_tasks
 
-    def _download_sheets_parallel(self, project_id: str, sheets: List[Dict[str, Any]], sheets_dir: str) -> Dict[str, str]:
-        """Download sheets in parallel."""
-        sheet_details: Dict[str, Dict[str, Any]] = {}
+    def get_sheets_from_snapshot(self, project_id: str, folder_id: str = None,
+                                 refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get active sheets from the project snapshot, listing them at most once per workflow.
         
-        def download_sheet(sheet: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
-            details = self.get_sheet_by_id(project_id, sheet['id'])
-            if details and details.get('file_url'):
-                return sheet['id'], details
-            return None
+        Args:
+            project_id (str): Project ID
+            folder_id (str, optional): Filter sheets by folder ID
+            refresh (bool): Drop the cached listing and file details and list the
+                sheets again. Workflows refresh when they start, since sheets can be
+                added or replaced between runs and signed file URLs expire.
+            
+        Returns:
+            list: Sheet dicts as returned by get_all_sheets_in_project
+        """
+        snapshot = get_project_snapshot(project_id)
+        if refresh:
+            snapshot.invalidate(('sheets', folder_id))
+            snapshot.invalidate('sheet_files')
+        return snapshot.get(
+            ('sheets', folder_id),
+            lambda: self.get_all_sheets_in_project(project_id, filter_option='active', folder_id=folder_id)
+        ) or []
+
+    def get_sheet_file_details(self, project_id: str, sheets: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Get file details (file_url and version) for many sheets.
+        
+        The sheet listing already carries file_url, so sheets are only fetched one by
+        one when the listing lacks it and the snapshot has no copy for the same version.
+        
+        Args:
+            project_id (str): Project ID
+            sheets (list): Sheet dicts from the sheet listing
             
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(download_sheet, sheet) for sheet in sheets]
-            for future in futures:
-                result = future.result()
-                if result:
-                    sheet_id, details = result
-                    sheet_details[sheet_id] = details
+        Returns:
+            dict: Sheet ID -> sheet details including file_url
+        """
+        snapshot = get_project_snapshot(project_id)
+        cached_files = snapshot.get('sheet_files') or {}
+        
+        def sheet_version(sheet):
+            return sheet.get('version'), sheet.get('updated_at')
+        
+        sheet_details: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for sheet in sheets:
+            cached = cached_files.get(sheet['id'])
+            if sheet.get('file_url'):
+                sheet_details[sheet['id']] = sheet
+            elif cached and sheet_version(cached) == sheet_version(sheet):
+                sheet_details[sheet['id']] = cached
+            else:
+                missing.append(sheet)
+        
+        if missing:
+            print(f"Sheet listing is missing file URLs for {len(missing)} sheet(s) - fetching them individually")
+            
+            def fetch_details(sheet: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+                details = self.get_sheet_by_id(project_id, sheet['id'])
+                if details and details.get('file_url'):
+                    return sheet['id'], details
+                return None
+            
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                for result in executor.map(fetch_details, missing):
+                    if result:
+                        sheet_id, details = result
+                        sheet_details[sheet_id] = details
+        
+        cached_files.update(sheet_details)
+        snapshot.set('sheet_files', cached_files)
+        return sheet_details
+
+    def _download_sheets_parallel(self, project_id: str, sheets: List[Dict[str, Any]], sheets_dir: str) -> Dict[str, str]:
+        """Download sheets using file URLs from the sheet listing."""
+        sheet_details = self.get_sheet_file_details(project_id, sheets)
         
-        # Download all sheets in parallel and save to specified directory
+        # Download all sheets and save to specified directory
         sheet_paths = download_sheets(sheet_details.values(), save_dir=sheets_dir)
         return sheet_paths 
 
@@ -2201,7 +2480,9 @@ class SheetService(AuthManager):
         print(f"Found {len(bc_tasks)} tasks in selected team")
         return bc_tasks
 
-    def bc_process_task_locations(self, project_id, task_service, user_id):
+    def bc_process_task_locations(self, project_id, task_service, user_id, auto_accept_rules=None,
+                                  save_dir=None, folder_id=None, team_id=None, task_selection=None,
+                                  processing_mode=None, review=None):
         """Process task locations for BC mode (British Columbia).
         
         BC mode differences from ON mode:
@@ -2210,33 +2491,23 @@ class SheetService(AuthManager):
         - Only one task per opening number (no related tasks)
         - No distance adjustments between tasks
         - Search uses exact task names (no prefix removal)
+        
+        In 'auto' mode, single unambiguous matches (see AUTO_ACCEPT_RULES, overridable
+        via auto_accept_rules) are applied without a preview window.
+        
+        save_dir, folder_id, team_id, task_selection, processing_mode and review
+        are asked for when not given, as in process_task_locations. With all of
+        them given and processing_mode='auto', review=False, the workflow runs
+        unattended without a terminal or display.
         """
         print("\n=== BC Processing Task Locations ===")
         if not isinstance(user_id, int):
             print("Error: user_id must be an integer")
             return
         
-        # Initialize tkinter root for directory selection
-        root = tk.Tk()
-        root.withdraw()  # Hide the main window
-        
-        # Prompt user for save directory
-        print("\nSelect directory to save match preview images:")
-        save_dir = filedialog.askdirectory(title="Select Directory to Save Preview Images")
+        save_dir, sheets_dir = self._prepare_save_dir(save_dir)
         if not save_dir:
-            print("No directory selected. Exiting.")
-            root.destroy()
             return
-        print(f"Images will be saved to: {save_dir}")
-        
-        # Create a subfolder for sheet files
-        sheets_dir = os.path.join(save_dir, "sheet_files")
-        if not os.path.exists(sheets_dir):
-            os.makedirs(sheets_dir)
-            print(f"Sheet files will be saved to: {sheets_dir}")
-        
-        # Destroy the root window to avoid conflicts with PreviewWindow
-        root.destroy()
         
         # BC Mode: Get folder and team selection
         from services.attribute import AttributeService
@@ -2250,7 +2521,10 @@ class SheetService(AuthManager):
             return
         
         # Get user folder selection
-        selected_folder_id = self._get_user_folder_selection(folders)
+        if folder_id is None:
+            selected_folder_id = self._get_user_folder_selection(folders)
+        else:
+            selected_folder_id = folder_id if any(f['id'] == folder_id for f in folders) else None
         if not selected_folder_id:
             print("No folder selected. Exiting.")
             return
@@ -2268,14 +2542,17 @@ class SheetService(AuthManager):
             return
         
         # Get user team selection
-        selected_team_id = self._get_user_team_selection(teams)
+        if team_id is None:
+            selected_team_id = self._get_user_team_selection(teams)
+        else:
+            selected_team_id = team_id if any(t['id'] == team_id for t in teams) else None
         if not selected_team_id:
             print("No team selected. Exiting.")
             return
         
         # Get sheets filtered by folder
         print(f"\nRetrieving sheets for selected folder...")
-        sheets = self.get_all_sheets_in_project(project_id, filter_option='active', folder_id=selected_folder_id)
+        sheets = self.get_sheets_from_snapshot(project_id, folder_id=selected_folder_id, refresh=True)
         print(f"Found {len(sheets)} sheets for selected folder")
         
         # Debug: Show which sheets were retrieved
@@ -2295,14 +2572,12 @@ class SheetService(AuthManager):
         tasks = task_service.get_all_tasks_in_project(project_id, filter_option='active')
         bc_tasks = self._create_bc_task_map(tasks, selected_team_id)
         
-        # Prompt user for task selection type
-        print(f"\nChoose which tasks from the selected team to process:")
-        print("  - Type 'all' to process all tasks in the team")
-        print("  - Type 'unpositioned' to process only tasks without positions")
-        task_selection = input("Enter your choice: ").strip().lower()
-        while task_selection not in ['all', 'unpositioned']:
-            print("Invalid choice. Please enter 'all' or 'unpositioned'.")
-            task_selection = input("Enter your choice: ").strip().lower()
+        task_selection = self._choose_option(task_selection, "Choose which tasks from the selected team to process:", [
+            ('all', 'process all tasks in the team'),
+            ('unpositioned', 'process only tasks without positions')
+        ])
+        if not task_selection:
+            return
         
         if task_selection == 'all':
             tasks_to_process = bc_tasks
@@ -2320,6 +2595,14 @@ class SheetService(AuthManager):
             print("No tasks found to process. Exiting.")
             return
         
+        processing_mode = self._choose_option(processing_mode, "Choose processing mode:", [
+            ('interactive', 'confirm every match in the preview window'),
+            ('auto', 'apply unambiguous matches automatically and review only the rest')
+        ])
+        if not processing_mode:
+            return
+        auto_mode = processing_mode == 'auto'
+        
         print("\nPreparing sheets for processing...")
         with ThreadPoolExecutor(max_workers=10) as executor:
             # Download sheets in parallel
@@ -2338,12 +2621,11 @@ class SheetService(AuthManager):
             
             task_items = list(tasks_to_process.items())
             
-            # Create queues for BC processing
-            results_queue = queue.Queue(maxsize=100)
+            # Search results reach the preview loop through a bounded buffer and confirmed
+            # updates reach the update worker through update_queue; idle threads block
+            search_results = ResultBuffer(max_pending=100)
             update_queue = queue.Queue()
-            searched_numbers = set()
             updated_tasks = set()
-            stop_event = threading.Event()
             
             # Progress counters
             search_completed_count = 0
@@ -2352,35 +2634,14 @@ class SheetService(AuthManager):
             # BC Background searcher function
             def bc_background_searcher():
                 nonlocal search_completed_count
-                task_index = 0
-                last_progress_time = time.time()
-                last_task_processed_time = time.time()
                 search_status = "running"
                 
                 try:
                     print(f"\nStarting BC background search for {len(task_items)} tasks across {len(sheets)} sheets")
                     
-                    while not stop_event.is_set() and task_index < len(task_items):
-                        current_time = time.time()
-                        
-                        # Progress monitoring
-                        if current_time - last_task_processed_time > 300:  # 5 minutes
-                            print(f"\nWARNING: No search progress for 5 minutes. Last processed task index: {task_index}/{len(task_items)}")
-                            print(f"Current search status: {search_status}")
-                            print("Attempting to continue...")
-                            last_task_processed_time = current_time
-                            
-                        if current_time - last_progress_time > 5:  # Every 5 seconds
-                            print(f"\rBC search progress: {search_completed_count}/{len(task_items)} completed ({search_completed_count/len(task_items)*100:.1f}%), Queue size: {results_queue.qsize()}/{results_queue.maxsize}, Cache size: {len(cached_results)}", end="")
-                            last_progress_time = current_time
-                            
-                        task_name, _ = task_items[task_index]
-                        
-                        # Skip if already searched
-                        if task_name in searched_numbers:
-                            task_index += 1
-                            last_task_processed_time = time.time()
-                            continue
+                    for task_name, _ in task_items:
+                        if search_results.cancelled:
+                            break
                         
                         search_status = f"searching for '{task_name}'"
                         try:
@@ -2388,143 +2649,133 @@ class SheetService(AuthManager):
                             locations = self._search_number_across_sheets_with_rate_limit(
                                 executor, project_id, sheets, sheet_paths, task_name, api_limit=10
                             )
-                            
-                            # Add to queue or cache
-                            try:
-                                search_status = f"adding '{task_name}' to queue"
-                                results_queue.put((task_name, locations), block=True, timeout=1)
-                                searched_numbers.add(task_name)
-                                task_index += 1
-                                search_completed_count += 1
-                                last_task_processed_time = time.time()
-                                last_progress_time = time.time()
-                            except queue.Full:
-                                search_status = f"caching '{task_name}' (queue full)"
-                                print(f"\nQueue full, caching results for task {task_name} and moving on")
-                                cached_results[task_name] = locations
-                                searched_numbers.add(task_name)
-                                task_index += 1
-                                search_completed_count += 1
-                                last_task_processed_time = time.time()
-                                last_progress_time = time.time()
                         except Exception as e:
-                            search_status = f"error with '{task_name}': {str(e)}"
                             print(f"\nError searching for task {task_name}: {str(e)}")
-                            task_index += 1
-                            last_task_processed_time = time.time()
+                            # Publish an empty result so the preview loop moves on
+                            locations = []
+                        
+                        search_status = f"adding '{task_name}' to buffer"
+                        if not search_results.put(task_name, locations):
+                            break
+                        search_completed_count += 1
                     
-                    # Final progress report
-                    if task_index >= len(task_items):
-                        search_status = "completed"
-                        print(f"\nBC background search completed: {search_completed_count}/{len(task_items)} items processed")
-                    else:
-                        search_status = "stopped by user"
-                        print(f"\nBC background search stopped: {search_completed_count}/{len(task_items)} items processed")
+                    search_status = "stopped by user" if search_results.cancelled else "completed"
+                    print(f"\nBC background search {search_status}: {search_completed_count}/{len(task_items)} items processed")
                 
                 except Exception as e:
                     search_status = f"failed with error: {str(e)}"
                     print(f"\nBC background search thread encountered an unhandled error: {str(e)}")
                     import traceback
                     traceback.print_exc()
+                finally:
+                    # Wake the preview loop even if the search ended early
+                    search_results.finish()
                 
                 print(f"\nBC search thread status: {search_status} (Completed: {search_completed_count}/{len(task_items)})")
             
             # BC Task update worker
             def bc_task_update_worker():
                 nonlocal update_completed_count
-                last_update_time = time.time()
-                last_status_time = time.time()
                 update_status = "running"
+                max_batch_size = 20  # Maximum confirmed tasks flushed together
+                stopping = False     # Set once the stop sentinel (None) is received
                 
                 try:
                     print("\nStarting BC task update background worker")
                     
-                    while not stop_event.is_set():
-                        current_time = time.time()
+                    while True:
+                        # Block until an update arrives; after the stop sentinel, drain what is left
+                        if stopping:
+                            try:
+                                batch = [update_queue.get_nowait()]
+                            except queue.Empty:
+                                break
+                        else:
+                            update_status = "idle - waiting for tasks"
+                            batch = [update_queue.get()]
+                        
+                        # Accumulate any other confirmed tasks already waiting
+                        while len(batch) < max_batch_size:
+                            try:
+                                batch.append(update_queue.get_nowait())
+                            except queue.Empty:
+                                break
+                        
+                        if None in batch:
+                            stopping = True
+                        updates = [update_task for update_task in batch if update_task is not None]
+                        if not updates:
+                            for _ in batch:
+                                update_queue.task_done()
+                            continue
                         
-                        # Idle monitoring
-                        if current_time - last_update_time > 300 and update_queue.qsize() > 0:
-                            pending = update_queue.qsize()
-                            print(f"\nWARNING: BC update worker idle for 5 minutes with {pending} pending updates")
-                            print(f"Current update status: {update_status}")
-                            print("Attempting to continue processing...")
-                            last_update_time = current_time
-                            
-                        # Status reporting
-                        if current_time - last_status_time > 10:  # Every 10 seconds
-                            if update_queue.qsize() > 0:
-                                print(f"\rBC update worker status: {update_completed_count} tasks updated, {update_queue.qsize()} pending", end="")
-                            last_status_time = current_time
-                            
                         try:
-                            # Get update task from queue
-                            update_task = update_queue.get(timeout=1)
+                            update_status = f"updating {len(updates)} task(s)"
+                            print(f"\nFlushing BC location updates for {len(updates)} confirmed task(s)")
+                            
+                            # BC update tasks: (task_name, task_id, sheet, center_x, center_y,
+                            # user_id, sheet_path, task_position, save_dir)
+                            position_updates = [
+                                {
+                                    'task_id': task_id,
+                                    'floorplan_id': sheet['floorplan_id'],
+                                    'pos_x': center_x,
+                                    'pos_y': center_y,
+                                    'label': task_name
+                                }
+                                for task_name, task_id, sheet, center_x, center_y, _, _, _, _ in updates
+                            ]
+                            batch_results = self.batch_update_task_locations(
+                                project_id, position_updates, updates[0][5]
+                            )
                             
-                            # Unpack BC update task (simpler than ON mode)
-                            (
+                            for (
                                 task_name,
                                 task_id, 
                                 sheet, 
                                 center_x, 
                                 center_y, 
-                                user_id,
+                                _,
                                 sheet_path,
                                 task_position,
                                 save_dir
-                            ) = update_task
-                            
-                            update_status = f"updating '{task_name}'"
-                            print(f"\nProcessing BC update for task {task_name} on sheet {sheet['name']}")
-                            
-                            try:
-                                # Update the task location
-                                updated_task = self.update_task_location(
-                                    project_id=project_id,
-                                    task_id=task_id,
-                                    floorplan_id=sheet['floorplan_id'],
-                                    pos_x=center_x,
-                                    pos_y=center_y,
-                                    last_editor_user_id=user_id
-                                )
+                            ) in updates:
+                                if not batch_results.get(task_id):
+                                    print(f"\nError updating BC task location for {task_name}")
+                                    continue
                                 
-                                if updated_task:
-                                    # Save preview image
-                                    if save_dir:
-                                        try:
-                                            self._save_preview_image(
-                                                sheet_path=sheet_path,
-                                                center_x=center_x,
-                                                center_y=center_y,
-                                                number=task_name,
-                                                save_dir=save_dir,
-                                                task_positions=[task_position],
-                                                filename_prefix=f"yes_{task_name}"
-                                            )
-                                            print(f"Preview image saved for accepted BC match: yes_{task_name}.jpg")
-                                        except Exception as e:
-                                            print(f"Error saving preview image: {str(e)}")
-                                    
-                                    # Track completion
-                                    updated_tasks.add(task_name)
-                                    update_completed_count += 1
-                                    last_update_time = time.time()
-                                    
-                                    print(f"\nCompleted BC update for task {task_name}")
-                                    print(f"BC updates processed: {update_completed_count}, Pending: {update_queue.qsize()}")
-                                    
-                            except Exception as e:
-                                update_status = f"error updating '{task_name}': {str(e)}"
-                                print(f"\nError updating BC task location for {task_name}: {str(e)}")
+                                # Save preview image
+                                if save_dir:
+                                    try:
+                                        self._save_preview_image(
+                                            sheet_path=sheet_path,
+                                            center_x=center_x,
+                                            center_y=center_y,
+                                            number=task_name,
+                                            save_dir=save_dir,
+                                            task_positions=[task_position],
+                                            filename_prefix=f"yes_{task_name}"
+                                        )
+                                        print(f"Preview image saved for accepted BC match: yes_{task_name}.jpg")
+                                    except Exception as e:
+                                        print(f"Error saving preview image: {str(e)}")
+                                
+                                # Track completion
+                                updated_tasks.add(task_name)
+                                update_completed_count += 1
+                                
+                                print(f"Completed BC update for task {task_name}")
                             
-                            # Mark task as done
-                            update_queue.task_done()
+                            print(f"BC updates processed: {update_completed_count}, Pending: {update_queue.qsize()}")
                         
-                        except queue.Empty:
-                            update_status = "idle - waiting for tasks"
-                            continue
                         except Exception as e:
                             update_status = f"error in task processing: {str(e)}"
                             print(f"\nError in BC task update worker: {str(e)}")
+                        
+                        finally:
+                            # Mark tasks as done
+                            for _ in batch:
+                                update_queue.task_done()
                     
                     print(f"\nBC update worker stopped: {update_completed_count} tasks processed")
                     
@@ -2546,228 +2797,203 @@ class SheetService(AuthManager):
             update_thread.start()
             
             # Main processing loop for BC mode
-            cached_results = {}
             current_task_index = 0
             total_tasks = len(task_items)
             remaining_tasks = total_tasks
-            out_of_order_count = 0
-            max_out_of_order = 5
             
-            while current_task_index < len(task_items):
-                # Process tkinter events to keep UI responsive
-                process_events()
-                
-                task_name, task = task_items[current_task_index]
-                
-                # Skip if already updated
-                if task_name in updated_tasks:
-                    print(f"\nSkipping task: {task['name']} (already updated)")
-                    current_task_index += 1
-                    remaining_tasks -= 1
-                    continue
-                
-                print("\n" + "="*50)
-                print(f"Processing BC task: {task['name']}")
-                print(f"Remaining tasks to process: {remaining_tasks}")
-                print(f"Search progress: {search_completed_count}/{len(task_items)}, Update progress: {update_completed_count}")
-                print("="*50)
-                
-                # Get results from cache or queue
-                if task_name in cached_results:
-                    print(f"Using cached results for task {task_name}")
-                    result_name = task_name
-                    locations = cached_results.pop(task_name)
-                    out_of_order_count = 0
-                else:
-                    # Handle out-of-order results
-                    if out_of_order_count >= max_out_of_order and len(cached_results) > 0:
-                        # Skip ahead to nearest cached result
-                        nearest_index = float('inf')
-                        nearest_name = None
-                        
-                        for cached_name in cached_results:
-                            for i, (item_name, _) in enumerate(task_items):
-                                if item_name == cached_name and i > current_task_index:
-                                    if i < nearest_index:
-                                        nearest_index = i
-                                        nearest_name = cached_name
-                        
-                        if nearest_name:
-                            skipped_count = nearest_index - current_task_index
-                            print(f"Falling behind BC search - skipping ahead {skipped_count} tasks to {nearest_name}")
-                            current_task_index = nearest_index
-                            remaining_tasks -= skipped_count
-                            out_of_order_count = 0
-                            continue
+            # In auto mode, tasks that need a human decision are appended to
+            # work_items and reviewed once the batch pass is complete
+            work_items = list(task_items)
+            review_locations = {}
+            review_rows = []
+            thumbnail_futures = []
+            review_prompted = False
+            auto_accepted_count = 0
+            
+            try:
+                while current_task_index < len(work_items):
+                    # Process tkinter events to keep UI responsive
+                    process_events()
                     
-                    # Wait for results from background thread
-                    try:
-                        if task_name not in searched_numbers:
-                            print(f"Waiting for search results for task {task_name}...")
-                        
-                        # Use a smaller timeout and process events while waiting
-                        wait_start = time.time()
-                        result_received = False
-                        
-                        while not result_received and time.time() - wait_start < 60:  # 1-minute total timeout
-                            try:
-                                # Try to get results with a short timeout
-                                result_name, locations = results_queue.get(timeout=0.5)
-                                result_received = True
-                            except queue.Empty:
-                                # Process UI events while waiting
-                                process_events()
-                                # Short sleep to avoid CPU spinning
-                                time.sleep(0.1)
-                        
-                        if not result_received:
-                            print(f"Timeout waiting for search results for task {task_name}")
-                            # If we time out, skip this task
+                    task_name, task = work_items[current_task_index]
+                    in_review_phase = current_task_index >= len(task_items)
+                    
+                    if in_review_phase and not review_prompted:
+                        review_prompted = True
+                        print(f"\nAuto mode pass complete: {auto_accepted_count} task(s) auto-accepted, {len(review_locations)} need review")
+                        if save_dir and review_rows:
+                            self._report_thumbnail_failures(thumbnail_futures)
+                            self._write_review_manifest(save_dir, review_rows)
+                        if not self._confirm_review(review, len(review_locations), 'task(s)'):
+                            break
+                    
+                    # Skip if already updated
+                    if task_name in updated_tasks:
+                        print(f"\nSkipping task: {task['name']} (already updated)")
+                        current_task_index += 1
+                        remaining_tasks -= 1
+                        continue
+                    
+                    print("\n" + "="*50)
+                    print(f"Processing BC task: {task['name']}")
+                    print(f"Remaining tasks to process: {remaining_tasks}")
+                    print(f"Search progress: {search_completed_count}/{len(task_items)}, Update progress: {update_completed_count}")
+                    print("="*50)
+                    
+                    # Get results from the review list or the background searcher
+                    if in_review_phase:
+                        locations = review_locations.pop(task_name)
+                    else:
+                        found, locations = search_results.get(task_name)
+                        if not found:
+                            print(f"No search results available for task {task_name}")
                             current_task_index += 1
                             remaining_tasks -= 1
                             continue
-                        
-                        if result_name != task_name:
-                            print(f"Received results for task {result_name} instead of {task_name} - caching for later")
-                            cached_results[result_name] = locations
-                            out_of_order_count += 1
-                            continue
-                        else:
-                            out_of_order_count = 0
-                    except Exception as e:
-                        print(f"Error getting BC search results: {str(e)}")
-                        current_task_index += 1
+                    
+                    if not locations:
+                        print(f"No locations found for task {task_name}")
                         remaining_tasks -= 1
+                        current_task_index += 1
                         continue
-                
-                if not locations:
-                    print(f"No locations found for task {task_name}")
-                    remaining_tasks -= 1
-                    current_task_index += 1
-                    continue
                     
-                # Debug: Show total matches found
-                total_matches = len(locations)
-                print(f"Found {total_matches} potential matches for task {task_name}")
-                
-                location_found = False
-                rejected_count = 0
-                current_match_index = 0
-                
-                # Loop through matches until user accepts one or skips
-                matches_shown = set()  # Track which matches have been shown to prevent infinite loops
-                
-                while not location_found:
-                    location = locations[current_match_index]
-                    match_number = current_match_index + 1
+                    if auto_mode and not in_review_phase:
+                        auto_location = self._select_auto_accept_location(locations, auto_accept_rules)
+                        if auto_location:
+                            # Queue the update exactly as a confirmed preview would
+                            task_position = {
+                                'pos_x': auto_location.center_x,
+                                'pos_y': auto_location.center_y,
+                                'task_type': 'BC_TASK',
+                                'is_main': True
+                            }
+                            update_queue.put((
+                                task_name,
+                                task['id'],
+                                auto_location.sheet,
+                                auto_location.center_x,
+                                auto_location.center_y,
+                                user_id,
+                                auto_location.sheet_path,
+                                task_position,
+                                save_dir
+                            ))
+                            auto_accepted_count += 1
+                            remaining_tasks -= 1
+                            print(f"Auto-accepted single match for task {task_name} on sheet {auto_location.sheet.get('name', 'Unknown Sheet')}")
+                        else:
+                            print(f"{len(locations)} ambiguous match(es) for task {task_name} - queued for review")
+                            review_locations[task_name] = locations
+                            work_items.append((task_name, task))
+                            if save_dir:
+                                review_rows.extend(self._queue_review_thumbnails(
+                                    executor, task_name, locations, save_dir, task_type='BC_TASK', futures=thumbnail_futures
+                                ))
+                        current_task_index += 1
+                        continue
+                        
+                    # Debug: Show total matches found
+                    total_matches = len(locations)
+                    print(f"Found {total_matches} potential matches for task {task_name}")
                     
-                    print(f"\nShowing match {match_number} of {total_matches} for task {task_name}")
+                    location_found = False
+                    rejected_count = 0
+                    current_match_index = 0
                     
-                    # Process the location with BC-specific handling
-                    result = self._process_bc_task_location_with_async_update(
-                        project_id,
-                        task,
-                        location.sheet,
-                        location.center_x,
-                        location.center_y,
-                        task_name,
-                        user_id,
-                        location.sheet_path,
-                        save_dir,
-                        rejected_count,
-                        update_queue,
-                        match_number,  # Pass current match number
-                        total_matches  # Pass total matches
-                    )
+                    # Loop through matches until user accepts one or skips
+                    matches_shown = set()  # Track which matches have been shown to prevent infinite loops
                     
-                    if isinstance(result, tuple):
-                        action, was_rejected = result
-                        if action == 'accepted':
+                    while not location_found:
+                        location = locations[current_match_index]
+                        match_number = current_match_index + 1
+                        
+                        print(f"\nShowing match {match_number} of {total_matches} for task {task_name}")
+                        
+                        # Process the location with BC-specific handling
+                        result = self._process_bc_task_location_with_async_update(
+                            project_id,
+                            task,
+                            location.sheet,
+                            location.center_x,
+                            location.center_y,
+                            task_name,
+                            user_id,
+                            location.sheet_path,
+                            save_dir,
+                            rejected_count,
+                            update_queue,
+                            match_number,  # Pass current match number
+                            total_matches  # Pass total matches
+                        )
+                        
+                        if isinstance(result, tuple):
+                            action, was_rejected = result
+                            if action == 'accepted':
+                                location_found = True
+                            elif action == 'skipped':
+                                # User chose to skip this task entirely
+                                print(f"Task {task_name} skipped by user")
+                                break
+                            elif action == 'next':
+                                # User wants to see next match
+                                if was_rejected:
+                                    rejected_count += 1
+                                    # Save rejected match image
+                                    try:
+                                        self._save_preview_image(
+                                            sheet_path=location.sheet_path,
+                                            center_x=location.center_x,
+                                            center_y=location.center_y,
+                                            number=task_name,
+                                            save_dir=save_dir,
+                                            task_positions=[{
+                                                'pos_x': location.center_x,
+                                                'pos_y': location.center_y,
+                                                'task_type': 'BC_TASK',
+                                                'is_main': True
+                                            }],
+                                            filename_prefix=f"no_{task_name}_{rejected_count}"
+                                        )
+                                        print(f"Saved rejected BC match image: no_{task_name}_{rejected_count}.jpg")
+                                    except Exception as e:
+                                        print(f"Error saving rejected match image: {str(e)}")
+                                
+                                # Mark this match as shown
+                                matches_shown.add(current_match_index)
+                                
+                                current_match_index += 1
+                                
+                                # If we've reached the end, loop back to the beginning
+                                if current_match_index >= len(locations):
+                                    print(f"Reached end of matches for {task_name}, looping back to first match")
+                                    current_match_index = 0
+                                    
+                                    # If we've shown all matches at least once, require a decision
+                                    if len(matches_shown) >= len(locations):
+                                        print(f"All {total_matches} matches have been reviewed for {task_name}")
+                                        print("You must either accept a match or skip this task.")
+                        elif result == True:
                             location_found = True
-                        elif action == 'skipped':
-                            # User chose to skip this task entirely
-                            print(f"Task {task_name} skipped by user")
-                            break
-                        elif action == 'next':
-                            # User wants to see next match
-                            if was_rejected:
-                                rejected_count += 1
-                                # Save rejected match image
-                                try:
-                                    self._save_preview_image(
-                                        sheet_path=location.sheet_path,
-                                        center_x=location.center_x,
-                                        center_y=location.center_y,
-                                        number=task_name,
-                                        save_dir=save_dir,
-                                        task_positions=[{
-                                            'pos_x': location.center_x,
-                                            'pos_y': location.center_y,
-                                            'task_type': 'BC_TASK',
-                                            'is_main': True
-                                        }],
-                                        filename_prefix=f"no_{task_name}_{rejected_count}"
-                                    )
-                                    print(f"Saved rejected BC match image: no_{task_name}_{rejected_count}.jpg")
-                                except Exception as e:
-                                    print(f"Error saving rejected match image: {str(e)}")
-                            
-                            # Mark this match as shown
-                            matches_shown.add(current_match_index)
-                            
-                            current_match_index += 1
                             
-                            # If we've reached the end, loop back to the beginning
-                            if current_match_index >= len(locations):
-                                print(f"Reached end of matches for {task_name}, looping back to first match")
-                                current_match_index = 0
-                                
-                                # If we've shown all matches at least once, require a decision
-                                if len(matches_shown) >= len(locations):
-                                    print(f"All {total_matches} matches have been reviewed for {task_name}")
-                                    print("You must either accept a match or skip this task.")
-                    elif result == True:
-                        location_found = True
+                    if location_found:
+                        print(f"Successfully processed BC task {task_name} (Update in progress)")
+                    else:
+                        print(f"No suitable location found for BC task {task_name}")
                         
-                if location_found:
-                    print(f"Successfully processed BC task {task_name} (Update in progress)")
-                else:
-                    print(f"No suitable location found for BC task {task_name}")
-                    
-                remaining_tasks -= 1
-                current_task_index += 1
-                
-            # Cleanup
-            stop_event.set()
-            search_thread.join(timeout=5)
-            update_thread.join(timeout=5)
-            
-            # Wait for final updates
-            print("\nWaiting for remaining BC task updates to complete...")
-            try:
-                wait_start = time.time()
-                timeout = 60
-                
-                prev_size = update_queue.qsize()
-                while not update_queue.empty():
-                    if time.time() - wait_start > timeout:
-                        remaining = update_queue.qsize()
-                        print(f"Timed out waiting for {remaining} BC task updates to complete.")
-                        break
-                    
-                    current_size = update_queue.qsize()
-                    if current_size != prev_size:
-                        print(f"Processing BC updates: {current_size} remaining...")
-                        prev_size = current_size
+                    remaining_tasks -= 1
+                    current_task_index += 1
                     
-                    time.sleep(1.0)
-                
-                if update_queue.empty():
-                    print("All BC task updates completed successfully.")
-                else:
-                    print(f"Exiting with {update_queue.qsize()} BC task updates still pending.")
-            except Exception as e:
-                print(f"Error while waiting for BC updates to complete: {str(e)}")
+                if auto_mode:
+                    print(f"\nAuto mode summary: {auto_accepted_count} task(s) auto-accepted, {len(review_locations)} left unreviewed")
+            finally:
+                # Stop the searcher, then let the update worker finish every confirmed update
+                search_results.cancel()
+                update_queue.put(None)
+                if update_queue.qsize() > 1:
+                    print(f"\nWaiting for {update_queue.qsize() - 1} pending BC update(s) to complete...")
+                update_thread.join()
+                search_thread.join(timeout=5)
+                print(f"\nAll queued BC updates processed: {update_completed_count} task(s) updated")
             
         print("\nBC task location processing completed")
 
@@ -7,6 +7,8 @@ from processors.xml_processor import parse_xml_file
 from utils.task_helpers import compare_openings_with_tasks
 from tqdm import tqdm
 from utils.executor import RateLimitedExecutor
+from utils.location_tree import LocationTree
+from utils.project_snapshot import get_project_snapshot
 
 class TaskService(AuthManager):
     """Service for task operations."""
@@ -519,5 +521,39 @@ class TaskService(AuthManager):
         )
         
         if self.validate_response(response, [201]):
-            return response.json()
+            created = response.json()
+            # Keep the cached location tree in step with the project
+            tree = get_project_snapshot(project_id).get('location_tree')
+            if tree is not None and isinstance(created, list):
+                tree.add_many(created)
+            return created
         return None
+
+    def get_location_tree(self, project_id, refresh=False):
+        """Get the project's locations indexed by ID and path, listing them at most once per workflow.
+        
+        The tree is kept in the project snapshot and updated in place by
+        batch_create_locations.
+        
+        Args:
+            project_id (str): Project ID
+            refresh (bool): Drop the cached tree and list the locations again.
+                Workflows refresh when they start, since locations can be added,
+                renamed or deleted in Fieldwire between runs.
+            
+        Returns:
+            LocationTree: Tree of the project's locations, or None if they could not be retrieved
+        """
+        def load_tree():
+            locations = self.get_all_locations_in_project(project_id)
+            if isinstance(locations, dict) and 'results' in locations:
+                locations = locations.get('results', [])
+            if not isinstance(locations, list):
+                print("Error: Unexpected response format from get_all_locations_in_project")
+                return None
+            return LocationTree(locations)
+        
+        snapshot = get_project_snapshot(project_id)
+        if refresh:
+            snapshot.invalidate('location_tree')
+        return snapshot.get('location_tree', load_tree)
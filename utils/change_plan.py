@@ -0,0 +1,184 @@
+"""Serializable change plans that can be reviewed, applied later and resumed."""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional
+
+PLAN_FORMAT_VERSION = 1
+
+def operation_id(op_type: str, task_id: str, target: Hashable, value: Any) -> str:
+    """Return a stable ID for an operation.
+
+    The ID only depends on what the operation does, so computing the same plan
+    twice against the same project state gives the same IDs.
+    """
+    key = json.dumps([op_type, task_id, target, value], sort_keys=True, default=str)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+class ChangePlan:
+    """Ordered list of API operations with completion tracking.
+
+    Each operation targets one thing on one task (a task name, an attribute
+    type, a checklist item, ...). Adding a second operation for the same target
+    merges it into the first, so the API sees one call per target.
+
+    A saved plan is a JSON file plus a '.done' journal next to it. Completed
+    operation IDs are appended to the journal as they finish, so an interrupted
+    apply can be resumed without repeating calls that already went through.
+    """
+
+    def __init__(self, project_id: str, metadata: Optional[Dict] = None):
+        """Initialize an empty plan.
+
+        Args:
+            project_id (str): Project the plan applies to
+            metadata (dict): Extra JSON-serializable data stored with the plan
+        """
+        self.project_id = project_id
+        self.metadata = metadata or {}
+        self.created_at = datetime.now().isoformat(timespec='seconds')
+        self.path = None
+        self.merged_count = 0
+        self._operations = {}  # (op_type, task_id, target) -> operation
+        self._done = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._operations)
+
+    def add(self, op_type: str, task_id: str, target: Hashable, value: Any, **details) -> Optional[str]:
+        """Add an operation, merging it with any earlier one for the same target.
+
+        Args:
+            op_type (str): Operation type, e.g. 'rename_task'
+            task_id (str): Task the operation applies to
+            target: What on the task is changed (attribute type ID, item ID, ...)
+            value: Value the target is set to
+            **details: JSON-serializable context for display (old values, names)
+
+        Returns:
+            str: ID of the resulting operation, or None if merging left nothing to do
+        """
+        key = (op_type, task_id, target)
+        existing = self._operations.get(key)
+        if existing:
+            self.merged_count += 1
+            # Keep the original 'old' values so the change still reads from the
+            # current state to the final one
+            merged_details = dict(details)
+            merged_details.update({k: v for k, v in existing['details'].items() if k.startswith('old_')})
+            details = merged_details
+            if 'old_value' in details and details['old_value'] == value:
+                del self._operations[key]
+                return None
+
+        op_id = operation_id(op_type, task_id, target, value)
+        self._operations[key] = {
+            'id': op_id,
+            'type': op_type,
+            'task_id': task_id,
+            'target': target,
+            'value': value,
+            'details': details
+        }
+        return op_id
+
+    def operations(self, op_type: str = None, pending_only: bool = False) -> List[Dict]:
+        """Return operations in the order they were added.
+
+        Args:
+            op_type (str): Only return operations of this type
+            pending_only (bool): Leave out operations that already completed
+        """
+        with self._lock:
+            done = set(self._done)
+        return [
+            op for op in self._operations.values()
+            if (op_type is None or op['type'] == op_type)
+            and not (pending_only and op['id'] in done)
+        ]
+
+    def is_done(self, op_id: str) -> bool:
+        with self._lock:
+            return op_id in self._done
+
+    def mark_done(self, op_id: str):
+        """Record an operation as completed, journaling it if the plan is saved."""
+        with self._lock:
+            if op_id in self._done:
+                return
+            self._done.add(op_id)
+            if self.path:
+                with open(self._journal_path(self.path), 'a', encoding='utf-8') as journal:
+                    journal.write(op_id + '\n')
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Return {op_type: {'total': n, 'done': n}}."""
+        counts = {}
+        with self._lock:
+            for op in self._operations.values():
+                entry = counts.setdefault(op['type'], {'total': 0, 'done': 0})
+                entry['total'] += 1
+                if op['id'] in self._done:
+                    entry['done'] += 1
+        return counts
+
+    @staticmethod
+    def _journal_path(path: str) -> str:
+        return f"{path}.done"
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': PLAN_FORMAT_VERSION,
+            'project_id': self.project_id,
+            'created_at': self.created_at,
+            'metadata': self.metadata,
+            'operations': list(self._operations.values())
+        }
+
+    def save(self, path: str):
+        """Write the plan to a JSON file and journal completed operations next to it.
+
+        The file is written to a temporary name first and then moved into place,
+        so a crash never leaves a half-written plan behind.
+        """
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            with open(self._journal_path(path), 'w', encoding='utf-8') as journal:
+                for op_id in self._done:
+                    journal.write(op_id + '\n')
+            self.path = path
+
+    @classmethod
+    def load(cls, path: str) -> 'ChangePlan':
+        """Load a saved plan together with its completion journal.
+
+        Raises:
+            ValueError: If the file was written by an unsupported plan format
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != PLAN_FORMAT_VERSION:
+            raise ValueError(f"Unsupported change plan version: {data.get('version')}")
+
+        plan = cls(data['project_id'], data.get('metadata'))
+        plan.created_at = data.get('created_at', plan.created_at)
+        for op in data['operations']:
+            target = op['target']
+            if isinstance(target, list):
+                target = tuple(target)  # JSON has no tuples
+            plan._operations[(op['type'], op['task_id'], target)] = op
+
+        journal_path = cls._journal_path(path)
+        if os.path.exists(journal_path):
+            with open(journal_path, 'r', encoding='utf-8') as journal:
+                plan._done = {line.strip() for line in journal if line.strip()}
+        plan.path = path
+        return plan
@@ -0,0 +1,127 @@
+"""Excel sheet reading with an optional fast engine and a parsed-sheet cache."""
+
+import hashlib
+import os
+import re
+import pandas as pd
+
+def _user_cache_dir():
+    """Return this user's cache directory (%LOCALAPPDATA% on Windows, ~/.cache elsewhere).
+
+    Cached sheets may be pickles, which run code when loaded, so they are kept
+    out of the shared temp directory where other users could plant files.
+    """
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'fieldwire_client')
+
+# Parsed sheets are cached by the workbook's content hash
+EXCEL_CACHE_DIR = os.path.join(_user_cache_dir(), 'excel_cache')
+
+# pandas added the calamine engine in 2.2
+CALAMINE_MIN_PANDAS = (2, 2)
+
+def get_excel_engine():
+    """Return the fastest installed Excel engine for pandas.
+
+    Returns:
+        str: 'calamine' if python-calamine is installed and pandas supports it,
+            otherwise None (pandas' default, openpyxl)
+    """
+    pandas_version = tuple(int(part) for part in re.findall(r'\d+', pd.__version__)[:2])
+    if pandas_version < CALAMINE_MIN_PANDAS:
+        return None
+    try:
+        import python_calamine  # noqa: F401
+        return 'calamine'
+    except ImportError:
+        return None
+
+def get_cache_format():
+    """Return the format used for cached sheets.
+
+    Returns:
+        str: 'parquet' if pyarrow or fastparquet is installed, otherwise 'pickle'
+    """
+    for module in ('pyarrow', 'fastparquet'):
+        try:
+            __import__(module)
+            return 'parquet'
+        except ImportError:
+            continue
+    return 'pickle'
+
+def hash_file(file_path):
+    """Return the SHA-1 hex digest of a file's contents."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _cache_path(cache_dir, file_hash, sheet_name, cache_format):
+    safe_sheet = re.sub(r'[^\w-]', '_', str(sheet_name))
+    extension = 'parquet' if cache_format == 'parquet' else 'pkl'
+    return os.path.join(cache_dir, f"{file_hash}_{safe_sheet}.{extension}")
+
+def _read_cached_sheet(cache_path, cache_format):
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        if cache_format == 'parquet':
+            return pd.read_parquet(cache_path)
+        return pd.read_pickle(cache_path)
+    except Exception:
+        return None  # Unreadable cache entry; parse the workbook again
+
+def _write_cached_sheet(df, cache_path, cache_format):
+    # Parquet needs string column names; other headers fall back to pickle
+    if cache_format == 'parquet' and not all(isinstance(col, str) for col in df.columns):
+        cache_path = os.path.splitext(cache_path)[0] + '.pkl'
+        cache_format = 'pickle'
+    try:
+        os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+        temp_path = f"{cache_path}.tmp"
+        if cache_format == 'parquet':
+            df.to_parquet(temp_path, index=False)
+        else:
+            df.to_pickle(temp_path)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: Could not cache parsed sheet: {str(e)}")
+
+def read_excel_sheet(file_path, sheet_name, cache_dir=EXCEL_CACHE_DIR):
+    """Read one sheet of a workbook with every value as a string.
+
+    The parsed sheet is cached by the workbook's content hash, so reading the
+    same export again skips parsing the XLSX. Uses python-calamine when
+    installed and stores the cache as parquet when pyarrow or fastparquet is
+    installed, falling back to openpyxl and pickle.
+
+    Args:
+        file_path (str): Path to the Excel file
+        sheet_name (str): Sheet to read
+        cache_dir (str, optional): Directory for cached sheets, or None to disable caching
+
+    Returns:
+        pandas.DataFrame: The sheet, or None if the workbook has no such sheet
+    """
+    cache_format = get_cache_format()
+    cache_path = None
+    if cache_dir:
+        file_hash = hash_file(file_path)
+        for fmt in dict.fromkeys([cache_format, 'pickle']):
+            cached = _read_cached_sheet(_cache_path(cache_dir, file_hash, sheet_name, fmt), fmt)
+            if cached is not None:
+                return cached
+        cache_path = _cache_path(cache_dir, file_hash, sheet_name, cache_format)
+
+    with pd.ExcelFile(file_path, engine=get_excel_engine()) as xl:
+        if sheet_name not in xl.sheet_names:
+            print(f"Error: Sheet '{sheet_name}' not found in Excel file")
+            print("Available sheets:", xl.sheet_names)
+            return None
+        df = xl.parse(sheet_name, dtype=str)
+
+    if cache_path:
+        _write_cached_sheet(df, cache_path, cache_format)
+    return df
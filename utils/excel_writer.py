@@ -0,0 +1,146 @@
+"""Streaming Excel export for report DataFrames."""
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import CellIsRule, FormulaRule
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+# Light grey and white, used for banded rows
+BAND_COLORS = ('F0F0F0', 'FFFFFF')
+
+def create_workbook():
+    """Return a write-only workbook; sheets are streamed to disk as rows are added."""
+    return Workbook(write_only=True)
+
+def solid_fill(color):
+    """Return a solid PatternFill for a hex color, with or without a leading '#'."""
+    color = color.replace('#', '')
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+def column_widths(df, min_width=None, max_width=None):
+    """Compute column widths from the longest value or header in each column.
+
+    Args:
+        df (pandas.DataFrame): Data being exported
+        min_width (int, optional): Smallest width to use
+        max_width (int, optional): Largest width to use
+
+    Returns:
+        list: One width per column, the longest text plus 2
+    """
+    widths = []
+    for position, header in enumerate(df.columns):
+        values = df.iloc[:, position]
+        longest = len(str(header))
+        if len(values):
+            # Measure each distinct value once
+            distinct = pd.Series(values.dropna().unique())
+            if len(distinct):
+                longest = max(longest, int(distinct.astype(str).str.len().max()))
+        width = longest + 2
+        if min_width is not None:
+            width = max(width, min_width)
+        if max_width is not None:
+            width = min(width, max_width)
+        widths.append(width)
+    return widths
+
+def _band_parity(values):
+    """Return 0/1 per row, flipping whenever the value differs from the row above."""
+    changed = values.ne(values.shift()).to_numpy()
+    return (np.cumsum(changed) - 1) % 2
+
+def write_sheet(workbook, sheet_name, df, band_rows=False, band_by=None, value_fills=None,
+                header_fill=None, min_width=None, max_width=None):
+    """Stream a DataFrame into a new sheet of a write-only workbook.
+
+    Column widths come from the string lengths of the data. Banding and value
+    colors are added as conditional formats where Excel can express them, so
+    cells are written without styles. Banding by groups needs the group of
+    every row, so those rows are written with a shared style per band instead.
+
+    Args:
+        workbook (openpyxl.Workbook): Workbook from create_workbook()
+        sheet_name (str): Title of the new sheet
+        df (pandas.DataFrame): Data to write, with its columns as the header row
+        band_rows (bool): Alternate grey and white on every row
+        band_by (str, optional): Column whose value changes start a new band, e.g.
+            'Task Name'. The first group is white. Takes precedence over band_rows.
+        value_fills (dict, optional): Column -> {value: hex color}. Those cells are
+            filled by value and left out of the banding.
+        header_fill (str, optional): Hex color for the header row
+
+    Returns:
+        openpyxl worksheet: The written sheet
+    """
+    worksheet = workbook.create_sheet(title=sheet_name)
+    value_fills = value_fills or {}
+    last_row = len(df) + 1
+    columns = list(df.columns)
+
+    # Column widths have to be set before the first row is written
+    for position, width in enumerate(column_widths(df, min_width, max_width), 1):
+        worksheet.column_dimensions[get_column_letter(position)].width = width
+
+    header_font = Font(bold=True)
+    header_border = Border(*(Side(style='thin') for _ in range(4)))
+    header_alignment = Alignment(horizontal='center', vertical='top')
+    header = []
+    for name in columns:
+        cell = WriteOnlyCell(worksheet, value=str(name))
+        cell.font = header_font
+        cell.border = header_border
+        cell.alignment = header_alignment
+        if header_fill:
+            cell.fill = solid_fill(header_fill)
+        header.append(cell)
+    worksheet.append(header)
+
+    # Missing values become empty cells
+    values = df.astype(object).where(df.notna(), None)
+
+    banded = [position for position, name in enumerate(columns) if name not in value_fills]
+    if band_by is not None and len(df) and banded:
+        fills = [solid_fill(color) for color in reversed(BAND_COLORS)]
+        parity = _band_parity(df[band_by])
+        for row, band in zip(values.itertuples(index=False, name=None), parity):
+            row = list(row)
+            for position in banded:
+                cell = WriteOnlyCell(worksheet, value=row[position])
+                cell.fill = fills[band]
+                row[position] = cell
+            worksheet.append(row)
+    else:
+        for row in values.itertuples(index=False, name=None):
+            worksheet.append(row)
+
+        if band_rows and len(df):
+            # Even rows grey, odd rows white
+            cells = " ".join(
+                f"{get_column_letter(position + 1)}2:{get_column_letter(position + 1)}{last_row}"
+                for position in banded
+            )
+            worksheet.conditional_formatting.add(
+                cells, FormulaRule(formula=['MOD(ROW(),2)=0'], fill=solid_fill(BAND_COLORS[0]))
+            )
+            worksheet.conditional_formatting.add(
+                cells, FormulaRule(formula=['MOD(ROW(),2)=1'], fill=solid_fill(BAND_COLORS[1]))
+            )
+
+    # One rule per colored value, applied to the whole column
+    if len(df):
+        for name, colors in value_fills.items():
+            if name not in columns:
+                continue
+            letter = get_column_letter(columns.index(name) + 1)
+            for value, color in colors.items():
+                text = str(value).replace('"', '""')
+                worksheet.conditional_formatting.add(
+                    f"{letter}2:{letter}{last_row}",
+                    CellIsRule(operator='equal', formula=[f'"{text}"'], fill=solid_fill(color))
+                )
+
+    return worksheet
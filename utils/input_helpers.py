@@ -97,6 +97,13 @@ def prompt_user_for_xml_file():
     file_path = filedialog.askopenfilename(title="Select XML File", filetypes=[("XML Files", "*.xml")])
     return file_path
 
+def prompt_user_for_change_plan_file():
+    """Prompt user to select a saved change plan using file dialog."""
+    root = tk.Tk()
+    root.withdraw()  # Hide the root window
+    file_path = filedialog.askopenfilename(title="Select Change Plan", filetypes=[("Change Plans", "*.json")])
+    return file_path
+
 def prompt_user_for_excel_file():
     """Prompt user to select an Excel file using file dialog."""
     root = tk.Tk()
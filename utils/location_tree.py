@@ -0,0 +1,118 @@
+"""Index of a project's location hierarchy by ID and by full path."""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+class LocationTree:
+    """Fieldwire locations indexed by ID, by full name path, and by parent.
+
+    A location's path is the tuple of names from its top-level ancestor down to
+    itself, e.g. ('Building A', 'Level 2', 'Room 201'). Locations can be added
+    in any order: a location whose parent has not been seen yet gets its path
+    as soon as the parent is added. Locations without a name, and everything
+    below them, have no path.
+    """
+
+    def __init__(self, locations: Optional[Iterable[Dict[str, Any]]] = None):
+        """Initialize the tree.
+
+        Args:
+            locations (list, optional): Location dicts with 'id', 'name' and 'location_id'
+        """
+        self._locations = {}      # location ID -> location dict
+        self._children = {}       # parent ID -> [child ID, ...]
+        self._path_by_id = {}     # location ID -> path tuple
+        self._id_by_path = {}     # path tuple -> location ID
+        self._lock = threading.Lock()
+        if locations:
+            self.add_many(locations)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._locations)
+
+    def __contains__(self, path: Tuple[str, ...]) -> bool:
+        with self._lock:
+            return tuple(path) in self._id_by_path
+
+    def add(self, location: Dict[str, Any]):
+        """Add or replace one location."""
+        self.add_many([location])
+
+    def add_many(self, locations: Iterable[Dict[str, Any]]):
+        """Add or replace locations, e.g. from a batch_create_locations response."""
+        with self._lock:
+            for location in locations:
+                if 'id' not in location:
+                    continue
+                location_id = location['id']
+                previous = self._locations.get(location_id)
+                if previous is not None:
+                    self._detach(previous)
+
+                self._locations[location_id] = location
+                parent_id = location.get('location_id') or None
+                self._children.setdefault(parent_id, []).append(location_id)
+
+                # Top-level locations have a path right away; others once their parent has one
+                parent_path = () if parent_id is None else self._path_by_id.get(parent_id)
+                if parent_path is not None:
+                    self._assign_paths(location_id, parent_path)
+
+    def _detach(self, location: Dict[str, Any]):
+        """Remove a location's parent link and the paths of its subtree."""
+        location_id = location['id']
+        siblings = self._children.get(location.get('location_id') or None, [])
+        if location_id in siblings:
+            siblings.remove(location_id)
+
+        stack = [location_id]
+        while stack:
+            current = stack.pop()
+            path = self._path_by_id.pop(current, None)
+            if path is not None and self._id_by_path.get(path) == current:
+                del self._id_by_path[path]
+            stack.extend(self._children.get(current, []))
+
+    def _assign_paths(self, location_id: str, parent_path: Tuple[str, ...]):
+        """Set the path of a location and every descendant already added."""
+        stack = [(location_id, parent_path)]
+        while stack:
+            current, base = stack.pop()
+            name = self._locations[current].get('name')
+            if not name:
+                continue  # Unnamed locations break the path for their subtree
+            path = base + (name,)
+            self._path_by_id[current] = path
+            self._id_by_path[path] = current
+            stack.extend((child, path) for child in self._children.get(current, []))
+
+    def get(self, location_id: str) -> Optional[Dict[str, Any]]:
+        """Return the location dict for an ID, or None."""
+        with self._lock:
+            return self._locations.get(location_id)
+
+    def id_for(self, path: Iterable[str]) -> Optional[str]:
+        """Return the ID of the location at a path, or None."""
+        with self._lock:
+            return self._id_by_path.get(tuple(path))
+
+    def path_of(self, location_id: str) -> Optional[Tuple[str, ...]]:
+        """Return the path of a location, or None if it has no path."""
+        with self._lock:
+            return self._path_by_id.get(location_id)
+
+    def children(self, location_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the direct children of a location, or the top-level locations."""
+        with self._lock:
+            return [self._locations[child] for child in self._children.get(location_id, [])]
+
+    def paths(self) -> Dict[Tuple[str, ...], str]:
+        """Return a copy of the path -> location ID index."""
+        with self._lock:
+            return dict(self._id_by_path)
+
+    def missing(self, paths: Iterable[Iterable[str]]) -> List[Tuple[str, ...]]:
+        """Return the given paths that have no location, in their original order."""
+        with self._lock:
+            return [tuple(path) for path in paths if tuple(path) not in self._id_by_path]
@@ -0,0 +1,87 @@
+"""Producer/consumer helpers for background search and update pipelines."""
+
+import threading
+from typing import Any, Hashable, Tuple
+
+class ResultBuffer:
+    """Bounded hand-off of keyed results from a producer thread to a consumer.
+
+    The producer blocks in put() while max_pending results are waiting, and the
+    consumer blocks in get() until the result it asked for arrives. Both wait on
+    a condition variable, so neither side uses CPU while idle, and cancel()
+    wakes everyone immediately.
+    """
+
+    def __init__(self, max_pending: int = 100):
+        """Initialize the buffer.
+
+        Args:
+            max_pending (int): Maximum number of results held before the producer waits
+        """
+        self.max_pending = max_pending
+        self._results = {}
+        self._abandoned = set()
+        self._finished = False
+        self._cancelled = False
+        self._condition = threading.Condition()
+
+    def __len__(self):
+        with self._condition:
+            return len(self._results)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """Publish a result, waiting while the buffer is full.
+
+        Returns:
+            bool: False if the pipeline was cancelled before the result was stored
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._cancelled or len(self._results) < self.max_pending
+            )
+            if self._cancelled:
+                return False
+            if key in self._abandoned:
+                self._abandoned.discard(key)
+                return True
+            self._results[key] = value
+            self._condition.notify_all()
+            return True
+
+    def get(self, key: Hashable, timeout: float = None) -> Tuple[bool, Any]:
+        """Wait for the result for key and remove it from the buffer.
+
+        Returns early if the producer finished without publishing the key, the
+        pipeline was cancelled, or the timeout expired. A key given up on this
+        way is dropped if it arrives later.
+
+        Returns:
+            tuple: (found, value)
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: key in self._results or self._finished or self._cancelled,
+                timeout=timeout
+            )
+            if key in self._results:
+                value = self._results.pop(key)
+                self._condition.notify_all()
+                return True, value
+            self._abandoned.add(key)
+            return False, None
+
+    def finish(self):
+        """Signal that the producer will publish no more results."""
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def cancel(self):
+        """Stop the pipeline and wake every waiting thread."""
+        with self._condition:
+            self._cancelled = True
+            self._condition.notify_all()
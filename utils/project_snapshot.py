@@ -0,0 +1,193 @@
+"""Snapshots of project collections, shared in memory across services or saved to disk."""
+
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import pandas as pd
+from utils.table_store import load_tables
+
+# One snapshot per project, shared by every service instance
+_snapshots = {}
+_snapshots_lock = threading.Lock()
+
+class ProjectSnapshot:
+    """Cached copies of a project's collections, loaded on first use.
+
+    Collections are stored under a name (e.g. 'tasks', 'sheets') and loaded
+    through a caller-supplied loader the first time they are requested.
+    Different collections can load concurrently; concurrent requests for the
+    same collection wait for a single load.
+    """
+
+    def __init__(self, project_id: str):
+        """Initialize an empty snapshot.
+
+        Args:
+            project_id (str): Project the snapshot belongs to
+        """
+        self.project_id = project_id
+        self._collections = {}
+        self._load_locks = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, name: Hashable) -> bool:
+        with self._lock:
+            return name in self._collections
+
+    def _load_lock(self, name: Hashable) -> threading.Lock:
+        with self._lock:
+            if name not in self._load_locks:
+                self._load_locks[name] = threading.Lock()
+            return self._load_locks[name]
+
+    def get(self, name: Hashable, loader: Optional[Callable[[], Any]] = None) -> Any:
+        """Return a cached collection, loading it if needed.
+
+        Args:
+            name: Collection name
+            loader: Called to fetch the collection when it is not cached.
+                A None result is returned but not cached.
+
+        Returns:
+            The cached collection, or None if it is not cached and no loader was given
+        """
+        with self._lock:
+            if name in self._collections:
+                return self._collections[name]
+        if loader is None:
+            return None
+
+        with self._load_lock(name):
+            # Another thread may have finished loading while we waited
+            with self._lock:
+                if name in self._collections:
+                    return self._collections[name]
+            data = loader()
+            if data is not None:
+                with self._lock:
+                    self._collections[name] = data
+            return data
+
+    def set(self, name: Hashable, data: Any):
+        """Store or replace a collection."""
+        with self._lock:
+            self._collections[name] = data
+
+    def invalidate(self, name: Hashable = None):
+        """Drop one collection, or every collection if no name is given."""
+        with self._lock:
+            if name is None:
+                self._collections.clear()
+            else:
+                self._collections.pop(name, None)
+
+    def collections(self) -> Dict[Hashable, Any]:
+        """Return a shallow copy of every cached collection."""
+        with self._lock:
+            return dict(self._collections)
+
+def get_project_snapshot(project_id: str) -> ProjectSnapshot:
+    """Return the shared snapshot for a project, creating it on first use."""
+    with _snapshots_lock:
+        if project_id not in _snapshots:
+            _snapshots[project_id] = ProjectSnapshot(project_id)
+        return _snapshots[project_id]
+
+# Collections stored in a saved snapshot, as read by the report generators
+SAVED_COLLECTIONS = (
+    'tasks', 'teams', 'statuses', 'task_check_items', 'task_type_attributes', 'task_attributes'
+)
+# A collection's raw records are saved as the table '<collection>_records', one JSON document per row
+RECORDS_SUFFIX = '_records'
+
+def records_table(records: list) -> pd.DataFrame:
+    """Return a table holding API records as they are, for save_tables."""
+    return pd.DataFrame({'record': [json.dumps(record) for record in records]})
+
+def load_project_snapshot(directory: str) -> Tuple[ProjectSnapshot, Dict[str, Any]]:
+    """Load the raw records saved by ReportService.save_project_snapshot.
+
+    Snapshots are table store directories (utils.table_store) holding the
+    project DataFrames, which ReportService.load_raw_tables reads, and the raw
+    records of each collection. A raw data export has the DataFrames only and
+    loads as an empty snapshot.
+
+    The snapshot is returned on its own rather than shared through
+    get_project_snapshot, so saved data never mixes with live data.
+
+    Args:
+        directory (str): Directory containing the manifest
+
+    Returns:
+        tuple: (snapshot, metadata)
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest
+        ValueError: If a table is missing or damaged, the directory was not saved
+            as Parquet, or the manifest has no project
+    """
+    tables, metadata = load_tables(directory, {f"{name}{RECORDS_SUFFIX}" for name in SAVED_COLLECTIONS})
+    if not metadata.get('project_id'):
+        raise ValueError(f"{directory} does not record which project it belongs to")
+
+    snapshot = ProjectSnapshot(metadata['project_id'])
+    for name in SAVED_COLLECTIONS:
+        table = tables.get(f"{name}{RECORDS_SUFFIX}")
+        if table is not None:
+            snapshot.set(name, [json.loads(record) for record in table['record']])
+    return snapshot, metadata
+
+class OfflineProjectData:
+    """Read-only stand-in for the project services, answered from a saved snapshot.
+
+    Implements the getters the report generators call on the project, task,
+    attribute, status and team services, so they can run without network
+    access by passing an instance in place of each service.
+    """
+
+    def __init__(self, snapshot: ProjectSnapshot, project_name: Optional[str] = None):
+        """Initialize from a loaded snapshot.
+
+        Args:
+            snapshot (ProjectSnapshot): Snapshot from load_project_snapshot
+            project_name (str, optional): Project name, accepted in place of the ID
+        """
+        self.snapshot = snapshot
+        self.project_id = snapshot.project_id
+        self.project_name = project_name
+
+    def _collection(self, project_id: str, name: str) -> Optional[list]:
+        if project_id != self.project_id:
+            print(f"Project {project_id} is not in the snapshot")
+            return None
+        return self.snapshot.get(name)
+
+    def get_project_id_from_name_or_id(self, input_value: str) -> Optional[str]:
+        """Return the snapshot's project ID if the input is its ID or name."""
+        if input_value in (self.project_id, self.project_name):
+            return self.project_id
+        return None
+
+    def get_all_tasks_in_project(self, project_id: str, filter_option: str = 'active') -> Optional[list]:
+        """Return the saved tasks. Snapshots hold active tasks only, whatever the filter."""
+        return self._collection(project_id, 'tasks')
+
+    def get_all_teams_in_project(self, project_id: str) -> Optional[list]:
+        """Return the saved teams."""
+        return self._collection(project_id, 'teams')
+
+    def get_statuses_for_project_id(self, project_id: str) -> Optional[list]:
+        """Return the saved statuses."""
+        return self._collection(project_id, 'statuses')
+
+    def get_all_task_check_items_in_project(self, project_id: str) -> Optional[list]:
+        """Return the saved check items."""
+        return self._collection(project_id, 'task_check_items')
+
+    def get_all_task_type_attributes_in_project(self, project_id: str) -> Optional[list]:
+        """Return the saved task type attributes."""
+        return self._collection(project_id, 'task_type_attributes')
+
+    def get_all_task_attributes_in_project(self, project_id: str) -> Optional[list]:
+        """Return the saved task attributes."""
+        return self._collection(project_id, 'task_attributes')
@@ -2,9 +2,9 @@
 
 import time
 from collections import deque
-from threading import Lock
+from threading import Lock, local
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Any, List, Optional
+from typing import Callable, Any, Dict, List, Optional
 
 class RateLimiter:
     """Rate limiter that ensures operations don't exceed a specified rate."""
@@ -97,4 +97,46 @@ class RateLimitedExecutor:
                     # Error already handled in rate_limited_operation
                     pass
                     
-        return not self.error_occurred 
\ No newline at end of file
+        return not self.error_occurred 
+
+
+# Shared by every fetch_concurrently call so parallel collection fetches stay within the API rate
+_fetch_rate_limiter = RateLimiter(max_requests=10)
+
+# Limiter that AuthManager.send_request waits on for requests made from this thread
+_thread_state = local()
+
+def current_rate_limiter() -> Optional[RateLimiter]:
+    """Return the rate limiter for requests made from the calling thread, if any."""
+    return getattr(_thread_state, 'rate_limiter', None)
+
+def fetch_concurrently(fetchers: Dict[str, Callable[[], Any]],
+                       rate_limiter: Optional[RateLimiter] = None) -> Dict[str, Any]:
+    """Run independent fetches at the same time and collect their results.
+    
+    Every request a fetch sends, including each page of a paginated listing,
+    waits for a slot on a shared rate limiter. The total time is roughly that
+    of the slowest fetch rather than the sum.
+    
+    Args:
+        fetchers: Name -> callable returning the fetched data
+        rate_limiter: Limiter to share, defaults to the module-wide fetch limiter
+        
+    Returns:
+        dict: Name -> result, or None for fetches that raised (the error is printed)
+    """
+    rate_limiter = rate_limiter or _fetch_rate_limiter
+    
+    def run(name: str, fetch: Callable[[], Any]) -> Any:
+        _thread_state.rate_limiter = rate_limiter
+        try:
+            return fetch()
+        except Exception as e:
+            print(f"Error fetching {name}: {str(e)}")
+            return None
+        finally:
+            _thread_state.rate_limiter = None
+    
+    with ThreadPoolExecutor(max_workers=max(1, len(fetchers))) as executor:
+        futures = {name: executor.submit(run, name, fetch) for name, fetch in fetchers.items()}
+        return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,110 @@
+"""Spatial index of task positions on floorplans."""
+
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class SpatialIndex:
+    """Uniform grid of task positions, bucketed per floorplan.
+
+    Each position is stored in the grid cell that contains it, so a radius query
+    only scans the handful of cells the search circle overlaps instead of every
+    task in the project.
+    """
+
+    def __init__(self, cell_size: float = 50.0):
+        """Initialize the index.
+
+        Args:
+            cell_size (float): Width and height of a grid cell in sheet pixels
+        """
+        self.cell_size = cell_size
+        self._cells = defaultdict(lambda: defaultdict(dict))  # floorplan_id -> cell -> key -> (x, y)
+        self._positions = {}  # key -> (floorplan_id, x, y)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Dict], cell_size: float = 50.0) -> 'SpatialIndex':
+        """Build an index from task dicts that have a floorplan position.
+
+        Args:
+            tasks: Task dicts as returned by get_all_tasks_in_project
+            cell_size (float): Width and height of a grid cell in sheet pixels
+
+        Returns:
+            SpatialIndex: Index keyed by task ID
+        """
+        index = cls(cell_size)
+        for task in tasks:
+            floorplan_id = task.get('floorplan_id')
+            pos_x = task.get('pos_x')
+            pos_y = task.get('pos_y')
+            if not floorplan_id or pos_x is None or pos_y is None:
+                continue
+            if pos_x == 0 and pos_y == 0:
+                continue  # Unpositioned
+            index.insert(task['id'], floorplan_id, pos_x, pos_y)
+        return index
+
+    def __len__(self):
+        return len(self._positions)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size))
+
+    def insert(self, key, floorplan_id, x: float, y: float):
+        """Add or move a position in the index."""
+        self.remove(key)
+        self._cells[floorplan_id][self._cell(x, y)][key] = (x, y)
+        self._positions[key] = (floorplan_id, x, y)
+
+    def remove(self, key):
+        """Remove a position from the index if present."""
+        existing = self._positions.pop(key, None)
+        if existing is None:
+            return
+        floorplan_id, x, y = existing
+        cell = self._cell(x, y)
+        bucket = self._cells[floorplan_id].get(cell)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._cells[floorplan_id][cell]
+
+    def neighbors(self, floorplan_id, x: float, y: float, radius: float, ignore: Iterable = ()) -> List[Tuple[object, float, float]]:
+        """Return positions on a floorplan within radius of a point.
+
+        Args:
+            floorplan_id: Floorplan to search
+            x (float): X coordinate of the search center
+            y (float): Y coordinate of the search center
+            radius (float): Search radius in sheet pixels
+            ignore: Keys to leave out of the result
+
+        Returns:
+            list: (key, x, y) tuples
+        """
+        cells = self._cells.get(floorplan_id)
+        if not cells:
+            return []
+        ignore = set(ignore)
+        min_cx, min_cy = self._cell(x - radius, y - radius)
+        max_cx, max_cy = self._cell(x + radius, y + radius)
+        radius_sq = radius * radius
+
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                for key, (px, py) in cells.get((cx, cy), {}).items():
+                    if key in ignore:
+                        continue
+                    if (px - x) ** 2 + (py - y) ** 2 <= radius_sq:
+                        found.append((key, px, py))
+        return found
+
+    def is_free(self, floorplan_id, x: float, y: float, radius: float, ignore: Iterable = ()) -> bool:
+        """Return True if no position lies within radius of the point."""
+        return not self.neighbors(floorplan_id, x, y, radius, ignore)
+
+    def get(self, key) -> Optional[Tuple[object, float, float]]:
+        """Return (floorplan_id, x, y) for a key, or None."""
+        return self._positions.get(key)
@@ -0,0 +1,101 @@
+"""Saving and loading sets of typed DataFrames as Parquet files."""
+
+import json
+import os
+from datetime import datetime
+import pandas as pd
+from utils.excel_reader import get_cache_format
+
+MANIFEST_NAME = 'manifest.json'
+TABLE_FORMAT = 'parquet'
+
+def require_parquet():
+    """Raise ValueError unless pyarrow or fastparquet is installed.
+
+    Tables are meant to be shared, so there is no pickle fallback: loading a
+    pickle runs code, and other tools cannot read it.
+    """
+    if get_cache_format() != 'parquet':
+        raise ValueError("Parquet support is required for data exports. Install it with: pip install pyarrow")
+
+def save_tables(tables, directory, metadata=None):
+    """Write each DataFrame to its own Parquet file, plus a manifest describing them.
+
+    Column types (strings, categories and their order, datetimes) are kept.
+    The index is not stored; callers rebuild it after loading.
+
+    Args:
+        tables (dict): Table name -> DataFrame
+        directory (str): Directory to write to, created if needed
+        metadata (dict, optional): JSON-serializable values stored in the manifest
+
+    Returns:
+        dict: The manifest that was written
+
+    Raises:
+        ValueError: If neither pyarrow nor fastparquet is installed
+    """
+    require_parquet()
+    os.makedirs(directory, exist_ok=True)
+
+    # Drop any previous manifest first, so an interrupted export is not loadable
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    manifest = {
+        'format': TABLE_FORMAT,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'metadata': metadata or {},
+        'tables': {}
+    }
+    for name, df in tables.items():
+        file_name = f"{name}.parquet"
+        path = os.path.join(directory, file_name)
+        temp_path = f"{path}.tmp"
+        df.reset_index(drop=True).to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+        manifest['tables'][name] = {'file': file_name, 'rows': len(df)}
+
+    # The manifest goes last, so a directory with a manifest is complete
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def load_tables(directory, names=None):
+    """Load tables written by save_tables.
+
+    Args:
+        directory (str): Directory containing the manifest
+        names (iterable, optional): Only load these tables; any not in the
+            manifest are left out of the result. Defaults to every table.
+
+    Returns:
+        tuple: (tables, metadata) where tables maps name -> DataFrame
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest
+        ValueError: If Parquet is not supported, the tables are not Parquet,
+            or a table file is missing or its row count does not match
+    """
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError(f"No {MANIFEST_NAME} found in {directory}")
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('format') != TABLE_FORMAT:
+        raise ValueError(f"{directory} was not saved as Parquet and will not be loaded; export it again")
+    require_parquet()
+
+    tables = {}
+    for name, entry in manifest['tables'].items():
+        if names is not None and name not in names:
+            continue
+        path = os.path.join(directory, entry['file'])
+        if not os.path.exists(path):
+            raise ValueError(f"Table '{name}' is missing from {directory}")
+        df = pd.read_parquet(path)
+        if len(df) != entry['rows']:
+            raise ValueError(f"Table '{name}' has {len(df)} rows, expected {entry['rows']}")
+        tables[name] = df
+    return tables, manifest.get('metadata', {})